@@ -7,6 +7,31 @@ echo "DEBUG: ${DEBUG:-False}"
 echo "DOMAIN: ${DOMAIN:-www.babelscrib.com}"
 echo "SITE_NAME: ${SITE_NAME:-www.babelscrib.com}"
 
+# Run a long-lived command in the background, restarting it whenever it fails; a clean exit (e.g. after SIGTERM) ends it
+supervise() {
+    (
+        while true; do
+            "$@" && break
+            echo "$* exited with status $?, restarting in 5s..."
+            sleep 5
+        done
+    ) &
+}
+
+# Run a command in the background every $1 seconds, one run at a time (an interval of 0 disables it)
+run_every() {
+    local interval=$1
+    shift
+    if [ "$interval" -gt 0 ] 2>/dev/null; then
+        (
+            while true; do
+                "$@" || echo "$* failed, next run in ${interval}s"
+                sleep "$interval"
+            done
+        ) &
+    fi
+}
+
 # Wait for database to be ready (if using external DB)
 echo "Checking database connection..."
 
@@ -29,5 +54,27 @@ else:
 
 
 
+# Start the background translation worker (set TRANSLATION_WORKER_ENABLED=False to run it elsewhere)
+if [ "${TRANSLATION_WORKER_ENABLED:-True}" = "True" ]; then
+    echo "Starting translation worker..."
+    supervise python manage.py run_translation_worker
+fi
+
+# Start the blob deleter that removes blobs queued for deletion (AZURE_ASYNC_DELETE_ENABLED)
+case "${AZURE_ASYNC_DELETE_ENABLED:-False}" in
+    [Tt]rue|1|[Yy]es|[Oo]n)
+        echo "Starting blob deleter..."
+        supervise python manage.py run_blob_deleter
+        ;;
+esac
+
+# Delete expired translations off the request path (AZURE_SWEEP_INTERVAL_SECONDS=0 disables)
+echo "Scheduling expired blob sweep..."
+run_every "${AZURE_SWEEP_INTERVAL_SECONDS:-300}" python manage.py sweep_expired_blobs
+
+# Reconcile the blob inventory with container listings so it stays authoritative (AZURE_INVENTORY_RECONCILE_INTERVAL_SECONDS=0 disables)
+echo "Scheduling blob inventory reconciliation..."
+run_every "${AZURE_INVENTORY_RECONCILE_INTERVAL_SECONDS:-21600}" python manage.py reconcile_blob_inventory
+
 echo "Starting Gunicorn server..."
 exec "$@"
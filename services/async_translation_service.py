@@ -0,0 +1,1098 @@
+"""
+Asynchronous Document Translation Service
+
+DocumentTranslationService makes every storage and Translator call on the
+calling thread, so a worker translating for many users spends most of its
+time blocked on round trips that do not depend on each other.
+AsyncDocumentTranslationService offers the same user-specific translation,
+cleanup and copy methods as coroutines on the azure .aio clients. Per-user
+preparation (expired file cleanup, clearing targets, listing sources, cache
+lookups) and finalization run as concurrent tasks, bounded by
+AZURE_ASYNC_MAX_CONCURRENCY storage calls in flight, and waiting on a
+translation operation no longer holds a thread, so one event loop can drive
+many jobs.
+
+The translation cache, blob inventory and deletion queue are database backed
+and are called through sync_to_async, as are on_submitted/on_progress
+callbacks that are not coroutine functions.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+from asgiref.sync import sync_to_async
+from azure.ai.translation.document.aio import DocumentTranslationClient
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceExistsError
+from azure.storage.blob.aio import BlobServiceClient
+
+from .blob_listing import AsyncBlobListingSnapshot
+from .blob_operations import CopyRequest, bulk_delete_blobs_async, copy_blobs_async
+from .clients import normalize_connection_string
+from .config import get_config
+from .polling import AdaptivePollingStrategy
+from .rate_limit import RateLimiter, STORAGE_BUCKET, TRANSLATOR_BUCKET, rate_limited_async
+from .translation_service import DocumentTranslationService
+
+
+class AsyncDocumentTranslationService:
+    """
+    DocumentTranslationService for asyncio, built on azure.ai.translation.document.aio and azure.storage.blob.aio.
+
+    The aio clients are bound to the event loop that first uses them: create one service per loop and
+    close it when done (`async with AsyncDocumentTranslationService(...) as service:`).
+    """
+
+    PROGRESS_INTERVAL_SECONDS = DocumentTranslationService.PROGRESS_INTERVAL_SECONDS
+    # The aio poller only polls while awaited, which this service never does; polling_strategy drives status calls
+    SDK_POLLING_INTERVAL_SECONDS = 3600
+    TERMINAL_STATUSES = DocumentTranslationService.TERMINAL_STATUSES
+
+    # Naming, URL and result helpers make no Azure or database calls and are shared with the synchronous service
+    _translated_blob_name = DocumentTranslationService._translated_blob_name
+    _build_user_inputs = DocumentTranslationService._build_user_inputs
+    _blob_url = DocumentTranslationService._blob_url
+    _cached_translation_result = DocumentTranslationService._cached_translation_result
+    _cache_state = DocumentTranslationService._cache_state
+    _operation_overdue = DocumentTranslationService._operation_overdue
+    _inline_cleanup_disabled_result = DocumentTranslationService._inline_cleanup_disabled_result
+    _no_source_files_result = DocumentTranslationService._no_source_files_result
+    _document_info = DocumentTranslationService._document_info
+    _restrict_to_user = DocumentTranslationService._restrict_to_user
+    _extract_filename_from_url = DocumentTranslationService._extract_filename_from_url
+    _is_user_document = DocumentTranslationService._is_user_document
+    _extract_container_name_from_uri = DocumentTranslationService._extract_container_name_from_uri
+
+    def __init__(
+        self,
+        key: str,
+        endpoint: str,
+        translation_cache: Optional[Any] = None,
+        polling_strategy: Optional[AdaptivePollingStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        blob_inventory: Optional[Any] = None,
+        deletion_queue: Optional[Any] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize the AsyncDocumentTranslationService.
+
+        Args:
+            key (str): Azure Cognitive Services API key
+            endpoint (str): Azure Cognitive Services endpoint URL
+            translation_cache (optional): Cache of translated documents, as for DocumentTranslationService
+            polling_strategy (AdaptivePollingStrategy, optional): Delays between operation status calls.
+                Defaults to the strategy configured in TranslationConfig.
+            rate_limiter (RateLimiter, optional): Limiter shared with the synchronous clients and other processes.
+                Defaults to the one configured in TranslationConfig.
+            blob_inventory (optional): Blob inventory to keep up to date and answer per-user blob lookups from
+            deletion_queue (optional): Queue to hand blob deletions to instead of deleting them inline
+            max_concurrency (int, optional): Storage calls in flight at once. Defaults to TranslationConfig.
+        """
+        if not key:
+            raise ValueError("Azure Cognitive Services API key is required")
+        if not endpoint:
+            raise ValueError("Azure Cognitive Services endpoint is required")
+
+        self.key = key
+        self.endpoint = endpoint
+        self.client = rate_limited_async(
+            DocumentTranslationClient(endpoint, AzureKeyCredential(key)), TRANSLATOR_BUCKET, rate_limiter
+        )
+        self.translation_cache = translation_cache
+        self.blob_inventory = blob_inventory
+        self.deletion_queue = deletion_queue
+        self.polling_strategy = polling_strategy or AdaptivePollingStrategy.from_config()
+        self.slots = asyncio.Semaphore(max(1, max_concurrency or get_config().async_max_concurrency))
+        self.logger = logging.getLogger(__name__)
+
+        connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+        if connection_string:
+            self.blob_service_client = rate_limited_async(
+                BlobServiceClient.from_connection_string(normalize_connection_string(connection_string)),
+                STORAGE_BUCKET, rate_limiter
+            )
+        else:
+            self.blob_service_client = None
+            self.logger.warning("Azure Storage connection string not found - target file cleanup will be skipped")
+
+    async def __aenter__(self) -> 'AsyncDocumentTranslationService':
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP sessions of the Translator and Storage clients."""
+        await self.client.close()
+        if self.blob_service_client:
+            await self.blob_service_client.close()
+
+    async def _bounded(self, awaitable: Awaitable[Any]) -> Any:
+        """Await one storage call while holding a concurrency slot. Never nest: the caller must not hold a slot."""
+        async with self.slots:
+            return await awaitable
+
+    async def _notify(self, callback: Optional[Callable[..., Any]], *args: Any):
+        """Call an on_submitted/on_progress/on_cached callback; plain functions run in a thread so they may use the database."""
+        if callback is None:
+            return
+        if asyncio.iscoroutinefunction(callback):
+            await callback(*args)
+        else:
+            await sync_to_async(callback)(*args)
+
+    async def translate_documents_user_specific(
+        self,
+        user_id_hash: str,
+        target_language: Union[str, List[str]],
+        source_language: Optional[str] = None,
+        clear_target: bool = True,
+        cleanup_source: bool = False,
+        on_submitted: Optional[Callable[[Any], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        content_hashes: Optional[Dict[str, str]] = None,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate documents for a specific user using default container URIs.
+
+        Same arguments and result as DocumentTranslationService.translate_documents_user_specific().
+        """
+        source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
+        target_uri = os.getenv('AZURE_TRANSLATION_TARGET_URI')
+
+        if not source_uri or not target_uri:
+            raise ValueError("AZURE_TRANSLATION_SOURCE_URI and AZURE_TRANSLATION_TARGET_URI must be set")
+
+        return await self.translate_documents_with_cleanup_for_user(
+            source_uri=source_uri,
+            target_uri=target_uri,
+            target_language=target_language,
+            user_id_hash=user_id_hash,
+            source_language=source_language,
+            clear_target=clear_target,
+            cleanup_source=cleanup_source,
+            on_submitted=on_submitted,
+            on_progress=on_progress,
+            content_hashes=content_hashes,
+            on_cached=on_cached
+        )
+
+    async def translate_documents_with_cleanup_for_user(
+        self,
+        source_uri: str,
+        target_uri: str,
+        target_language: Union[str, List[str]],
+        user_id_hash: str,
+        source_language: Optional[str] = None,
+        clear_target: bool = True,
+        cleanup_source: bool = False,
+        cleanup_old_target_hours: int = 24,
+        on_submitted: Optional[Callable[[Any], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        content_hashes: Optional[Dict[str, str]] = None,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Translate documents for a specific user with container-level access but user isolation.
+
+        Same arguments and result as DocumentTranslationService.translate_documents_with_cleanup_for_user().
+        """
+        self.logger.info(f"Starting user-specific translation for user hash: {user_id_hash}")
+        target_languages = [target_language] if isinstance(target_language, str) else list(target_language)
+
+        async def submitted(poller, submitted_users):
+            await self._notify(on_submitted, poller)
+
+        results = await self._translate_for_users(
+            source_uri,
+            target_uri,
+            [{
+                'user_id_hash': user_id_hash,
+                'target_languages': target_languages,
+                'source_language': source_language,
+                'clear_target': clear_target,
+                'cleanup_source': cleanup_source,
+                'content_hashes': content_hashes,
+            }],
+            on_submitted=submitted if on_submitted else None,
+            on_progress=on_progress,
+            cleanup_old_target_hours=cleanup_old_target_hours,
+            on_cached=on_cached
+        )
+        return results[user_id_hash]
+
+    async def translate_documents_for_users(
+        self,
+        user_requests: List[Dict[str, Any]],
+        on_submitted: Optional[Callable[[Any, List[str]], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        cleanup_old_target_hours: int = 24,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate documents for several users in a single Azure operation using default container URIs.
+
+        Same arguments and result as DocumentTranslationService.translate_documents_for_users(); the users
+        are prepared and finalized concurrently.
+        """
+        source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
+        target_uri = os.getenv('AZURE_TRANSLATION_TARGET_URI')
+
+        if not source_uri or not target_uri:
+            raise ValueError("AZURE_TRANSLATION_SOURCE_URI and AZURE_TRANSLATION_TARGET_URI must be set")
+
+        return await self._translate_for_users(
+            source_uri, target_uri, user_requests,
+            on_submitted=on_submitted,
+            on_progress=on_progress,
+            cleanup_old_target_hours=cleanup_old_target_hours,
+            on_cached=on_cached
+        )
+
+    async def _translate_for_users(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_requests: List[Dict[str, Any]],
+        on_submitted: Optional[Callable[[Any, List[str]], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        cleanup_old_target_hours: int = 24,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Async counterpart of DocumentTranslationService._translate_for_users()."""
+        results = {}
+        users = {}
+        inputs = []
+        target_paths = []
+        snapshot = AsyncBlobListingSnapshot(self.blob_service_client) if self.blob_service_client else None
+        target_container = self._extract_container_name_from_uri(target_uri)
+
+        # Users share nothing before submission, so their cleanups, listings and cache copies overlap
+        prepared = await asyncio.gather(*(
+            self._prepare_user_request(source_uri, target_uri, request, cleanup_old_target_hours, snapshot)
+            for request in user_requests
+        ))
+        for request, old_target_cleanup_result, source_blobs, cached in prepared:
+            user_id_hash = request['user_id_hash']
+            if not source_blobs:
+                results[user_id_hash] = self._no_source_files_result(user_id_hash, old_target_cleanup_result)
+                continue
+
+            cached_documents, languages_by_blob, content_hashes = cached
+            if snapshot and cached_documents:
+                snapshot.invalidate(target_container, f"{user_id_hash}/")
+            target_languages = list(request['target_languages'])
+            users[user_id_hash] = {
+                'request': request,
+                'old_target_cleanup': old_target_cleanup_result,
+                'cached_documents': cached_documents,
+                'content_hashes': content_hashes,
+                'submitted': bool(languages_by_blob),
+                'inputs': self._build_user_inputs(
+                    source_uri, target_uri, user_id_hash, languages_by_blob, request.get('source_language')
+                ),
+                'cache': {
+                    'hits': len(cached_documents),
+                    'misses': len(source_blobs) * len(target_languages) - len(cached_documents)
+                } if self.translation_cache else None
+            }
+            inputs.extend(users[user_id_hash]['inputs'])
+            target_paths.extend(
+                self._translated_blob_name(user_id_hash, blob_name, language)
+                for blob_name, languages in languages_by_blob.items() for language in languages
+            )
+
+        submitted_results = {}
+        if inputs:
+            if self.deletion_queue and self.blob_service_client:
+                # Blobs queued for deletion are still in storage, and the translator refuses to overwrite a target
+                await self._delete_blobs(target_container, target_paths, snapshot=snapshot, inline=True)
+            submitted_users = [user_id_hash for user_id_hash, user in users.items() if user['submitted']]
+            for user_id_hash in submitted_users:
+                if users[user_id_hash]['cache'] is not None:
+                    await self._notify(on_cached, user_id_hash, self._cache_state(users[user_id_hash]))
+            self.logger.info(f"Submitting {len(inputs)} document(s) for {len(submitted_users)} user(s) as one operation")
+            accepted = []
+
+            async def record_submission(poller, user_ids):
+                accepted.append(poller.id)
+                await self._notify(on_submitted, poller, user_ids)
+
+            errors = {}
+            try:
+                submitted_results = dict.fromkeys(
+                    submitted_users,
+                    await self._submit_translation(inputs, submitted_users, record_submission, on_progress)
+                )
+            except Exception as e:
+                self.logger.error(f"Translation operation failed: {str(e)}")
+                if accepted or len(submitted_users) == 1:
+                    errors = dict.fromkeys(submitted_users, e)
+                else:
+                    # Azure rejected the batch as a whole (e.g. over one user's input), so one user can't fail the rest
+                    self.logger.info(f"Resubmitting {len(submitted_users)} user(s) as separate operations")
+                    for user_id_hash in submitted_users:
+                        try:
+                            submitted_results[user_id_hash] = await self._submit_translation(
+                                users[user_id_hash]['inputs'], [user_id_hash], on_submitted, on_progress
+                            )
+                        except Exception as user_error:
+                            self.logger.error(f"Translation operation for user {user_id_hash} failed: {str(user_error)}")
+                            errors[user_id_hash] = user_error
+            for user_id_hash, error in errors.items():
+                results[user_id_hash] = {
+                    'status': 'Failed',
+                    'success': False,
+                    'error': f"Document translation failed: {str(error)}",
+                    'user_id_hash': user_id_hash,
+                    'old_target_cleanup': users[user_id_hash]['old_target_cleanup']
+                }
+            if snapshot:
+                for user_id_hash in submitted_users:
+                    snapshot.invalidate(target_container, f"{user_id_hash}/")
+
+        finishing = [
+            (user_id_hash, self._finish_user(
+                source_uri, target_uri, user_id_hash, user, submitted_results.get(user_id_hash), snapshot
+            ))
+            for user_id_hash, user in users.items() if user_id_hash not in results
+        ]
+        for user_id_hash, user_result in zip(
+            [user_id_hash for user_id_hash, _ in finishing],
+            await asyncio.gather(*(task for _, task in finishing))
+        ):
+            results[user_id_hash] = user_result
+
+        if snapshot:
+            self.logger.info(f"Blob listings for this request: {snapshot.list_calls}")
+        return results
+
+    async def _submit_translation(
+        self,
+        inputs: List[Any],
+        user_ids: List[str],
+        on_submitted: Optional[Callable[[Any, List[str]], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None
+    ) -> Dict[str, Any]:
+        """Submit the users' inputs as one Azure operation and wait for its result."""
+        poller = await self.client.begin_translation(inputs, polling_interval=self.SDK_POLLING_INTERVAL_SECONDS)
+        self.logger.info(f"Translation operation submitted: {poller.id} ({len(inputs)} input(s))")
+        await self._notify(on_submitted, poller, user_ids)
+        return await self._collect_translation_result(poller.id, on_progress=on_progress)
+
+    async def _prepare_user_request(
+        self,
+        source_uri: str,
+        target_uri: str,
+        request: Dict[str, Any],
+        cleanup_old_target_hours: int,
+        snapshot: Optional[AsyncBlobListingSnapshot]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any], List[str], Optional[Tuple[List[Dict[str, Any]], Dict[str, List[str]], Dict[str, str]]]]:
+        """Cleanup, source listing and cache copies for one user request, ahead of the shared submission."""
+        user_id_hash = request['user_id_hash']
+        old_target_cleanup_result, source_blobs = await self._prepare_user_translation(
+            source_uri, target_uri, user_id_hash, request.get('clear_target', True), cleanup_old_target_hours,
+            snapshot=snapshot
+        )
+        if not source_blobs:
+            return request, old_target_cleanup_result, source_blobs, None
+        cached = await self._apply_cached_translations(
+            source_uri, target_uri, user_id_hash, source_blobs, list(request['target_languages']),
+            request.get('source_language'), request.get('content_hashes')
+        )
+        return request, old_target_cleanup_result, source_blobs, cached
+
+    async def _finish_user(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        user: Dict[str, Any],
+        combined_result: Optional[Dict[str, Any]],
+        snapshot: Optional[AsyncBlobListingSnapshot]
+    ) -> Dict[str, Any]:
+        """Split one user's result out of the shared operation, clean up and cache their new translations."""
+        request = user['request']
+        if user['submitted']:
+            user_result = dict(combined_result, documents=combined_result['documents'] + user['cached_documents'])
+        else:
+            self.logger.info(f"All translations for user {user_id_hash} served from the translation cache")
+            user_result = self._cached_translation_result(user['cached_documents'])
+        user_result['target_languages'] = list(request['target_languages'])
+        user_result = await self._finalize_user_translation(
+            user_result, source_uri, user_id_hash, request.get('cleanup_source', False), snapshot=snapshot
+        )
+        # Counts describe this user's documents, not the whole shared operation
+        user_result['total_documents'] = len(user_result['documents'])
+        user_result['succeeded_documents'] = sum(1 for doc in user_result['documents'] if doc.get('status') == 'Succeeded')
+        user_result['failed_documents'] = user_result['total_documents'] - user_result['succeeded_documents']
+        user_result['old_target_cleanup'] = user['old_target_cleanup']
+        if user['cache'] is not None:
+            user_result['cache'] = user['cache']
+            if user['submitted']:
+                await self._cache_new_translations(
+                    source_uri, target_uri, user_id_hash, user_result['documents'],
+                    user['content_hashes'], request.get('source_language')
+                )
+        return user_result
+
+    async def _prepare_user_translation(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        clear_target: bool,
+        cleanup_old_target_hours: int,
+        snapshot: Optional[AsyncBlobListingSnapshot] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Run the per-user target cleanup that precedes a submission and list the blobs to translate."""
+        if get_config().inline_expiry_cleanup:
+            old_target_cleanup_result = await self.cleanup_old_target_files_for_user(
+                target_uri, user_id_hash, cleanup_old_target_hours, snapshot=snapshot
+            )
+        else:
+            old_target_cleanup_result = self._inline_cleanup_disabled_result()
+
+        if clear_target:
+            self.logger.info(f"Clearing target files for user: {user_id_hash}")
+            await self._clear_user_target_files(target_uri, user_id_hash, snapshot=snapshot)
+
+        return old_target_cleanup_result, await self._list_user_source_blobs(source_uri, user_id_hash, snapshot=snapshot)
+
+    async def _finalize_user_translation(
+        self,
+        result: Dict[str, Any],
+        source_uri: str,
+        user_id_hash: str,
+        cleanup_source: bool = False,
+        snapshot: Optional[AsyncBlobListingSnapshot] = None
+    ) -> Dict[str, Any]:
+        """Restrict a finished translation result to the user's documents and clean up their source files."""
+        self._restrict_to_user(result, user_id_hash)
+        result['user_id_hash'] = user_id_hash
+        result['cleanup_source_requested'] = cleanup_source
+
+        if cleanup_source and result.get('status') == 'Succeeded':
+            self.logger.info(f"Cleaning up source files for user: {user_id_hash}")
+            result['source_cleanup'] = await self.cleanup_source_files_for_user(source_uri, user_id_hash, snapshot=snapshot)
+        else:
+            result['source_cleanup'] = {'cleanup_attempted': False, 'reason': 'Translation not successful or cleanup not requested'}
+
+        return result
+
+    async def _apply_cached_translations(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        source_blobs: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        known_hashes: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], Dict[str, str]]:
+        """Copy translations already in the cache into the user's target prefix, all copies at once."""
+        languages_by_blob = {blob_name: list(target_languages) for blob_name in source_blobs}
+        if not self.translation_cache or not self.blob_service_client:
+            return [], languages_by_blob, {}
+
+        content_hashes = await self._source_content_hashes(source_uri, source_blobs, known_hashes or {})
+        target_container = self._extract_container_name_from_uri(target_uri)
+        cache_container = self.translation_cache.container_name
+        lookup = sync_to_async(self.translation_cache.lookup)
+
+        hits = []
+        for blob_name in source_blobs:
+            content_hash = content_hashes.get(blob_name)
+            if not content_hash:
+                continue
+            for language in target_languages:
+                cache_blob_name = await lookup(content_hash, source_language, language)
+                if cache_blob_name:
+                    hits.append((blob_name, content_hash, language, CopyRequest(
+                        cache_container, cache_blob_name, target_container,
+                        self._translated_blob_name(user_id_hash, blob_name, language)
+                    )))
+        if not hits:
+            return [], languages_by_blob, content_hashes
+
+        result = await self._bounded(copy_blobs_async(self.blob_service_client, [hit[3] for hit in hits], timeout=30))
+        copied = {id(copy) for copy in result['copied']}
+
+        cached_documents = []
+        for blob_name, content_hash, language, copy in hits:
+            if id(copy) not in copied:
+                # The cached blob is gone; forget the entry and translate normally
+                await sync_to_async(self.translation_cache.invalidate)(content_hash, source_language, language)
+                continue
+            await self._record_blob(copy.target_container, copy.target_blob)
+            await sync_to_async(self.translation_cache.record_hit)(content_hash, source_language, language)
+            self.logger.info(f"Translation cache hit for {blob_name} ({language})")
+            languages_by_blob[blob_name].remove(language)
+            cached_documents.append({
+                'id': f"cache-{content_hash[:16]}-{language}",
+                'status': 'Succeeded',
+                'source_filename': blob_name.split('/')[-1],
+                'translated_filename': copy.target_blob.split('/')[-1],
+                'source_document_url': self._blob_url(source_uri, blob_name).split('?')[0],
+                'translated_document_url': self._blob_url(target_uri, copy.target_blob).split('?')[0],
+                'translated_to': language,
+                'translation_progress': 1.0,
+                'characters_charged': 0,
+                'cached': True,
+                'error': None
+            })
+
+        return cached_documents, {blob: langs for blob, langs in languages_by_blob.items() if langs}, content_hashes
+
+    async def _cache_new_translations(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        documents: List[Dict[str, Any]],
+        content_hashes: Dict[str, str],
+        source_language: Optional[str] = None
+    ):
+        """Copy freshly translated documents into the cache container and record them in the cache."""
+        blob_by_url = {
+            urllib.parse.unquote(self._blob_url(source_uri, blob_name).split('?')[0]): blob_name
+            for blob_name in content_hashes
+        }
+        target_container = self._extract_container_name_from_uri(target_uri)
+        cache_container = self.translation_cache.container_name
+
+        entries = []
+        for doc in documents:
+            if doc.get('cached') or doc.get('status') != 'Succeeded' or not doc.get('translated_to'):
+                continue
+            blob_name = blob_by_url.get(urllib.parse.unquote((doc.get('source_document_url') or '').split('?')[0]))
+            if not blob_name:
+                continue
+            language = doc['translated_to']
+            content_hash = content_hashes[blob_name]
+            cache_blob_name = f"{content_hash}/{source_language or 'auto'}/{language}/{blob_name.split('/')[-1]}"
+            entries.append((blob_name, content_hash, language, CopyRequest(
+                target_container, self._translated_blob_name(user_id_hash, blob_name, language),
+                cache_container, cache_blob_name
+            )))
+        if not entries or not await self._create_container_if_not_exists(cache_container):
+            return
+
+        result = await self._bounded(copy_blobs_async(self.blob_service_client, [entry[3] for entry in entries], timeout=30))
+        copied = {id(copy) for copy in result['copied']}
+
+        async def store(blob_name, content_hash, language, copy):
+            try:
+                await self._record_blob(copy.target_container, copy.target_blob)
+                properties = await self._bounded(
+                    self.blob_service_client.get_blob_client(cache_container, copy.target_blob).get_blob_properties()
+                )
+                await sync_to_async(self.translation_cache.store)(
+                    content_hash, source_language, language, copy.target_blob, properties.size
+                )
+                self.logger.info(f"Cached translation of {blob_name} ({language}) as {copy.target_blob}")
+            except Exception as e:
+                self.logger.warning(f"Failed to cache translation of {blob_name} ({language}): {str(e)}")
+
+        await asyncio.gather(*(store(*entry) for entry in entries if id(entry[3]) in copied))
+
+    async def _source_content_hashes(self, source_uri: str, source_blobs: List[str], known_hashes: Dict[str, str]) -> Dict[str, str]:
+        """SHA-256 of each source blob, downloading the blobs without a known hash concurrently."""
+        content_hashes = {blob_name: known_hashes[blob_name] for blob_name in source_blobs if known_hashes.get(blob_name)}
+        missing = [blob_name for blob_name in source_blobs if blob_name not in content_hashes]
+        if not missing or not self.blob_service_client:
+            return content_hashes
+
+        container_client = self.blob_service_client.get_container_client(self._extract_container_name_from_uri(source_uri))
+
+        async def digest(blob_name):
+            hasher = hashlib.sha256()
+            downloader = await container_client.download_blob(blob_name)
+            async for chunk in downloader.chunks():
+                hasher.update(chunk)
+            return hasher.hexdigest()
+
+        hashes = await asyncio.gather(*(self._bounded(digest(blob_name)) for blob_name in missing), return_exceptions=True)
+        for blob_name, content_hash in zip(missing, hashes):
+            if isinstance(content_hash, Exception):
+                self.logger.warning(f"Could not hash source blob {blob_name}: {str(content_hash)}")
+            else:
+                content_hashes[blob_name] = content_hash
+        return content_hashes
+
+    async def _wait_for_operation(
+        self,
+        operation_id: str,
+        on_progress: Optional[Callable[[Any], Any]] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """Async counterpart of DocumentTranslationService._wait_for_operation(); sleeps without holding a thread."""
+        started = time.monotonic()
+        last_progress = started
+        last_counts = None
+        status_calls = 0
+        max_operation_seconds = get_config().max_operation_seconds
+
+        for delay in self.polling_strategy.intervals():
+            await asyncio.sleep(delay)
+            status = await self.client.get_translation_status(operation_id)
+            status_calls += 1
+            if status.status in self.TERMINAL_STATUSES:
+                break
+
+            if self._operation_overdue(status, max_operation_seconds):
+                try:
+                    await self.client.cancel_translation(operation_id)
+                except Exception as e:
+                    self.logger.warning(f"Could not cancel overdue operation {operation_id}: {str(e)}")
+                raise Exception(f"Translation operation {operation_id} did not finish within {max_operation_seconds:g} seconds")
+
+            counts = (
+                status.status,
+                status.documents_succeeded_count,
+                status.documents_failed_count,
+                status.documents_in_progress_count,
+            )
+            if on_progress and (counts != last_counts or time.monotonic() - last_progress >= self.PROGRESS_INTERVAL_SECONDS):
+                await self._notify(on_progress, status)
+                last_progress = time.monotonic()
+                last_counts = counts
+
+        detection_lag = None
+        if status.last_updated_on:
+            detection_lag = max(0.0, (datetime.now(timezone.utc) - status.last_updated_on).total_seconds())
+
+        metrics = {
+            'status_calls': status_calls,
+            'wait_seconds': round(time.monotonic() - started, 3),
+            'detection_lag_seconds': round(detection_lag, 3) if detection_lag is not None else None,
+        }
+        self.logger.info(
+            f"Operation {operation_id} reached {status.status} after {status_calls} status call(s), "
+            f"detection lag {metrics['detection_lag_seconds']}s"
+        )
+        return status, metrics
+
+    async def _collect_translation_result(self, operation_id: str, on_progress: Optional[Callable[[Any], Any]] = None) -> Dict[str, Any]:
+        """Wait for a submitted (or resumed) translation operation and build the result dictionary."""
+        details, polling_metrics = await self._wait_for_operation(operation_id, on_progress=on_progress)
+        if details.status != 'Succeeded':
+            error_message = details.error.message if details.error else 'no error details'
+            raise Exception(f"Translation operation {details.status}: {error_message}")
+
+        documents = [self._document_info(document) async for document in self.client.list_document_statuses(operation_id)]
+        succeeded_count = sum(1 for doc in documents if doc['status'] == 'Succeeded')
+
+        if self.blob_inventory:
+            for doc in documents:
+                if doc['translated_document_url']:
+                    # Translator output: https://account/<container>/<blob>; the size is filled in by reconciliation
+                    container_name, _, blob_name = urllib.parse.unquote(
+                        urllib.parse.urlparse(doc['translated_document_url']).path
+                    ).strip('/').partition('/')
+                    await self._record_blob(container_name, blob_name, last_modified=doc['last_updated_on'])
+
+        total_docs = getattr(details, 'documents_total_count', None)
+        failed_docs = getattr(details, 'documents_failed_count', None)
+        succeeded_docs = getattr(details, 'documents_succeeded_count', None)
+        response = {
+            'operation_id': operation_id,
+            'status': details.status,
+            'created_on': details.created_on,
+            'last_updated_on': details.last_updated_on,
+            'total_documents': total_docs if total_docs is not None else len(documents),
+            'failed_documents': failed_docs if failed_docs is not None else len(documents) - succeeded_count,
+            'succeeded_documents': succeeded_docs if succeeded_docs is not None else succeeded_count,
+            'polling': polling_metrics,
+            'documents': documents
+        }
+        self.logger.info(
+            f"Translation completed. Status: {response['status']}. Total: {response['total_documents']}, "
+            f"Succeeded: {response['succeeded_documents']}, Failed: {response['failed_documents']}"
+        )
+        return response
+
+    async def resume_translation(self, continuation_token: str, on_progress: Optional[Callable[[Any], Any]] = None) -> Dict[str, Any]:
+        """Resume waiting on a translation operation started earlier, possibly by another process."""
+        try:
+            self.logger.info(f"Resuming translation operation from continuation token: {continuation_token}")
+            # The Document Translation continuation token is the operation ID, so poll it directly
+            return await self._collect_translation_result(continuation_token, on_progress=on_progress)
+        except Exception as e:
+            self.logger.error(f"Failed to resume translation operation: {str(e)}")
+            raise Exception(f"Document translation failed: {str(e)}")
+
+    async def resume_translation_for_user(
+        self,
+        continuation_token: str,
+        user_id_hash: str,
+        cleanup_source: bool = False,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        cache_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Resume a user-specific translation that was submitted before a worker restart."""
+        source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
+        target_uri = os.getenv('AZURE_TRANSLATION_TARGET_URI')
+        if not source_uri:
+            raise ValueError("AZURE_TRANSLATION_SOURCE_URI must be set")
+        cache_state = cache_state or {}
+
+        try:
+            result = await self.resume_translation(continuation_token, on_progress=on_progress)
+            result['documents'] = result['documents'] + cache_state.get('cached_documents', [])
+            result = await self._finalize_user_translation(result, source_uri, user_id_hash, cleanup_source)
+            result['total_documents'] = len(result['documents'])
+            result['succeeded_documents'] = sum(1 for doc in result['documents'] if doc.get('status') == 'Succeeded')
+            result['failed_documents'] = result['total_documents'] - result['succeeded_documents']
+            if self.translation_cache and cache_state.get('cache') is not None:
+                result['cache'] = cache_state['cache']
+                if target_uri and cache_state.get('content_hashes'):
+                    await self._cache_new_translations(
+                        source_uri, target_uri, user_id_hash, result['documents'],
+                        cache_state['content_hashes'], cache_state.get('source_language')
+                    )
+            return result
+        except Exception as e:
+            self.logger.error(f"Resumed translation failed for user {user_id_hash}: {str(e)}")
+            return {
+                'status': 'Failed',
+                'success': False,
+                'error': str(e),
+                'user_id_hash': user_id_hash
+            }
+
+    async def get_translation_status(self, operation_id: str) -> Dict[str, Any]:
+        """Get the status of a specific translation operation."""
+        try:
+            details = await self.client.get_translation_status(operation_id)
+
+            return {
+                'operation_id': details.id,
+                'status': details.status,
+                'created_on': details.created_on,
+                'last_updated_on': details.last_updated_on,
+                'total_documents': details.documents_total_count,
+                'succeeded_documents': details.documents_succeeded_count,
+                'failed_documents': details.documents_failed_count,
+                'in_progress_documents': details.documents_in_progress_count,
+                'not_yet_started_documents': details.documents_not_started_count,
+                'canceled_documents': details.documents_canceled_count,
+                'total_characters_charged': details.total_characters_charged,
+                'error': {
+                    'code': details.error.code,
+                    'message': details.error.message
+                } if details.error else None
+            }
+        except Exception as e:
+            self.logger.error(f"Failed to get translation status: {str(e)}")
+            raise Exception(f"Failed to get translation status: {str(e)}")
+
+    async def _list_user_source_blobs(self, source_uri: str, user_id_hash: str,
+                                      snapshot: Optional[AsyncBlobListingSnapshot] = None) -> List[str]:
+        """List the names of the user's blobs in the source container."""
+        if not self.blob_service_client:
+            return []
+
+        try:
+            container_name = self._extract_container_name_from_uri(source_uri)
+            if not container_name:
+                return []
+
+            blob_names = await self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
+
+            if blob_names:
+                self.logger.info(f"Found {len(blob_names)} source file(s) for user {user_id_hash}")
+            else:
+                self.logger.info(f"No source files found for user {user_id_hash}")
+            return blob_names
+
+        except Exception as e:
+            self.logger.error(f"Error listing user source files: {str(e)}")
+            return []
+
+    async def _clear_user_target_files(self, target_uri: str, user_id_hash: str,
+                                       snapshot: Optional[AsyncBlobListingSnapshot] = None) -> Dict[str, Any]:
+        """Clear target files for a specific user."""
+        if not self.blob_service_client:
+            return {'cleanup_attempted': False, 'error': 'No blob service client'}
+
+        try:
+            container_name = self._extract_container_name_from_uri(target_uri)
+            if not container_name:
+                return {'cleanup_attempted': False, 'error': 'Could not extract container name'}
+
+            blob_names = await self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
+            result = await self._delete_blobs(container_name, blob_names, snapshot=snapshot)
+
+            return {
+                'cleanup_attempted': True,
+                'deleted_count': len(result['deleted']),
+                'user_id_hash': user_id_hash
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error clearing user target files: {str(e)}")
+            return {'cleanup_attempted': False, 'error': str(e)}
+
+    async def cleanup_source_files_for_user(self, source_uri: str, user_id_hash: str,
+                                            snapshot: Optional[AsyncBlobListingSnapshot] = None) -> Dict[str, Any]:
+        """Clean up source files for a specific user."""
+        if not self.blob_service_client:
+            return {'cleanup_attempted': False, 'error': 'No blob service client'}
+
+        try:
+            container_name = self._extract_container_name_from_uri(source_uri)
+            if not container_name:
+                return {'cleanup_attempted': False, 'error': 'Could not extract container name'}
+
+            blob_names = await self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
+            result = await self._delete_blobs(container_name, blob_names, snapshot=snapshot)
+
+            return {
+                'cleanup_attempted': True,
+                'cleaned_files': len(result['deleted']),
+                'failed_cleanups': len(result['failed']),
+                'user_id_hash': user_id_hash
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error cleaning up user source files: {str(e)}")
+            return {'cleanup_attempted': False, 'error': str(e)}
+
+    async def cleanup_old_target_files_for_user(self, target_uri: str, user_id_hash: str, hours_threshold: int = 72,
+                                                snapshot: Optional[AsyncBlobListingSnapshot] = None) -> Dict[str, Any]:
+        """Clean up old target files for a specific user."""
+        if not self.blob_service_client:
+            return {'cleanup_attempted': False, 'error': 'No blob service client'}
+
+        try:
+            container_name = self._extract_container_name_from_uri(target_uri)
+            if not container_name:
+                return {'cleanup_attempted': False, 'error': 'Could not extract container name'}
+
+            cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_threshold)
+            old_files = await self._user_blob_names(container_name, user_id_hash, modified_before=cutoff_time, snapshot=snapshot)
+            result = await self._delete_blobs(container_name, old_files, snapshot=snapshot)
+
+            return {
+                'cleanup_attempted': True,
+                'old_files_found': len(old_files),
+                'cleaned_files': len(result['deleted']) + len(result['missing']),
+                'failed_cleanups': len(result['failed']),
+                'hours_threshold': hours_threshold,
+                'user_id_hash': user_id_hash
+            }
+
+        except Exception as e:
+            self.logger.error(f"Error cleaning up old target files for user: {str(e)}")
+            return {'cleanup_attempted': False, 'error': str(e)}
+
+    async def cleanup_target_files(self, target_uri: str, filenames: List[str]) -> Dict[str, Any]:
+        """Delete translated files from the target container; same result as DocumentTranslationService.cleanup_target_files()."""
+        if not filenames:
+            return {
+                'cleanup_attempted': False,
+                'reason': 'No filenames provided',
+                'cleaned_files': 0,
+                'failed_cleanups': 0,
+                'results': []
+            }
+
+        container_name = self._extract_container_name_from_uri(target_uri)
+        if not self.blob_service_client or not container_name:
+            reason = 'Blob service client not available' if not self.blob_service_client else f'Invalid target URI format: {target_uri}'
+            results = [{'success': False, 'reason': reason, 'filename': filename} for filename in dict.fromkeys(filenames)]
+        else:
+            deletion = await self._delete_blobs(container_name, filenames)
+            failures = {failure['name']: failure['error'] for failure in deletion['failed']}
+            missing = set(deletion['missing'])
+            results = []
+            for filename in dict.fromkeys(filenames):
+                if filename in failures:
+                    results.append({
+                        'success': False,
+                        'reason': f"Failed to delete target file {filename}: {failures[filename]}",
+                        'filename': filename
+                    })
+                elif filename in missing:
+                    results.append({
+                        'success': True,
+                        'reason': 'File already deleted or does not exist',
+                        'filename': filename,
+                        'container_name': container_name
+                    })
+                else:
+                    results.append({'success': True, 'filename': filename, 'container_name': container_name})
+
+        cleaned_files = sum(1 for result in results if result['success'])
+        failed_cleanups = len(results) - cleaned_files
+        self.logger.info(f"Target cleanup completed: {cleaned_files} files deleted, {failed_cleanups} failures")
+        return {
+            'cleanup_attempted': True,
+            'cleaned_files': cleaned_files,
+            'failed_cleanups': failed_cleanups,
+            'results': results
+        }
+
+    async def _create_container_if_not_exists(self, container_name: str) -> bool:
+        """Create a container if it doesn't exist."""
+        try:
+            await self._bounded(self.blob_service_client.get_container_client(container_name).create_container())
+            self.logger.info(f"Created container: {container_name}")
+            return True
+        except ResourceExistsError:
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to create container {container_name}: {str(e)}")
+            return False
+
+    async def _copy_blob(self, source_container: str, source_blob: str, target_container: str, target_blob: str) -> bool:
+        """Server-side copy of a blob within the storage account. Returns True once the copy has succeeded."""
+        if not self.blob_service_client:
+            return False
+
+        result = await self._bounded(copy_blobs_async(
+            self.blob_service_client,
+            [CopyRequest(source_container, source_blob, target_container, target_blob)],
+            timeout=30
+        ))
+        if result['copied']:
+            await self._record_blob(target_container, target_blob)
+        return bool(result['copied'])
+
+    async def _copy_user_files_to_temp_container(self, source_container: str, temp_container: str, user_id_hash: str,
+                                                 snapshot: Optional[AsyncBlobListingSnapshot] = None) -> int:
+        """Copy user's files from main container to temporary container, without the user prefix."""
+        try:
+            snapshot = snapshot or AsyncBlobListingSnapshot(self.blob_service_client)
+            user_blobs = await self._bounded(snapshot.blobs(source_container, f"{user_id_hash}/"))
+            live_names = set(await self._without_buried(source_container, [blob.name for blob in user_blobs]))
+            copies = [
+                CopyRequest(source_container, blob.name, temp_container, blob.name.replace(f"{user_id_hash}/", ""), blob.size)
+                for blob in user_blobs if blob.name in live_names
+            ]
+
+            # Returns once every copy has landed, so translation never starts on a half-copied container
+            result = await self._bounded(copy_blobs_async(self.blob_service_client, copies))
+            for copy in result['copied']:
+                self.logger.info(f"Copied {copy.source_blob} -> {copy.target_blob}")
+
+            return len(result['copied'])
+
+        except Exception as e:
+            self.logger.error(f"Error copying user files to temp container: {str(e)}")
+            return 0
+
+    async def _move_translated_files_to_user_path(self, temp_container: str, target_container: str, user_id_hash: str) -> int:
+        """Copy translated files from a temp container to the main target container under the user prefix."""
+        try:
+            temp_client = self.blob_service_client.get_container_client(temp_container)
+            copies = [
+                CopyRequest(temp_container, blob.name, target_container, f"{user_id_hash}/{blob.name}", blob.size)
+                async for blob in temp_client.list_blobs()
+            ]
+
+            # Returns once every copy has landed, so the temp containers can be deleted safely afterwards
+            result = await self._bounded(copy_blobs_async(self.blob_service_client, copies))
+            for copy in result['copied']:
+                await self._record_blob(copy.target_container, copy.target_blob, size=copy.size)
+                self.logger.info(f"Moved {copy.source_blob} -> {copy.target_blob}")
+
+            return len(result['copied'])
+
+        except Exception as e:
+            self.logger.error(f"Error moving translated files: {str(e)}")
+            return 0
+
+    async def _delete_blobs(self, container_name: str, blob_names: List[str],
+                            snapshot: Optional[AsyncBlobListingSnapshot] = None, inline: bool = False) -> Dict[str, List[Any]]:
+        """Bulk-delete blobs (or queue them for deletion unless `inline`) and drop them from the blob inventory and listing snapshot."""
+        if self.deletion_queue and not inline:
+            buried = await sync_to_async(self.deletion_queue.bury)(
+                container_name, blob_names, last_modified=snapshot.last_modified(container_name, blob_names) if snapshot else None
+            )
+            if snapshot:
+                snapshot.discard(container_name, buried)
+            return {'deleted': buried, 'missing': [], 'modified': [], 'failed': []}
+        container_client = self.blob_service_client.get_container_client(container_name)
+        result = await self._bounded(bulk_delete_blobs_async(container_client, blob_names))
+        if snapshot:
+            snapshot.discard(container_name, result['deleted'] + result['missing'])
+        if self.deletion_queue:
+            try:
+                await sync_to_async(self.deletion_queue.cancel)(container_name, result['deleted'] + result['missing'])
+            except Exception as e:
+                self.logger.warning(f"Could not drop queued deletions in {container_name}: {str(e)}")
+        if self.blob_inventory:
+            try:
+                await sync_to_async(self.blob_inventory.forget)(container_name, result['deleted'] + result['missing'])
+            except Exception as e:
+                self.logger.warning(f"Could not update blob inventory of {container_name}: {str(e)}")
+        return result
+
+    async def _record_blob(self, container_name: str, blob_name: str, size: Optional[int] = None,
+                           last_modified: Optional[datetime] = None):
+        """Add a blob this service wrote to the blob inventory and drop any queued deletion of its name."""
+        if self.deletion_queue:
+            try:
+                await sync_to_async(self.deletion_queue.cancel)(container_name, [blob_name])
+            except Exception as e:
+                self.logger.warning(f"Could not cancel queued deletion of {container_name}/{blob_name}: {str(e)}")
+        if self.blob_inventory:
+            try:
+                await sync_to_async(self.blob_inventory.record)(container_name, blob_name, size=size, last_modified=last_modified)
+            except Exception as e:
+                self.logger.warning(f"Could not record {container_name}/{blob_name} in blob inventory: {str(e)}")
+
+    async def _user_blob_names(self, container_name: str, user_id_hash: str, modified_before: Optional[datetime] = None,
+                               snapshot: Optional[AsyncBlobListingSnapshot] = None) -> List[str]:
+        """A user's blob names, from the blob inventory when it can answer, else from a listing of their prefix."""
+        blob_names = None
+        if self.blob_inventory and await sync_to_async(self.blob_inventory.is_authoritative)(container_name):
+            blob_names = await sync_to_async(self.blob_inventory.names)(container_name, user_id_hash, modified_before)
+        if blob_names is None:
+            snapshot = snapshot or AsyncBlobListingSnapshot(self.blob_service_client)
+            blob_names = await self._bounded(snapshot.names(container_name, f"{user_id_hash}/", modified_before))
+        return await self._without_buried(container_name, blob_names)
+
+    async def _without_buried(self, container_name: str, blob_names: List[str]) -> List[str]:
+        """Leave out blobs queued for deletion; they may still be in storage but are deleted for the app."""
+        if not self.deletion_queue or not blob_names:
+            return blob_names
+        buried = await sync_to_async(self.deletion_queue.buried)(container_name, blob_names)
+        return [blob_name for blob_name in blob_names if blob_name not in buried]
+
+
+def create_async_translation_service(
+    key: Optional[str] = None,
+    endpoint: Optional[str] = None,
+    translation_cache: Optional[Any] = None,
+    blob_inventory: Optional[Any] = None,
+    deletion_queue: Optional[Any] = None
+) -> AsyncDocumentTranslationService:
+    """
+    Factory function to create an AsyncDocumentTranslationService instance; call it inside the event loop
+    that will use the service.
+
+    Args:
+        key (str, optional): Azure Cognitive Services API key. If not provided, will use config.
+        endpoint (str, optional): Azure Cognitive Services endpoint URL. If not provided, will use config.
+        translation_cache (optional): Translated document cache to consult before submitting to Azure.
+        blob_inventory (optional): Blob inventory to keep up to date and answer per-user blob lookups from.
+        deletion_queue (optional): Queue to hand blob deletions to instead of deleting them inline.
+
+    Returns:
+        AsyncDocumentTranslationService: Configured translation service instance
+    """
+    config = get_config()
+    return AsyncDocumentTranslationService(
+        key or config.key, endpoint or config.endpoint, translation_cache=translation_cache,
+        blob_inventory=blob_inventory, deletion_queue=deletion_queue
+    )
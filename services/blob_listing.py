@@ -0,0 +1,98 @@
+"""
+Request-scoped snapshot of blob listings.
+
+One translation request looks at the same user prefixes several times: expired
+target files, target files to clear, source files to translate and, after the
+operation, source files to clean up. Listing the prefix for each of these costs
+a paged list_blobs() call every time. BlobListingSnapshot lists each
+(container, prefix) once and answers the later questions from that listing.
+Deletions are applied to the snapshot as they happen; any other write to a
+listed prefix must call invalidate() so the next read lists it again.
+AsyncBlobListingSnapshot does the same over an azure.storage.blob.aio client.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BlobListingSnapshot:
+    """
+    Listings of container prefixes, each fetched at most once until invalidated.
+
+    Not thread-safe; create one per request and pass it along.
+
+    Args:
+        blob_service_client: BlobServiceClient used to list containers
+    """
+
+    def __init__(self, blob_service_client: Any):
+        self.blob_service_client = blob_service_client
+        self.list_calls = 0
+        self._listings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def blobs(self, container: str, prefix: str) -> List[Any]:
+        """BlobProperties of the blobs under a prefix, listing it on first use."""
+        key = (container, prefix)
+        if key not in self._listings:
+            container_client = self.blob_service_client.get_container_client(container)
+            self._listings[key] = {blob.name: blob for blob in container_client.list_blobs(name_starts_with=prefix)}
+            self.list_calls += 1
+            logger.debug(f"Listed {len(self._listings[key])} blobs under {container}/{prefix}")
+        return list(self._listings[key].values())
+
+    def names(self, container: str, prefix: str, modified_before: Optional[datetime] = None) -> List[str]:
+        """Names of the blobs under a prefix, optionally only those last modified before a time."""
+        return [
+            blob.name for blob in self.blobs(container, prefix)
+            if modified_before is None or (blob.last_modified and blob.last_modified < modified_before)
+        ]
+
+    def last_modified(self, container: str, names: Iterable[str]) -> Dict[str, datetime]:
+        """Last-Modified times storage reported for those of the names this snapshot has listed."""
+        names = set(names)
+        found = {}
+        for (listed_container, _), listing in self._listings.items():
+            if listed_container == container:
+                for name in names.intersection(listing):
+                    if listing[name].last_modified:
+                        found[name] = listing[name].last_modified
+        return found
+
+    def discard(self, container: str, names: Iterable[str]):
+        """Drop blobs that were deleted from every listing of the container."""
+        names = set(names)
+        for (listed_container, _), listing in self._listings.items():
+            if listed_container == container:
+                for name in names:
+                    listing.pop(name, None)
+
+    def invalidate(self, container: str, prefix: str = ''):
+        """Forget listings a write under `prefix` (or anywhere in the container) may have changed."""
+        for key in list(self._listings):
+            listed_container, listed_prefix = key
+            if listed_container == container and (listed_prefix.startswith(prefix) or prefix.startswith(listed_prefix)):
+                del self._listings[key]
+
+
+class AsyncBlobListingSnapshot(BlobListingSnapshot):
+    """BlobListingSnapshot over an azure.storage.blob.aio client: blobs() and names() are coroutines."""
+
+    async def blobs(self, container: str, prefix: str) -> List[Any]:
+        """BlobProperties of the blobs under a prefix, listing it on first use."""
+        key = (container, prefix)
+        if key not in self._listings:
+            container_client = self.blob_service_client.get_container_client(container)
+            self._listings[key] = {blob.name: blob async for blob in container_client.list_blobs(name_starts_with=prefix)}
+            self.list_calls += 1
+            logger.debug(f"Listed {len(self._listings[key])} blobs under {container}/{prefix}")
+        return list(self._listings[key].values())
+
+    async def names(self, container: str, prefix: str, modified_before: Optional[datetime] = None) -> List[str]:
+        """Names of the blobs under a prefix, optionally only those last modified before a time."""
+        return [
+            blob.name for blob in await self.blobs(container, prefix)
+            if modified_before is None or (blob.last_modified and blob.last_modified < modified_before)
+        ]
@@ -0,0 +1,397 @@
+"""
+Bulk blob operations shared by the translation service and the views.
+
+Deleting blobs one delete_blob() call at a time costs a round trip per file.
+bulk_delete_blobs() packs up to 256 deletions into each Blob Batch request
+(ContainerClient.delete_blobs) and sends several batches concurrently, so
+clearing a prefix costs a handful of requests however many files it holds.
+
+copy_blobs() runs server-side copies concurrently and only reports a copy as
+done once Azure says so: small blobs use the synchronous Put Blob From URL,
+larger ones start_copy_from_url() followed by polling the copy status until it
+succeeds, fails (and is retried) or runs out of time.
+
+bulk_delete_blobs_async() and copy_blobs_async() do the same with the
+azure .aio clients, as tasks on the event loop instead of threads.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from azure.core.exceptions import AzureError, HttpResponseError, ResourceModifiedError, ResourceNotFoundError
+from azure.storage.blob import BlobSasPermissions
+
+from .config import get_config
+from .polling import AdaptivePollingStrategy
+from .sas import blob_sas_url
+
+logger = logging.getLogger(__name__)
+
+# Azure rejects batch requests with more sub-requests than this
+MAX_BATCH_SIZE = 256
+
+
+def bulk_delete_blobs(container_client: Any, blob_names: Iterable[str], batch_size: int = MAX_BATCH_SIZE,
+                      max_concurrency: Optional[int] = None,
+                      unmodified_since: Optional[Dict[str, datetime]] = None) -> Dict[str, List[Any]]:
+    """
+    Delete blobs from one container in batches.
+
+    A blob that is already gone counts as missing, not as a failure. If a whole batch is refused
+    (e.g. by an emulator without batch support) its blobs are deleted one by one instead.
+
+    Args:
+        container_client: ContainerClient of the container holding the blobs
+        blob_names (Iterable[str]): Names of the blobs to delete
+        batch_size (int): Deletions per batch request, at most 256
+        max_concurrency (int): Batch requests in flight at once; defaults to TranslationConfig
+        unmodified_since (Dict[str, datetime]): Per blob name, only delete the blob if it has not been
+            written since this time; one that has is kept and reported as modified
+
+    Returns:
+        Dict[str, List]: 'deleted', 'missing' and 'modified' blob names, and 'failed' as {'name', 'error'} dicts
+    """
+    names = list(dict.fromkeys(blob_names))
+    result = {'deleted': [], 'missing': [], 'modified': [], 'failed': []}
+    if not names:
+        return result
+
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    batches = [names[i:i + batch_size] for i in range(0, len(names), batch_size)]
+    if max_concurrency is None:
+        max_concurrency = get_config().bulk_delete_max_concurrency
+    max_concurrency = max(1, min(max_concurrency, len(batches)))
+
+    conditions = unmodified_since or {}
+    if max_concurrency == 1:
+        outcomes = [_delete_batch(container_client, batch, conditions) for batch in batches]
+    else:
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            outcomes = list(executor.map(lambda batch: _delete_batch(container_client, batch, conditions), batches))
+
+    for outcome in outcomes:
+        for key in result:
+            result[key].extend(outcome[key])
+
+    logger.info(
+        f"Bulk delete in {getattr(container_client, 'container_name', 'container')}: {len(result['deleted'])} deleted, "
+        f"{len(result['missing'])} already gone, {len(result['modified'])} rewritten and kept, "
+        f"{len(result['failed'])} failed ({len(batches)} batch requests)"
+    )
+    return result
+
+
+def _delete_batch(container_client: Any, names: List[str], conditions: Dict[str, datetime]) -> Dict[str, List[Any]]:
+    outcome = {'deleted': [], 'missing': [], 'modified': [], 'failed': []}
+    try:
+        responses = list(container_client.delete_blobs(*_batch_entries(names, conditions), raise_on_any_failure=False))
+    except HttpResponseError as e:
+        logger.warning(f"Batch delete of {len(names)} blobs refused, deleting one by one: {str(e)}")
+        for name in names:
+            _delete_one(container_client, name, outcome, conditions.get(name))
+        return outcome
+
+    _sort_batch_responses(names, responses, outcome)
+    return outcome
+
+
+def _sort_batch_responses(names: List[str], responses: List[Any], outcome: Dict[str, List[Any]]):
+    # Sub-responses come back in request order
+    for name, response in zip(names, responses):
+        if 200 <= response.status_code < 300:
+            outcome['deleted'].append(name)
+        elif response.status_code == 404:
+            outcome['missing'].append(name)
+        elif response.status_code == 412:
+            outcome['modified'].append(name)
+        else:
+            error = f"HTTP {response.status_code} {getattr(response, 'reason', '') or ''}".strip()
+            logger.error(f"Failed to delete blob {name}: {error}")
+            outcome['failed'].append({'name': name, 'error': error})
+
+
+def _batch_entries(names: List[str], conditions: Dict[str, datetime]) -> List[Any]:
+    return [{'name': name, 'if_unmodified_since': conditions[name]} if name in conditions else name for name in names]
+
+
+def _delete_one(container_client: Any, name: str, outcome: Dict[str, List[Any]],
+                unmodified_since: Optional[datetime] = None):
+    try:
+        container_client.delete_blob(name, **({'if_unmodified_since': unmodified_since} if unmodified_since else {}))
+        outcome['deleted'].append(name)
+    except ResourceNotFoundError:
+        outcome['missing'].append(name)
+    except ResourceModifiedError:
+        outcome['modified'].append(name)
+    except Exception as e:
+        logger.error(f"Failed to delete blob {name}: {str(e)}")
+        outcome['failed'].append({'name': name, 'error': str(e)})
+
+
+class CopyRequest:
+    """
+    One server-side copy within the storage account.
+
+    Args:
+        source_container (str): Container of the blob to copy
+        source_blob (str): Name of the blob to copy
+        target_container (str): Container to copy into
+        target_blob (str): Name of the copy; an existing blob is overwritten
+        size (int): Size of the source in bytes if known (e.g. from list_blobs); enables synchronous copies
+    """
+
+    def __init__(self, source_container: str, source_blob: str, target_container: str, target_blob: str,
+                 size: Optional[int] = None):
+        self.source_container = source_container
+        self.source_blob = source_blob
+        self.target_container = target_container
+        self.target_blob = target_blob
+        self.size = size
+
+
+class CopyFailed(Exception):
+    """A copy ended in a failed or aborted state, or did not finish in time."""
+
+
+def copy_blobs(blob_service_client: Any, copies: Iterable[CopyRequest], max_concurrency: Optional[int] = None,
+               timeout: Optional[float] = None, retries: Optional[int] = None,
+               sync_copy_max_size: Optional[int] = None) -> Dict[str, List[Any]]:
+    """
+    Copy blobs concurrently and wait until every copy has completed.
+
+    Copies still pending when `timeout` runs out are aborted, so nothing keeps writing into a
+    container the caller is about to delete. Settings left as None come from TranslationConfig.
+
+    Args:
+        blob_service_client: BlobServiceClient of the storage account
+        copies (Iterable[CopyRequest]): Copies to make
+        max_concurrency (int): Copies in progress at once
+        timeout (float): Seconds all copies together may take
+        retries (int): Further attempts for a copy that failed
+        sync_copy_max_size (int): Largest known size copied synchronously (0 always polls)
+
+    Returns:
+        Dict[str, List]: 'copied' CopyRequests, and 'failed' as {'request', 'error'} dicts
+    """
+    config = get_config()
+    copies = list(copies)
+    result = {'copied': [], 'failed': []}
+    if not copies:
+        return result
+
+    max_concurrency = max(1, min(max_concurrency or config.copy_max_concurrency, len(copies)))
+    deadline = time.monotonic() + (timeout if timeout is not None else config.copy_timeout)
+    retries = config.copy_retries if retries is None else retries
+    sync_copy_max_size = config.sync_copy_max_size if sync_copy_max_size is None else sync_copy_max_size
+
+    def run(request: CopyRequest):
+        try:
+            _copy_with_retries(blob_service_client, request, deadline, retries, sync_copy_max_size)
+            return request, None
+        except Exception as e:
+            return request, e
+
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        outcomes = list(executor.map(run, copies))
+    return _copy_result(outcomes)
+
+
+def _copy_result(outcomes: List[Any]) -> Dict[str, List[Any]]:
+    result = {'copied': [], 'failed': []}
+    for request, error in outcomes:
+        if error is None:
+            result['copied'].append(request)
+        else:
+            logger.error(
+                f"Failed to copy {request.source_container}/{request.source_blob} to "
+                f"{request.target_container}/{request.target_blob}: {str(error)}"
+            )
+            result['failed'].append({'request': request, 'error': str(error)})
+
+    logger.info(f"Copied {len(result['copied'])} of {len(outcomes)} blobs ({len(result['failed'])} failed)")
+    return result
+
+
+def _copy_with_retries(blob_service_client: Any, request: CopyRequest, deadline: float, retries: int,
+                       sync_copy_max_size: int):
+    source_client = blob_service_client.get_blob_client(request.source_container, request.source_blob)
+    target_client = blob_service_client.get_blob_client(request.target_container, request.target_blob)
+    synchronous = request.size is not None and request.size <= sync_copy_max_size
+
+    for attempt in range(retries + 1):
+        try:
+            if synchronous:
+                try:
+                    # Put Blob From URL needs a readable source URL; signed locally, valid only for this copy
+                    source_url = blob_sas_url(
+                        blob_service_client, request.source_container, request.source_blob,
+                        BlobSasPermissions(read=True), ttl_seconds=max(60, int(deadline - time.monotonic()))
+                    )
+                except ValueError:
+                    synchronous = False
+                else:
+                    target_client.upload_blob_from_url(source_url, overwrite=True)
+                    return
+            _copy_and_wait(source_client, target_client, deadline)
+            return
+        except ResourceNotFoundError:
+            raise
+        except (AzureError, CopyFailed) as e:
+            if attempt == retries or time.monotonic() >= deadline:
+                raise
+            logger.warning(f"Copy to {request.target_container}/{request.target_blob} failed, retrying: {str(e)}")
+            time.sleep(min(2 ** attempt, max(0.0, deadline - time.monotonic())))
+
+
+def _copy_and_wait(source_client: Any, target_client: Any, deadline: float):
+    copy = target_client.start_copy_from_url(source_client.url)
+    status = copy.get('copy_status')
+    intervals = AdaptivePollingStrategy(initial_interval=0.2, max_interval=2.0).intervals()
+    while status == 'pending':
+        if time.monotonic() >= deadline:
+            # Stop the copy so it cannot land after the caller has moved on
+            try:
+                target_client.abort_copy(copy.get('copy_id'))
+            except AzureError as e:
+                logger.warning(f"Could not abort timed out copy to {target_client.blob_name}: {str(e)}")
+            raise CopyFailed("Copy did not finish in time")
+        time.sleep(min(next(intervals), max(0.0, deadline - time.monotonic())))
+        properties = target_client.get_blob_properties()
+        status = properties.copy.status
+    if status != 'success':
+        raise CopyFailed(f"Copy ended with status {status}")
+
+
+async def bulk_delete_blobs_async(container_client: Any, blob_names: Iterable[str], batch_size: int = MAX_BATCH_SIZE,
+                                  max_concurrency: Optional[int] = None,
+                                  unmodified_since: Optional[Dict[str, datetime]] = None) -> Dict[str, List[Any]]:
+    """bulk_delete_blobs() for an azure.storage.blob.aio ContainerClient; batches are sent as concurrent tasks."""
+    names = list(dict.fromkeys(blob_names))
+    result = {'deleted': [], 'missing': [], 'modified': [], 'failed': []}
+    if not names:
+        return result
+
+    batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
+    batches = [names[i:i + batch_size] for i in range(0, len(names), batch_size)]
+    if max_concurrency is None:
+        max_concurrency = get_config().bulk_delete_max_concurrency
+    slots = asyncio.Semaphore(max(1, max_concurrency))
+    conditions = unmodified_since or {}
+
+    async def delete_batch(batch: List[str]) -> Dict[str, List[Any]]:
+        outcome = {'deleted': [], 'missing': [], 'modified': [], 'failed': []}
+        async with slots:
+            try:
+                responses = [
+                    response async for response in
+                    await container_client.delete_blobs(*_batch_entries(batch, conditions), raise_on_any_failure=False)
+                ]
+            except HttpResponseError as e:
+                logger.warning(f"Batch delete of {len(batch)} blobs refused, deleting one by one: {str(e)}")
+                for name in batch:
+                    await _delete_one_async(container_client, name, outcome, conditions.get(name))
+                return outcome
+        _sort_batch_responses(batch, responses, outcome)
+        return outcome
+
+    for outcome in await asyncio.gather(*(delete_batch(batch) for batch in batches)):
+        for key in result:
+            result[key].extend(outcome[key])
+
+    logger.info(
+        f"Bulk delete in {getattr(container_client, 'container_name', 'container')}: {len(result['deleted'])} deleted, "
+        f"{len(result['missing'])} already gone, {len(result['modified'])} rewritten and kept, "
+        f"{len(result['failed'])} failed ({len(batches)} batch requests)"
+    )
+    return result
+
+
+async def _delete_one_async(container_client: Any, name: str, outcome: Dict[str, List[Any]],
+                            unmodified_since: Optional[datetime] = None):
+    try:
+        await container_client.delete_blob(name, **({'if_unmodified_since': unmodified_since} if unmodified_since else {}))
+        outcome['deleted'].append(name)
+    except ResourceNotFoundError:
+        outcome['missing'].append(name)
+    except ResourceModifiedError:
+        outcome['modified'].append(name)
+    except Exception as e:
+        logger.error(f"Failed to delete blob {name}: {str(e)}")
+        outcome['failed'].append({'name': name, 'error': str(e)})
+
+
+async def copy_blobs_async(blob_service_client: Any, copies: Iterable[CopyRequest], max_concurrency: Optional[int] = None,
+                           timeout: Optional[float] = None, retries: Optional[int] = None,
+                           sync_copy_max_size: Optional[int] = None) -> Dict[str, List[Any]]:
+    """copy_blobs() for an azure.storage.blob.aio BlobServiceClient; copies run as concurrent tasks."""
+    config = get_config()
+    copies = list(copies)
+    if not copies:
+        return {'copied': [], 'failed': []}
+
+    slots = asyncio.Semaphore(max(1, max_concurrency or config.copy_max_concurrency))
+    deadline = time.monotonic() + (timeout if timeout is not None else config.copy_timeout)
+    retries = config.copy_retries if retries is None else retries
+    sync_copy_max_size = config.sync_copy_max_size if sync_copy_max_size is None else sync_copy_max_size
+
+    async def run(request: CopyRequest):
+        async with slots:
+            try:
+                await _copy_with_retries_async(blob_service_client, request, deadline, retries, sync_copy_max_size)
+                return request, None
+            except Exception as e:
+                return request, e
+
+    return _copy_result(await asyncio.gather(*(run(request) for request in copies)))
+
+
+async def _copy_with_retries_async(blob_service_client: Any, request: CopyRequest, deadline: float, retries: int,
+                                   sync_copy_max_size: int):
+    source_client = blob_service_client.get_blob_client(request.source_container, request.source_blob)
+    target_client = blob_service_client.get_blob_client(request.target_container, request.target_blob)
+    synchronous = request.size is not None and request.size <= sync_copy_max_size
+
+    for attempt in range(retries + 1):
+        try:
+            if synchronous:
+                try:
+                    source_url = blob_sas_url(
+                        blob_service_client, request.source_container, request.source_blob,
+                        BlobSasPermissions(read=True), ttl_seconds=max(60, int(deadline - time.monotonic()))
+                    )
+                except ValueError:
+                    synchronous = False
+                else:
+                    await target_client.upload_blob_from_url(source_url, overwrite=True)
+                    return
+            await _copy_and_wait_async(source_client, target_client, deadline)
+            return
+        except ResourceNotFoundError:
+            raise
+        except (AzureError, CopyFailed) as e:
+            if attempt == retries or time.monotonic() >= deadline:
+                raise
+            logger.warning(f"Copy to {request.target_container}/{request.target_blob} failed, retrying: {str(e)}")
+            await asyncio.sleep(min(2 ** attempt, max(0.0, deadline - time.monotonic())))
+
+
+async def _copy_and_wait_async(source_client: Any, target_client: Any, deadline: float):
+    copy = await target_client.start_copy_from_url(source_client.url)
+    status = copy.get('copy_status')
+    intervals = AdaptivePollingStrategy(initial_interval=0.2, max_interval=2.0).intervals()
+    while status == 'pending':
+        if time.monotonic() >= deadline:
+            try:
+                await target_client.abort_copy(copy.get('copy_id'))
+            except AzureError as e:
+                logger.warning(f"Could not abort timed out copy to {target_client.blob_name}: {str(e)}")
+            raise CopyFailed("Copy did not finish in time")
+        await asyncio.sleep(min(next(intervals), max(0.0, deadline - time.monotonic())))
+        properties = await target_client.get_blob_properties()
+        status = properties.copy.status
+    if status != 'success':
+        raise CopyFailed(f"Copy ended with status {status}")
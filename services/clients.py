@@ -0,0 +1,179 @@
+"""
+Process-wide registry of long-lived Azure SDK clients.
+
+Building a BlobServiceClient or DocumentTranslationClient per request means a
+new HTTP session, and therefore a new TLS handshake, on every call. The
+registry parses the storage connection string once and keeps one client per
+configuration, all sharing a single pooled HTTP transport. Clients are rebuilt
+after a fork, so gunicorn workers never share sockets with the master or each
+other.
+"""
+
+import logging
+import os
+import threading
+import urllib.parse
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from azure.core.credentials import AzureKeyCredential
+from azure.core.pipeline.transport import RequestsTransport
+from azure.ai.translation.document import DocumentTranslationClient
+from azure.storage.blob import BlobServiceClient
+
+from .config import get_config
+from .rate_limit import STORAGE_BUCKET, rate_limited
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_connection_string(connection_string: Optional[str]) -> str:
+    """
+    Validate an Azure Storage connection string, decoding it if it was URL-encoded.
+
+    Raises:
+        ValueError: If the connection string is missing or malformed
+    """
+    if not connection_string:
+        raise ValueError("Azure Storage connection string is not configured")
+    if '%' in connection_string:
+        connection_string = urllib.parse.unquote(connection_string)
+    if 'DefaultEndpointsProtocol' not in connection_string or 'AccountName' not in connection_string:
+        raise ValueError("Azure Storage connection string is missing DefaultEndpointsProtocol or AccountName")
+    return connection_string
+
+
+class AzureClientRegistry:
+    """
+    Thread-safe holder of Azure clients sharing one pooled HTTP transport.
+
+    Args:
+        pool_connections (int): Number of hosts whose connection pools are kept
+        pool_maxsize (int): Connections kept open per host
+    """
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 32):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self._lock = threading.Lock()
+        self._reset()
+
+    def _reset(self):
+        self._pid = os.getpid()
+        self._session = None
+        self._adapter = None
+        self._transport = None
+        self._blob_clients: Dict[str, BlobServiceClient] = {}
+        self._translation_clients: Dict[Tuple[str, str], DocumentTranslationClient] = {}
+        self._lookups = 0
+        self._created = 0
+
+    def _ensure_process(self):
+        # Sockets inherited over fork are shared with the parent; start over with fresh clients
+        if self._pid != os.getpid():
+            logger.info(f"Process {os.getpid()} forked from {self._pid}: rebuilding Azure clients")
+            self._reset()
+
+    def _shared_transport(self) -> RequestsTransport:
+        if self._transport is None:
+            self._session = requests.Session()
+            # Retries are handled by the Azure SDK retry policy, not by urllib3
+            self._adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                max_retries=Retry(total=False, redirect=False, raise_on_status=False)
+            )
+            self._session.mount('https://', self._adapter)
+            self._session.mount('http://', self._adapter)
+            self._transport = RequestsTransport(session=self._session, session_owner=False)
+        return self._transport
+
+    def blob_service_client(self, connection_string: str) -> BlobServiceClient:
+        """Get the shared BlobServiceClient for a connection string, creating it on first use."""
+        with self._lock:
+            self._ensure_process()
+            self._lookups += 1
+            client = self._blob_clients.get(connection_string)
+            if client is None:
+                client = BlobServiceClient.from_connection_string(
+                    normalize_connection_string(connection_string),
+                    transport=self._shared_transport()
+                )
+                self._blob_clients[connection_string] = client
+                self._created += 1
+            return client
+
+    def translation_client(self, endpoint: str, key: str) -> DocumentTranslationClient:
+        """Get the shared DocumentTranslationClient for an endpoint and key, creating it on first use."""
+        with self._lock:
+            self._ensure_process()
+            self._lookups += 1
+            client = self._translation_clients.get((endpoint, key))
+            if client is None:
+                client = DocumentTranslationClient(
+                    endpoint, AzureKeyCredential(key), transport=self._shared_transport()
+                )
+                self._translation_clients[(endpoint, key)] = client
+                self._created += 1
+            return client
+
+    def stats(self) -> Dict[str, Any]:
+        """Client reuse counters and per-host connection pool usage for this process."""
+        with self._lock:
+            self._ensure_process()
+            pools = []
+            if self._adapter is not None:
+                pool_manager = self._adapter.poolmanager
+                for pool_key in list(pool_manager.pools.keys()):
+                    pool = pool_manager.pools.get(pool_key)
+                    if pool is None:
+                        continue
+                    pools.append({
+                        'host': pool.host,
+                        'connections_opened': pool.num_connections,
+                        'requests': pool.num_requests,
+                        'idle_connections': pool.pool.qsize() if pool.pool else 0,
+                        'max_connections': pool.pool.maxsize if pool.pool else 0,
+                    })
+            return {
+                'pid': self._pid,
+                'clients': len(self._blob_clients) + len(self._translation_clients),
+                'lookups': self._lookups,
+                'clients_created': self._created,
+                'pools': pools,
+            }
+
+
+_registry: Optional[AzureClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> AzureClientRegistry:
+    """Get the process-wide client registry, sized from TranslationConfig."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            config = get_config()
+            _registry = AzureClientRegistry(
+                pool_connections=config.http_pool_connections,
+                pool_maxsize=config.http_pool_maxsize,
+            )
+    return _registry
+
+
+def get_blob_service_client() -> Optional[Any]:
+    """
+    Get the shared, rate-limited BlobServiceClient for AZURE_STORAGE_CONNECTION_STRING.
+
+    Returns:
+        The client, or None when no connection string is configured
+
+    Raises:
+        ValueError: If the connection string is malformed
+    """
+    connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+    if not connection_string:
+        return None
+    return rate_limited(get_client_registry().blob_service_client(connection_string), STORAGE_BUCKET)
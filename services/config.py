@@ -5,6 +5,7 @@ This module handles configuration loading from environment variables and setting
 """
 
 import os
+import tempfile
 from typing import Optional
 from django.conf import settings as django_settings
 
@@ -17,6 +18,56 @@ class TranslationConfig:
         self._endpoint: Optional[str] = None
         self._source_uri: Optional[str] = None
         self._target_uri: Optional[str] = None
+        self._batch_window_seconds: Optional[float] = None
+        self._batch_max_jobs: Optional[int] = None
+        self._job_max_attempts: Optional[int] = None
+        self._job_events_max_streams: Optional[int] = None
+        self._cache_enabled: Optional[bool] = None
+        self._cache_container: Optional[str] = None
+        self._cache_max_bytes: Optional[int] = None
+        self._cache_max_age_days: Optional[int] = None
+        self._poll_initial_interval: Optional[float] = None
+        self._poll_max_interval: Optional[float] = None
+        self._poll_backoff_multiplier: Optional[float] = None
+        self._poll_jitter: Optional[float] = None
+        self._max_operation_seconds: Optional[float] = None
+        self._rate_limit_enabled: Optional[bool] = None
+        self._rate_limit_db_path: Optional[str] = None
+        self._translator_requests_per_second: Optional[float] = None
+        self._translator_burst: Optional[int] = None
+        self._translator_max_concurrency: Optional[int] = None
+        self._storage_requests_per_second: Optional[float] = None
+        self._storage_burst: Optional[int] = None
+        self._storage_max_concurrency: Optional[int] = None
+        self._http_pool_connections: Optional[int] = None
+        self._http_pool_maxsize: Optional[int] = None
+        self._streaming_upload_enabled: Optional[bool] = None
+        self._upload_block_size: Optional[int] = None
+        self._upload_max_concurrency: Optional[int] = None
+        self._upload_batch_concurrency: Optional[int] = None
+        self._resumable_upload_enabled: Optional[bool] = None
+        self._resumable_chunk_size: Optional[int] = None
+        self._upload_session_ttl: Optional[int] = None
+        self._download_chunk_size: Optional[int] = None
+        self._download_prefetch_chunks: Optional[int] = None
+        self._download_parallel_threshold: Optional[int] = None
+        self._download_redirect_enabled: Optional[bool] = None
+        self._download_sas_ttl: Optional[int] = None
+        self._direct_upload_enabled: Optional[bool] = None
+        self._upload_sas_ttl: Optional[int] = None
+        self._bulk_delete_max_concurrency: Optional[int] = None
+        self._copy_max_concurrency: Optional[int] = None
+        self._copy_timeout: Optional[float] = None
+        self._copy_retries: Optional[int] = None
+        self._sync_copy_max_size: Optional[int] = None
+        self._inventory_max_age_hours: Optional[float] = None
+        self._inline_expiry_cleanup: Optional[bool] = None
+        self._sweep_max_age_hours: Optional[int] = None
+        self._sweep_time_budget: Optional[float] = None
+        self._sweep_page_size: Optional[int] = None
+        self._async_delete_enabled: Optional[bool] = None
+        self._async_delete_drain_size: Optional[int] = None
+        self._async_max_concurrency: Optional[int] = None
     
     @property
     def key(self) -> str:
@@ -114,6 +165,530 @@ class TranslationConfig:
         self._target_uri = value
 
 
+    def _tunable(self, override, name: str, default, cast):
+        """Resolve a tunable: instance override, then Django settings, then environment variable, then default."""
+        if override is not None:
+            return override
+        
+        # Try Django settings first
+        if hasattr(django_settings, name):
+            return cast(getattr(django_settings, name))
+        
+        # Try environment variable
+        value = os.getenv(name)
+        if value:
+            return cast(value)
+        
+        return default
+    
+    @property
+    def batch_window_seconds(self) -> float:
+        """Get how long the translation worker waits to coalesce queued jobs into one Azure operation (0 disables)."""
+        return self._tunable(self._batch_window_seconds, 'TRANSLATION_BATCH_WINDOW_SECONDS', 2.0, float)
+    
+    @batch_window_seconds.setter
+    def batch_window_seconds(self, value: float):
+        """Set the job coalescing window."""
+        self._batch_window_seconds = value
+    
+    @property
+    def batch_max_jobs(self) -> int:
+        """Get the maximum number of queued jobs submitted together as one Azure operation."""
+        return self._tunable(self._batch_max_jobs, 'TRANSLATION_BATCH_MAX_JOBS', 20, int)
+    
+    @batch_max_jobs.setter
+    def batch_max_jobs(self, value: int):
+        """Set the maximum number of jobs per Azure operation."""
+        self._batch_max_jobs = value
+    
+    @property
+    def job_max_attempts(self) -> int:
+        """Get how many times a translation job may be claimed before it is failed instead of retried."""
+        return self._tunable(self._job_max_attempts, 'TRANSLATION_JOB_MAX_ATTEMPTS', 3, int)
+    
+    @job_max_attempts.setter
+    def job_max_attempts(self, value: int):
+        """Set the maximum number of attempts per translation job."""
+        self._job_max_attempts = value
+    
+    @property
+    def job_events_max_streams(self) -> int:
+        """Get how many translation progress streams one web process keeps open at a time."""
+        return self._tunable(self._job_events_max_streams, 'TRANSLATION_JOB_EVENTS_MAX_STREAMS', 2, int)
+    
+    @job_events_max_streams.setter
+    def job_events_max_streams(self, value: int):
+        """Set the per-process progress stream limit."""
+        self._job_events_max_streams = value
+    
+    @property
+    def cache_enabled(self) -> bool:
+        """Get whether translated documents are cached and reused for identical source files."""
+        return self._tunable(self._cache_enabled, 'TRANSLATION_CACHE_ENABLED', True, _to_bool)
+    
+    @cache_enabled.setter
+    def cache_enabled(self, value: bool):
+        """Enable or disable the translation cache."""
+        self._cache_enabled = value
+    
+    @property
+    def cache_container(self) -> str:
+        """Get the blob container holding cached translated documents."""
+        return self._tunable(self._cache_container, 'AZURE_STORAGE_CONTAINER_NAME_CACHE', 'translation-cache', str)
+    
+    @cache_container.setter
+    def cache_container(self, value: str):
+        """Set the translation cache container."""
+        self._cache_container = value
+    
+    @property
+    def cache_max_bytes(self) -> int:
+        """Get the total size of cached translations above which least recently used entries are evicted."""
+        return self._tunable(self._cache_max_bytes, 'TRANSLATION_CACHE_MAX_BYTES', 5 * 1024 ** 3, int)
+    
+    @cache_max_bytes.setter
+    def cache_max_bytes(self, value: int):
+        """Set the translation cache size limit."""
+        self._cache_max_bytes = value
+    
+    @property
+    def cache_max_age_days(self) -> int:
+        """Get how many days an unused cached translation is kept."""
+        return self._tunable(self._cache_max_age_days, 'TRANSLATION_CACHE_MAX_AGE_DAYS', 30, int)
+    
+    @cache_max_age_days.setter
+    def cache_max_age_days(self, value: int):
+        """Set the translation cache age limit."""
+        self._cache_max_age_days = value
+    
+    @property
+    def poll_initial_interval(self) -> float:
+        """Get the delay in seconds before the first translation status call."""
+        return self._tunable(self._poll_initial_interval, 'TRANSLATION_POLL_INITIAL_INTERVAL', 1.0, float)
+    
+    @poll_initial_interval.setter
+    def poll_initial_interval(self, value: float):
+        """Set the initial polling interval."""
+        self._poll_initial_interval = value
+    
+    @property
+    def poll_max_interval(self) -> float:
+        """Get the longest delay in seconds between translation status calls."""
+        return self._tunable(self._poll_max_interval, 'TRANSLATION_POLL_MAX_INTERVAL', 30.0, float)
+    
+    @poll_max_interval.setter
+    def poll_max_interval(self, value: float):
+        """Set the maximum polling interval."""
+        self._poll_max_interval = value
+    
+    @property
+    def poll_backoff_multiplier(self) -> float:
+        """Get the factor the polling interval grows by after each status call."""
+        return self._tunable(self._poll_backoff_multiplier, 'TRANSLATION_POLL_BACKOFF_MULTIPLIER', 1.5, float)
+    
+    @poll_backoff_multiplier.setter
+    def poll_backoff_multiplier(self, value: float):
+        """Set the polling backoff multiplier."""
+        self._poll_backoff_multiplier = value
+    
+    @property
+    def poll_jitter(self) -> float:
+        """Get the random spread applied to each polling interval, as a fraction of it."""
+        return self._tunable(self._poll_jitter, 'TRANSLATION_POLL_JITTER', 0.1, float)
+    
+    @poll_jitter.setter
+    def poll_jitter(self, value: float):
+        """Set the polling jitter."""
+        self._poll_jitter = value
+    
+    @property
+    def max_operation_seconds(self) -> float:
+        """Get how long after submission a translation operation may run before it is canceled and its job failed (0 disables)."""
+        return self._tunable(self._max_operation_seconds, 'TRANSLATION_MAX_OPERATION_SECONDS', 21600.0, float)
+    
+    @max_operation_seconds.setter
+    def max_operation_seconds(self, value: float):
+        """Set the maximum translation operation duration."""
+        self._max_operation_seconds = value
+    
+    @property
+    def rate_limit_enabled(self) -> bool:
+        """Get whether Azure Translator and Storage calls are throttled by the shared rate limiter."""
+        return self._tunable(self._rate_limit_enabled, 'AZURE_RATE_LIMIT_ENABLED', True, _to_bool)
+    
+    @rate_limit_enabled.setter
+    def rate_limit_enabled(self, value: bool):
+        """Enable or disable the shared rate limiter."""
+        self._rate_limit_enabled = value
+    
+    @property
+    def rate_limit_db_path(self) -> str:
+        """Get the SQLite file through which all worker processes on this host share rate limiter state."""
+        return self._tunable(self._rate_limit_db_path, 'AZURE_RATE_LIMIT_DB_PATH', os.path.join(tempfile.gettempdir(), 'azure-rate-limit.sqlite3'), str)
+    
+    @rate_limit_db_path.setter
+    def rate_limit_db_path(self, value: str):
+        """Set the rate limiter state file."""
+        self._rate_limit_db_path = value
+    
+    @property
+    def translator_requests_per_second(self) -> float:
+        """Get the sustained rate of Document Translation API calls allowed per host."""
+        return self._tunable(self._translator_requests_per_second, 'AZURE_TRANSLATOR_REQUESTS_PER_SECOND', 5.0, float)
+    
+    @translator_requests_per_second.setter
+    def translator_requests_per_second(self, value: float):
+        """Set the Translator request rate."""
+        self._translator_requests_per_second = value
+    
+    @property
+    def translator_burst(self) -> int:
+        """Get how many Document Translation API calls may be made back to back before the rate applies."""
+        return self._tunable(self._translator_burst, 'AZURE_TRANSLATOR_BURST', 10, int)
+    
+    @translator_burst.setter
+    def translator_burst(self, value: int):
+        """Set the Translator burst size."""
+        self._translator_burst = value
+    
+    @property
+    def translator_max_concurrency(self) -> int:
+        """Get the maximum number of Document Translation API calls in flight per host."""
+        return self._tunable(self._translator_max_concurrency, 'AZURE_TRANSLATOR_MAX_CONCURRENCY', 4, int)
+    
+    @translator_max_concurrency.setter
+    def translator_max_concurrency(self, value: int):
+        """Set the Translator concurrency limit."""
+        self._translator_max_concurrency = value
+    
+    @property
+    def storage_requests_per_second(self) -> float:
+        """Get the sustained rate of Blob Storage calls allowed per host."""
+        return self._tunable(self._storage_requests_per_second, 'AZURE_STORAGE_REQUESTS_PER_SECOND', 100.0, float)
+    
+    @storage_requests_per_second.setter
+    def storage_requests_per_second(self, value: float):
+        """Set the Storage request rate."""
+        self._storage_requests_per_second = value
+    
+    @property
+    def storage_burst(self) -> int:
+        """Get how many Blob Storage calls may be made back to back before the rate applies."""
+        return self._tunable(self._storage_burst, 'AZURE_STORAGE_BURST', 200, int)
+    
+    @storage_burst.setter
+    def storage_burst(self, value: int):
+        """Set the Storage burst size."""
+        self._storage_burst = value
+    
+    @property
+    def storage_max_concurrency(self) -> int:
+        """Get the maximum number of Blob Storage calls in flight per host."""
+        return self._tunable(self._storage_max_concurrency, 'AZURE_STORAGE_MAX_CONCURRENCY', 32, int)
+    
+    @storage_max_concurrency.setter
+    def storage_max_concurrency(self, value: int):
+        """Set the Storage concurrency limit."""
+        self._storage_max_concurrency = value
+    
+    @property
+    def http_pool_connections(self) -> int:
+        """Get how many hosts keep a pool of reusable connections in the shared Azure HTTP transport."""
+        return self._tunable(self._http_pool_connections, 'AZURE_HTTP_POOL_CONNECTIONS', 10, int)
+    
+    @http_pool_connections.setter
+    def http_pool_connections(self, value: int):
+        """Set the number of pooled hosts."""
+        self._http_pool_connections = value
+    
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Get how many connections per host the shared Azure HTTP transport keeps open."""
+        return self._tunable(self._http_pool_maxsize, 'AZURE_HTTP_POOL_MAXSIZE', 32, int)
+    
+    @http_pool_maxsize.setter
+    def http_pool_maxsize(self, value: int):
+        """Set the per-host connection pool size."""
+        self._http_pool_maxsize = value
+    
+    @property
+    def streaming_upload_enabled(self) -> bool:
+        """Get whether uploads are staged into Azure blocks while the request body arrives instead of being buffered."""
+        return self._tunable(self._streaming_upload_enabled, 'AZURE_STREAMING_UPLOAD_ENABLED', True, _to_bool)
+    
+    @streaming_upload_enabled.setter
+    def streaming_upload_enabled(self, value: bool):
+        """Enable or disable streaming uploads."""
+        self._streaming_upload_enabled = value
+    
+    @property
+    def upload_block_size(self) -> int:
+        """Get the size in bytes of each block staged by streaming uploads."""
+        return self._tunable(self._upload_block_size, 'AZURE_UPLOAD_BLOCK_SIZE', 4 * 1024 ** 2, int)
+    
+    @upload_block_size.setter
+    def upload_block_size(self, value: int):
+        """Set the streaming upload block size."""
+        self._upload_block_size = value
+    
+    @property
+    def upload_max_concurrency(self) -> int:
+        """Get how many blocks of one streaming upload may be staged in parallel (1 stages them one by one)."""
+        return self._tunable(self._upload_max_concurrency, 'AZURE_UPLOAD_MAX_CONCURRENCY', 2, int)
+    
+    @upload_max_concurrency.setter
+    def upload_max_concurrency(self, value: int):
+        """Set the streaming upload staging concurrency."""
+        self._upload_max_concurrency = value
+    
+    @property
+    def upload_batch_concurrency(self) -> int:
+        """Get how many files of one /upload/batch/ request are written to storage in parallel."""
+        return self._tunable(self._upload_batch_concurrency, 'AZURE_UPLOAD_BATCH_CONCURRENCY', 4, int)
+    
+    @upload_batch_concurrency.setter
+    def upload_batch_concurrency(self, value: int):
+        """Set the batch upload concurrency."""
+        self._upload_batch_concurrency = value
+    
+    @property
+    def resumable_upload_enabled(self) -> bool:
+        """Get whether large files may be uploaded in resumable chunks through /upload/sessions/."""
+        return self._tunable(self._resumable_upload_enabled, 'AZURE_RESUMABLE_UPLOAD_ENABLED', True, _to_bool)
+    
+    @resumable_upload_enabled.setter
+    def resumable_upload_enabled(self, value: bool):
+        """Enable or disable resumable chunked uploads."""
+        self._resumable_upload_enabled = value
+    
+    @property
+    def resumable_chunk_size(self) -> int:
+        """Get the size in bytes of each chunk of a resumable upload (one staged block per chunk)."""
+        return self._tunable(self._resumable_chunk_size, 'AZURE_RESUMABLE_CHUNK_SIZE', 8 * 1024 ** 2, int)
+    
+    @resumable_chunk_size.setter
+    def resumable_chunk_size(self, value: int):
+        """Set the resumable upload chunk size."""
+        self._resumable_chunk_size = value
+    
+    @property
+    def upload_session_ttl(self) -> int:
+        """Get how many seconds a resumable upload may take before its session expires."""
+        return self._tunable(self._upload_session_ttl, 'AZURE_UPLOAD_SESSION_TTL_SECONDS', 24 * 3600, int)
+    
+    @upload_session_ttl.setter
+    def upload_session_ttl(self, value: int):
+        """Set the resumable upload session lifetime."""
+        self._upload_session_ttl = value
+    
+    @property
+    def download_chunk_size(self) -> int:
+        """Get the size in bytes of each range fetched from storage by streaming downloads."""
+        return self._tunable(self._download_chunk_size, 'AZURE_DOWNLOAD_CHUNK_SIZE', 4 * 1024 ** 2, int)
+    
+    @download_chunk_size.setter
+    def download_chunk_size(self, value: int):
+        """Set the streaming download chunk size."""
+        self._download_chunk_size = value
+    
+    @property
+    def download_prefetch_chunks(self) -> int:
+        """Get how many chunks of a large download are fetched ahead in parallel (1 fetches them one by one)."""
+        return self._tunable(self._download_prefetch_chunks, 'AZURE_DOWNLOAD_PREFETCH_CHUNKS', 4, int)
+    
+    @download_prefetch_chunks.setter
+    def download_prefetch_chunks(self, value: int):
+        """Set the streaming download prefetch depth."""
+        self._download_prefetch_chunks = value
+    
+    @property
+    def download_parallel_threshold(self) -> int:
+        """Get the download size in bytes from which chunks are prefetched in parallel."""
+        return self._tunable(self._download_parallel_threshold, 'AZURE_DOWNLOAD_PARALLEL_THRESHOLD', 16 * 1024 ** 2, int)
+    
+    @download_parallel_threshold.setter
+    def download_parallel_threshold(self, value: int):
+        """Set the size from which downloads are prefetched in parallel."""
+        self._download_parallel_threshold = value
+    
+    @property
+    def download_redirect_enabled(self) -> bool:
+        """Get whether downloads redirect to a short-lived read-only SAS URL instead of passing through the app."""
+        return self._tunable(self._download_redirect_enabled, 'AZURE_DOWNLOAD_REDIRECT_ENABLED', False, _to_bool)
+    
+    @download_redirect_enabled.setter
+    def download_redirect_enabled(self, value: bool):
+        """Enable or disable SAS redirect downloads."""
+        self._download_redirect_enabled = value
+    
+    @property
+    def download_sas_ttl(self) -> int:
+        """Get how many seconds a download SAS URL stays valid."""
+        return self._tunable(self._download_sas_ttl, 'AZURE_DOWNLOAD_SAS_TTL_SECONDS', 300, int)
+    
+    @download_sas_ttl.setter
+    def download_sas_ttl(self, value: int):
+        """Set the download SAS lifetime."""
+        self._download_sas_ttl = value
+    
+    @property
+    def direct_upload_enabled(self) -> bool:
+        """Get whether browsers may upload straight to storage with a short-lived write-only SAS URL."""
+        return self._tunable(self._direct_upload_enabled, 'AZURE_DIRECT_UPLOAD_ENABLED', False, _to_bool)
+    
+    @direct_upload_enabled.setter
+    def direct_upload_enabled(self, value: bool):
+        """Enable or disable direct browser-to-storage uploads."""
+        self._direct_upload_enabled = value
+    
+    @property
+    def upload_sas_ttl(self) -> int:
+        """Get how many seconds an upload SAS URL stays valid."""
+        return self._tunable(self._upload_sas_ttl, 'AZURE_UPLOAD_SAS_TTL_SECONDS', 600, int)
+    
+    @upload_sas_ttl.setter
+    def upload_sas_ttl(self, value: int):
+        """Set the upload SAS lifetime."""
+        self._upload_sas_ttl = value
+    
+    @property
+    def bulk_delete_max_concurrency(self) -> int:
+        """Get how many batch delete requests (up to 256 blobs each) may run in parallel."""
+        return self._tunable(self._bulk_delete_max_concurrency, 'AZURE_BULK_DELETE_MAX_CONCURRENCY', 4, int)
+    
+    @bulk_delete_max_concurrency.setter
+    def bulk_delete_max_concurrency(self, value: int):
+        """Set the bulk delete concurrency."""
+        self._bulk_delete_max_concurrency = value
+    
+    @property
+    def copy_max_concurrency(self) -> int:
+        """Get how many server-side blob copies may be in progress at once."""
+        return self._tunable(self._copy_max_concurrency, 'AZURE_COPY_MAX_CONCURRENCY', 8, int)
+    
+    @copy_max_concurrency.setter
+    def copy_max_concurrency(self, value: int):
+        """Set the blob copy concurrency."""
+        self._copy_max_concurrency = value
+    
+    @property
+    def copy_timeout(self) -> float:
+        """Get how many seconds a set of blob copies may take before pending ones are aborted."""
+        return self._tunable(self._copy_timeout, 'AZURE_COPY_TIMEOUT_SECONDS', 300.0, float)
+    
+    @copy_timeout.setter
+    def copy_timeout(self, value: float):
+        """Set the blob copy timeout."""
+        self._copy_timeout = value
+    
+    @property
+    def copy_retries(self) -> int:
+        """Get how many times a failed blob copy is retried."""
+        return self._tunable(self._copy_retries, 'AZURE_COPY_RETRIES', 2, int)
+    
+    @copy_retries.setter
+    def copy_retries(self, value: int):
+        """Set the blob copy retry count."""
+        self._copy_retries = value
+    
+    @property
+    def sync_copy_max_size(self) -> int:
+        """Get the largest blob size in bytes copied synchronously instead of polling the copy status (0 disables)."""
+        return self._tunable(self._sync_copy_max_size, 'AZURE_SYNC_COPY_MAX_SIZE', 256 * 1024 ** 2, int)
+    
+    @sync_copy_max_size.setter
+    def sync_copy_max_size(self, value: int):
+        """Set the synchronous copy size limit."""
+        self._sync_copy_max_size = value
+    
+    @property
+    def inventory_max_age_hours(self) -> float:
+        """Get how long a container's blob inventory is trusted after its last reconciliation (0 trusts it indefinitely)."""
+        return self._tunable(self._inventory_max_age_hours, 'AZURE_INVENTORY_MAX_AGE_HOURS', 24.0, float)
+    
+    @inventory_max_age_hours.setter
+    def inventory_max_age_hours(self, value: float):
+        """Set the blob inventory's maximum reconciliation age."""
+        self._inventory_max_age_hours = value
+    
+    @property
+    def inline_expiry_cleanup(self) -> bool:
+        """Get whether translation requests delete expired target files themselves (only needed when sweep_expired_blobs is not scheduled)."""
+        return self._tunable(self._inline_expiry_cleanup, 'TRANSLATION_INLINE_EXPIRY_CLEANUP', False, _to_bool)
+    
+    @inline_expiry_cleanup.setter
+    def inline_expiry_cleanup(self, value: bool):
+        """Set whether translation requests clean up expired target files."""
+        self._inline_expiry_cleanup = value
+    
+    @property
+    def sweep_max_age_hours(self) -> int:
+        """Get the age in hours after which sweep_expired_blobs deletes a blob."""
+        return self._tunable(self._sweep_max_age_hours, 'AZURE_SWEEP_MAX_AGE_HOURS', 24, int)
+    
+    @sweep_max_age_hours.setter
+    def sweep_max_age_hours(self, value: int):
+        """Set the sweeper's blob age limit."""
+        self._sweep_max_age_hours = value
+    
+    @property
+    def sweep_time_budget(self) -> float:
+        """Get the seconds one sweep_expired_blobs run may spend before checkpointing and stopping."""
+        return self._tunable(self._sweep_time_budget, 'AZURE_SWEEP_TIME_BUDGET_SECONDS', 240.0, float)
+    
+    @sweep_time_budget.setter
+    def sweep_time_budget(self, value: float):
+        """Set the sweeper's time budget."""
+        self._sweep_time_budget = value
+    
+    @property
+    def sweep_page_size(self) -> int:
+        """Get how many blobs the sweeper lists per page (Azure returns at most 5000)."""
+        return self._tunable(self._sweep_page_size, 'AZURE_SWEEP_PAGE_SIZE', 5000, int)
+    
+    @sweep_page_size.setter
+    def sweep_page_size(self, value: int):
+        """Set the sweeper's listing page size."""
+        self._sweep_page_size = value
+    
+    @property
+    def async_delete_enabled(self) -> bool:
+        """Get whether uploads and translations queue blob deletions for run_blob_deleter instead of deleting inline."""
+        return self._tunable(self._async_delete_enabled, 'AZURE_ASYNC_DELETE_ENABLED', False, _to_bool)
+    
+    @async_delete_enabled.setter
+    def async_delete_enabled(self, value: bool):
+        """Set whether blob deletions are queued."""
+        self._async_delete_enabled = value
+    
+    @property
+    def async_delete_drain_size(self) -> int:
+        """Get how many queued blob deletions run_blob_deleter takes per round."""
+        return self._tunable(self._async_delete_drain_size, 'AZURE_ASYNC_DELETE_DRAIN_SIZE', 1000, int)
+    
+    @async_delete_drain_size.setter
+    def async_delete_drain_size(self, value: int):
+        """Set the blob deleter's round size."""
+        self._async_delete_drain_size = value
+    
+    @property
+    def async_max_concurrency(self) -> int:
+        """Get how many storage operations one AsyncDocumentTranslationService runs at the same time."""
+        return self._tunable(self._async_max_concurrency, 'AZURE_ASYNC_MAX_CONCURRENCY', 32, int)
+    
+    @async_max_concurrency.setter
+    def async_max_concurrency(self, value: int):
+        """Set the async translation service's storage concurrency."""
+        self._async_max_concurrency = value
+
+
+def _to_bool(value) -> bool:
+    """Interpret a setting or environment value as a boolean."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 # Global configuration instance
 config = TranslationConfig()
 
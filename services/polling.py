@@ -0,0 +1,57 @@
+"""
+Polling strategy for long-running Azure Document Translation operations.
+
+Small documents usually finish within a few seconds, so status is checked
+quickly at first; after that the interval grows exponentially (with jitter so
+many workers do not poll in lockstep) up to a cap, keeping status calls for
+large batches low.
+"""
+
+import random
+from typing import Iterator, Optional
+
+from .config import get_config
+
+
+class AdaptivePollingStrategy:
+    """
+    Produces the delays to wait between translation status calls.
+
+    Args:
+        initial_interval (float): Delay before the first status call, in seconds
+        max_interval (float): Upper bound for any delay, in seconds
+        multiplier (float): Factor applied to the delay after each call
+        jitter (float): Random spread applied to each delay, as a fraction (0.1 = +/-10%)
+    """
+
+    def __init__(self, initial_interval: float = 1.0, max_interval: float = 30.0,
+                 multiplier: float = 1.5, jitter: float = 0.1):
+        if initial_interval <= 0:
+            raise ValueError("initial_interval must be positive")
+        if max_interval < initial_interval:
+            raise ValueError("max_interval must be at least initial_interval")
+        if multiplier < 1:
+            raise ValueError("multiplier must be at least 1")
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.multiplier = multiplier
+        self.jitter = max(0.0, jitter)
+
+    def intervals(self) -> Iterator[float]:
+        """Yield delays forever: initial, then exponentially growing up to max_interval, each jittered."""
+        interval = self.initial_interval
+        while True:
+            spread = interval * self.jitter
+            yield min(self.max_interval, max(0.0, interval + random.uniform(-spread, spread)))
+            interval = min(self.max_interval, interval * self.multiplier)
+
+    @classmethod
+    def from_config(cls, config: Optional[object] = None) -> "AdaptivePollingStrategy":
+        """Build the strategy from TranslationConfig."""
+        config = config or get_config()
+        return cls(
+            initial_interval=config.poll_initial_interval,
+            max_interval=config.poll_max_interval,
+            multiplier=config.poll_backoff_multiplier,
+            jitter=config.poll_jitter,
+        )
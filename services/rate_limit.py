@@ -0,0 +1,356 @@
+"""
+Cross-process rate limiting for Azure Translator and Blob Storage calls.
+
+Every gunicorn worker and translation worker on a host draws from the same
+token bucket and the same pool of concurrency slots per Azure service, so
+bursts from several processes are smoothed out here instead of tripping Azure
+429 throttling. State lives in a small SQLite file (SQLiteLimiterBackend); any
+object with the same methods (e.g. a Redis-backed one) can be swapped in to
+share limits across hosts.
+"""
+
+import asyncio
+import contextlib
+import functools
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+from .config import get_config
+
+logger = logging.getLogger(__name__)
+
+TRANSLATOR_BUCKET = 'translator'
+STORAGE_BUCKET = 'storage'
+
+
+class BucketLimits:
+    """
+    Limits applied to one bucket of calls.
+
+    Args:
+        rate (float): Sustained calls per second
+        burst (int): Calls that may be made back to back before the rate applies
+        max_concurrency (int): Calls allowed in flight at the same time
+    """
+
+    def __init__(self, rate: float, burst: int, max_concurrency: int):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1 or max_concurrency < 1:
+            raise ValueError("burst and max_concurrency must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self.max_concurrency = max_concurrency
+
+
+class SQLiteLimiterBackend:
+    """Limiter state shared between processes through a SQLite file."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS limiter_buckets (
+            name TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS limiter_slots (
+            bucket TEXT NOT NULL,
+            holder TEXT PRIMARY KEY,
+            acquired_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS limiter_stats (
+            name TEXT PRIMARY KEY,
+            calls INTEGER NOT NULL DEFAULT 0,
+            delayed_calls INTEGER NOT NULL DEFAULT 0,
+            total_wait_seconds REAL NOT NULL DEFAULT 0,
+            max_wait_seconds REAL NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, re-opened after a fork so gunicorn workers never share one
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.executescript(self.SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    # How long to wait before retrying when every concurrency slot is held
+    SLOT_RETRY_SECONDS = 0.05
+
+    def admit(self, bucket: str, rate: float, burst: int, limit: int, holder: str, stale_after: float,
+              waited: float) -> float:
+        """
+        Admit one call in a single transaction: take a token, take a concurrency slot for `holder` and add the
+        call and the `waited` seconds it spent being throttled to the bucket's stats. Nothing changes unless
+        all three happen. Slots older than `stale_after` seconds are assumed to belong to a crashed process
+        and are reclaimed.
+
+        Returns:
+            float: 0 if the call was admitted, otherwise seconds to wait before asking again
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                'SELECT tokens, updated_at FROM limiter_buckets WHERE name = ?', (bucket,)
+            ).fetchone()
+            tokens = float(burst) if row is None else min(float(burst), row[0] + (now - row[1]) * rate)
+            if tokens < 1:
+                return (1 - tokens) / rate
+
+            conn.execute(
+                'DELETE FROM limiter_slots WHERE bucket = ? AND acquired_at < ?', (bucket, now - stale_after)
+            )
+            in_flight = conn.execute(
+                'SELECT COUNT(*) FROM limiter_slots WHERE bucket = ?', (bucket,)
+            ).fetchone()[0]
+            if in_flight >= limit:
+                return self.SLOT_RETRY_SECONDS
+
+            conn.execute(
+                'INSERT INTO limiter_buckets (name, tokens, updated_at) VALUES (?, ?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated_at = excluded.updated_at',
+                (bucket, tokens - 1, now)
+            )
+            conn.execute(
+                'INSERT INTO limiter_slots (bucket, holder, acquired_at) VALUES (?, ?, ?)', (bucket, holder, now)
+            )
+            conn.execute(
+                'INSERT INTO limiter_stats (name, calls, delayed_calls, total_wait_seconds, max_wait_seconds) '
+                'VALUES (?, 1, ?, ?, ?) '
+                'ON CONFLICT(name) DO UPDATE SET calls = calls + 1, '
+                'delayed_calls = delayed_calls + excluded.delayed_calls, '
+                'total_wait_seconds = total_wait_seconds + excluded.total_wait_seconds, '
+                'max_wait_seconds = MAX(max_wait_seconds, excluded.max_wait_seconds)',
+                (bucket, 1 if waited > 0 else 0, waited, waited)
+            )
+        return 0.0
+
+    def release_slot(self, bucket: str, holder: str):
+        """Give back a concurrency slot."""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM limiter_slots WHERE bucket = ? AND holder = ?', (bucket, holder))
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-bucket call counts, wait times and calls currently in flight."""
+        conn = self._connection()
+        in_flight = dict(conn.execute('SELECT bucket, COUNT(*) FROM limiter_slots GROUP BY bucket').fetchall())
+        stats = {}
+        for name, calls, delayed, total_wait, max_wait in conn.execute(
+            'SELECT name, calls, delayed_calls, total_wait_seconds, max_wait_seconds FROM limiter_stats'
+        ):
+            stats[name] = {
+                'calls': calls,
+                'delayed_calls': delayed,
+                'total_wait_seconds': round(total_wait, 3),
+                'avg_wait_seconds': round(total_wait / calls, 3) if calls else 0.0,
+                'max_wait_seconds': round(max_wait, 3),
+                'in_flight': in_flight.get(name, 0),
+            }
+        return stats
+
+    def reset_stats(self):
+        """Clear accumulated wait-time stats."""
+        with self._transaction() as conn:
+            conn.execute('DELETE FROM limiter_stats')
+
+
+class RateLimiter:
+    """
+    Token bucket plus concurrency slots, one pair per named bucket.
+
+    If the backend fails (e.g. the state file is unavailable), calls go through unthrottled
+    rather than failing the request.
+
+    Args:
+        backend: Shared state store (see SQLiteLimiterBackend)
+        limits (Dict[str, BucketLimits]): Limits per bucket name
+        stale_slot_seconds (float): Age after which a slot held by a crashed process is reclaimed
+    """
+
+    def __init__(self, backend: Any, limits: Dict[str, BucketLimits], stale_slot_seconds: float = 300.0):
+        self.backend = backend
+        self.limits = limits
+        self.stale_slot_seconds = stale_slot_seconds
+
+    @contextlib.contextmanager
+    def acquire(self, bucket: str) -> Iterator[None]:
+        """Block until the bucket allows another call, and hold a concurrency slot for its duration."""
+        holder = self._enter(bucket)
+        try:
+            yield
+        finally:
+            if holder:
+                try:
+                    self.backend.release_slot(bucket, holder)
+                except sqlite3.Error as e:
+                    logger.warning(f"Rate limiter could not release slot for {bucket}: {str(e)}")
+
+    @contextlib.asynccontextmanager
+    async def acquire_async(self, bucket: str) -> AsyncIterator[None]:
+        """acquire() for coroutines: the waiting and the shared-state bookkeeping happen off the event loop."""
+        holder = await asyncio.to_thread(self._enter, bucket)
+        try:
+            yield
+        finally:
+            if holder:
+                try:
+                    await asyncio.to_thread(self.backend.release_slot, bucket, holder)
+                except sqlite3.Error as e:
+                    logger.warning(f"Rate limiter could not release slot for {bucket}: {str(e)}")
+
+    def _enter(self, bucket: str) -> Optional[str]:
+        limits = self.limits[bucket]
+        holder = uuid.uuid4().hex
+        started = time.monotonic()
+        waited = 0.0
+        try:
+            # Token, slot and stats are taken together, so a failure can't leave a slot held by nobody
+            while True:
+                wait = self.backend.admit(
+                    bucket, limits.rate, limits.burst, limits.max_concurrency, holder, self.stale_slot_seconds, waited
+                )
+                if not wait:
+                    break
+                time.sleep(wait)
+                # Only time spent sleeping counts as waiting; the bookkeeping itself is not throttling
+                waited = time.monotonic() - started
+        except sqlite3.Error as e:
+            logger.warning(f"Rate limiter unavailable, not throttling {bucket} call: {str(e)}")
+            return None
+
+        if waited >= 1:
+            logger.info(f"Rate limiter delayed {bucket} call by {waited:.2f}s")
+        return holder
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-bucket wait-time stats, shared by every process using the same backend."""
+        return self.backend.stats()
+
+
+class RateLimitedClient:
+    """
+    Proxy for an Azure SDK client that routes every public method call through a limiter bucket.
+    Sub-clients obtained through get_container_client()/get_blob_client() are limited the same way.
+
+    Paged results (e.g. list_blobs) are fetched lazily by the SDK, so only the initial call is limited.
+    """
+
+    SUBCLIENT_FACTORIES = ('get_container_client', 'get_blob_client')
+    UNLIMITED_METHODS = ('close',)
+
+    def __init__(self, client: Any, limiter: RateLimiter, bucket: str):
+        self._client = client
+        self._limiter = limiter
+        self._bucket = bucket
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._client, name)
+        if name.startswith('_') or not callable(attr) or name in self.UNLIMITED_METHODS:
+            return attr
+
+        if name in self.SUBCLIENT_FACTORIES:
+            @functools.wraps(attr)
+            def subclient(*args, **kwargs):
+                return type(self)(attr(*args, **kwargs), self._limiter, self._bucket)
+            return subclient
+
+        return self._limit(attr)
+
+    def _limit(self, method: Any) -> Any:
+        @functools.wraps(method)
+        def limited(*args, **kwargs):
+            with self._limiter.acquire(self._bucket):
+                return method(*args, **kwargs)
+        return limited
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._client!r}, bucket={self._bucket!r})"
+
+
+class AsyncRateLimitedClient(RateLimitedClient):
+    """
+    RateLimitedClient for the azure .aio clients. Coroutine methods wait for the limiter without
+    blocking the event loop; other methods (e.g. list_blobs, which only builds a pager) pass through.
+    """
+
+    def _limit(self, method: Any) -> Any:
+        if not inspect.iscoroutinefunction(method):
+            return method
+
+        @functools.wraps(method)
+        async def limited(*args, **kwargs):
+            async with self._limiter.acquire_async(self._bucket):
+                return await method(*args, **kwargs)
+        return limited
+
+
+_rate_limiter: Optional[RateLimiter] = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """Get the process-wide rate limiter built from TranslationConfig, or None when rate limiting is disabled."""
+    global _rate_limiter
+    config = get_config()
+    if not config.rate_limit_enabled:
+        return None
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(
+                SQLiteLimiterBackend(config.rate_limit_db_path),
+                {
+                    TRANSLATOR_BUCKET: BucketLimits(
+                        config.translator_requests_per_second,
+                        config.translator_burst,
+                        config.translator_max_concurrency,
+                    ),
+                    STORAGE_BUCKET: BucketLimits(
+                        config.storage_requests_per_second,
+                        config.storage_burst,
+                        config.storage_max_concurrency,
+                    ),
+                },
+            )
+    return _rate_limiter
+
+
+def rate_limited(client: Any, bucket: str, limiter: Optional[RateLimiter] = None) -> Any:
+    """Wrap an Azure SDK client with the rate limiter, or return it unchanged when rate limiting is disabled."""
+    limiter = limiter or get_rate_limiter()
+    if client is None or limiter is None:
+        return client
+    return RateLimitedClient(client, limiter, bucket)
+
+
+def rate_limited_async(client: Any, bucket: str, limiter: Optional[RateLimiter] = None) -> Any:
+    """rate_limited() for an azure .aio client."""
+    limiter = limiter or get_rate_limiter()
+    if client is None or limiter is None:
+        return client
+    return AsyncRateLimitedClient(client, limiter, bucket)
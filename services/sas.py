@@ -0,0 +1,66 @@
+"""
+Short-lived, blob-scoped SAS URLs so browsers can talk to Blob Storage directly.
+
+Tokens are signed locally with the storage account key from
+AZURE_STORAGE_CONNECTION_STRING (no Azure call is made), grant only the
+permissions asked for on a single blob, and expire after a few minutes.
+"""
+
+import datetime
+import logging
+import urllib.parse
+from typing import Any, Optional
+
+from azure.storage.blob import BlobSasPermissions, generate_blob_sas
+
+logger = logging.getLogger(__name__)
+
+# Tolerate clock differences between this host and Azure
+CLOCK_SKEW = datetime.timedelta(minutes=5)
+
+
+def blob_sas_url(blob_service_client: Any, container_name: str, blob_name: str,
+                 permission: BlobSasPermissions, ttl_seconds: int,
+                 content_disposition: Optional[str] = None,
+                 content_type: Optional[str] = None) -> str:
+    """
+    Build a SAS URL granting `permission` on one blob for `ttl_seconds`.
+
+    Args:
+        blob_service_client: Client created from a connection string with an AccountKey
+        container_name (str): Container of the blob
+        blob_name (str): Blob the token is scoped to
+        permission (BlobSasPermissions): What the holder may do with the blob
+        ttl_seconds (int): Lifetime of the token
+        content_disposition (str): Content-Disposition Azure returns when the URL is read
+        content_type (str): Content-Type Azure returns when the URL is read
+
+    Returns:
+        str: The blob URL with the SAS query string
+
+    Raises:
+        ValueError: If the client has no account key to sign with
+    """
+    credential = getattr(blob_service_client, 'credential', None)
+    account_key = getattr(credential, 'account_key', None)
+    if not account_key:
+        raise ValueError("Storage credential has no account key; SAS URLs cannot be signed")
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    account_url = blob_service_client.url.rstrip('/')
+    token = generate_blob_sas(
+        account_name=blob_service_client.account_name,
+        container_name=container_name,
+        blob_name=blob_name,
+        account_key=account_key,
+        permission=permission,
+        start=now - CLOCK_SKEW,
+        expiry=now + datetime.timedelta(seconds=ttl_seconds),
+        # Local emulators (Azurite) only speak http
+        protocol='https' if account_url.startswith('https://') else None,
+        content_disposition=content_disposition,
+        content_type=content_type,
+    )
+    blob_path = urllib.parse.quote(f"{container_name}/{blob_name}")
+    logger.debug(f"Issued {permission} SAS for {container_name}/{blob_name} valid {ttl_seconds}s")
+    return f"{account_url}/{blob_path}?{token}"
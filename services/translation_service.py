@@ -4,15 +4,21 @@ Document Translation Service Library
 This module provides a reusable service for translating documents using Azure Cognitive Services.
 """
 
-from azure.core.credentials import AzureKeyCredential
-from azure.ai.translation.document import DocumentTranslationClient, DocumentTranslationInput, TranslationTarget
-from azure.storage.blob import BlobServiceClient
+from azure.ai.translation.document import DocumentTranslationInput, TranslationTarget
 from azure.core.exceptions import ResourceNotFoundError
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
+import hashlib
 import logging
 import os
+import time
+import urllib.parse
 from datetime import datetime, timedelta, timezone
 from .config import get_config
+from .blob_listing import BlobListingSnapshot
+from .blob_operations import CopyRequest, bulk_delete_blobs, copy_blobs
+from .clients import get_client_registry
+from .polling import AdaptivePollingStrategy
+from .rate_limit import RateLimiter, STORAGE_BUCKET, TRANSLATOR_BUCKET, rate_limited
 
 
 class DocumentTranslationService:
@@ -20,13 +26,46 @@ class DocumentTranslationService:
     A service class for handling document translation using Azure Document Translation API.
     """
     
-    def __init__(self, key: str, endpoint: str):
+    # How often on_progress callbacks fire while waiting on a translation operation
+    PROGRESS_INTERVAL_SECONDS = 15
+    
+    # Status polling is driven by polling_strategy. The SDK poller still runs its polling method on a daemon
+    # thread; with this interval that thread makes one status request an hour, outside the rate limiter, and
+    # exits once it sees the operation finished, so it never outlives TranslationConfig.max_operation_seconds
+    # by more than an hour (operations older than that are canceled by _wait_for_operation)
+    SDK_POLLING_INTERVAL_SECONDS = 3600
+    
+    # Operation states after which Azure no longer changes the operation
+    TERMINAL_STATUSES = ('Succeeded', 'Failed', 'Canceled', 'ValidationFailed')
+    
+    def __init__(
+        self,
+        key: str,
+        endpoint: str,
+        translation_cache: Optional[Any] = None,
+        polling_strategy: Optional[AdaptivePollingStrategy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        blob_inventory: Optional[Any] = None,
+        deletion_queue: Optional[Any] = None
+    ):
         """
         Initialize the DocumentTranslationService.
         
         Args:
             key (str): Azure Cognitive Services API key
             endpoint (str): Azure Cognitive Services endpoint URL
+            translation_cache (optional): Cache of translated documents keyed by source content hash and
+                languages. Must provide container_name, lookup(), record_hit(), store() and invalidate()
+                (see upload.translation_cache.TranslationCache). Caching is skipped when not provided.
+            polling_strategy (AdaptivePollingStrategy, optional): Delays between operation status calls.
+                Defaults to the strategy configured in TranslationConfig.
+            rate_limiter (RateLimiter, optional): Limiter shared with other processes that throttles
+                Translator and Storage calls. Defaults to the one configured in TranslationConfig.
+            blob_inventory (optional): Database record of the blobs in the source, target and cache containers,
+                kept up to date by this service and used instead of listing per-user prefixes
+                (see upload.blob_inventory.BlobInventory). Containers are listed when not provided.
+            deletion_queue (optional): Queue that blob deletions are handed to instead of deleting inline; blobs
+                queued there are treated as already deleted (see upload.deletion_queue.DeletionQueue).
         """
         if not key:
             raise ValueError("Azure Cognitive Services API key is required")
@@ -35,12 +74,20 @@ class DocumentTranslationService:
             
         self.key = key
         self.endpoint = endpoint
-        self.client = DocumentTranslationClient(endpoint, AzureKeyCredential(key))
+        # Clients come from the process-wide registry so HTTP connections are reused across services
+        registry = get_client_registry()
+        self.client = rate_limited(registry.translation_client(endpoint, key), TRANSLATOR_BUCKET, rate_limiter)
+        self.translation_cache = translation_cache
+        self.blob_inventory = blob_inventory
+        self.deletion_queue = deletion_queue
+        self.polling_strategy = polling_strategy or AdaptivePollingStrategy.from_config()
         self.logger = logging.getLogger(__name__)
           # Initialize blob service client for target container management
         connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
         if connection_string:
-            self.blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+            self.blob_service_client = rate_limited(
+                registry.blob_service_client(connection_string), STORAGE_BUCKET, rate_limiter
+            )
         else:
             self.blob_service_client = None
             self.logger.warning("Azure Storage connection string not found - target file cleanup will be skipped")
@@ -51,7 +98,10 @@ class DocumentTranslationService:
         target_uri: str, 
         target_language: str,
         source_language: Optional[str] = None,
-        clear_target: bool = True
+        clear_target: bool = True,
+        on_submitted: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        source_prefix: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Translate documents from source container to target container.
@@ -62,6 +112,11 @@ class DocumentTranslationService:
             target_language (str): Target language code (e.g., 'en', 'es', 'fr')
             source_language (str, optional): Source language code. If not provided, auto-detection is used.
             clear_target (bool, optional): Whether to clear target container before translation. Defaults to True.
+            on_submitted (callable, optional): Called with the poller as soon as Azure accepts the operation,
+                before waiting for completion (e.g. to record the operation ID on a job).
+            on_progress (callable, optional): Called with the latest operation status periodically while the operation is running.
+            source_prefix (str, optional): Only translate source blobs whose names start with this prefix
+                (e.g. '<user_id_hash>/'). Translated blobs keep the same relative path in the target container.
         
         Returns:
             Dict[str, Any]: Translation results including status, document details, and translated documents
@@ -82,112 +137,660 @@ class DocumentTranslationService:
             translation_target = TranslationTarget(target_url=target_uri, language=target_language)
             
             # Create document translation input
+            input_kwargs = {}
             if source_language:
-                # If source language is specified, include it
-                document_translation_input = DocumentTranslationInput(
-                    source_url=source_uri,
-                    targets=[translation_target],
-                    source_language=source_language
-                )
-            else:
-                # Auto-detect source language
-                document_translation_input = DocumentTranslationInput(
-                    source_url=source_uri,
-                    targets=[translation_target]
-                )
+                # If source language is specified, include it (otherwise it is auto-detected)
+                input_kwargs['source_language'] = source_language
+            if source_prefix:
+                # Restrict the batch to blobs under this prefix instead of the whole container
+                input_kwargs['prefix'] = source_prefix
+                self.logger.info(f"Source prefix filter: {source_prefix}")
+            
+            document_translation_input = DocumentTranslationInput(
+                source_url=source_uri,
+                targets=[translation_target],
+                **input_kwargs
+            )
             
             # Start the translation operation
-            poller = self.client.begin_translation([document_translation_input])
-            
-            # Wait for completion and get results
-            result = poller.result()
-            
-            # Debug: Log poller details attributes
-            self.logger.info(f"Poller details attributes: {[attr for attr in dir(poller.details) if not attr.startswith('_')]}")
-            self.logger.info(f"Poller details object: {poller.details}")
-            
-            # Safely get document counts with defaults
-            total_docs = getattr(poller.details, 'documents_total_count', None)
-            failed_docs = getattr(poller.details, 'documents_failed_count', None)
-            succeeded_docs = getattr(poller.details, 'documents_succeeded_count', None)
-            
-            self.logger.info(f"Document counts - Total: {total_docs}, Failed: {failed_docs}, Succeeded: {succeeded_docs}")
-            
-            # Prepare response data
-            response = {
-                'status': poller.status(),
-                'created_on': poller.details.created_on,
-                'last_updated_on': poller.details.last_updated_on,
-                'total_documents': total_docs,
-                'failed_documents': failed_docs,
-                'succeeded_documents': succeeded_docs,
-                'documents': []
-            }            # Process individual document results
-            succeeded_count = 0
-            failed_count = 0
-            total_count = 0
-            
-            for document in result:
-                total_count += 1
-                if document.status == 'Succeeded':
-                    succeeded_count += 1
-                else:
-                    failed_count += 1
-                    
-                # Extract filename from source document URL
-                source_url = document.source_document_url if hasattr(document, 'source_document_url') else None
-                translated_url = document.translated_document_url if document.status == 'Succeeded' else None
-                
-                source_filename = self._extract_filename_from_url(source_url)
-                translated_filename = self._extract_filename_from_url(translated_url)
-                
-                # Try alternative filename extraction methods if URLs don't work
-                if not source_filename and hasattr(document, 'source_document_name'):
-                    source_filename = document.source_document_name
-                
-                if not translated_filename and hasattr(document, 'translated_document_name'):
-                    translated_filename = document.translated_document_name
-                
-                # Log for debugging
-                self.logger.info(f"Document ID: {document.id}")
-                self.logger.info(f"Source URL: {source_url}")
-                self.logger.info(f"Translated URL: {translated_url}")
-                self.logger.info(f"Source filename: {source_filename}")
-                self.logger.info(f"Translated filename: {translated_filename}")
-                
-                # Log all available document attributes for debugging
-                self.logger.info(f"Document attributes: {[attr for attr in dir(document) if not attr.startswith('_')]}")
-                
-                doc_info = {
-                    'id': document.id,
-                    'status': document.status,
-                    'source_filename': source_filename,
-                    'translated_filename': translated_filename,
-                    'source_document_url': source_url,
-                    'translated_document_url': translated_url,
-                    'translated_to': document.translated_to if document.status == 'Succeeded' else None,
-                    'error': {
-                        'code': document.error.code if hasattr(document, 'error') and document.error else None,
-                        'message': document.error.message if hasattr(document, 'error') and document.error else None
-                    } if document.status != 'Succeeded' else None
-                }
-                response['documents'].append(doc_info)
+            return self._submit_translation([document_translation_input], on_submitted, on_progress)
             
-            # Use actual counts if poller details don't have them
-            if response['total_documents'] is None:
-                response['total_documents'] = total_count
-            if response['succeeded_documents'] is None:
-                response['succeeded_documents'] = succeeded_count
-            if response['failed_documents'] is None:
-                response['failed_documents'] = failed_count
+        except Exception as e:
+            self.logger.error(f"Translation operation failed: {str(e)}")
+            raise Exception(f"Document translation failed: {str(e)}")
+    
+    def _submit_translation(
+        self,
+        inputs: List[DocumentTranslationInput],
+        on_submitted: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None
+    ) -> Dict[str, Any]:
+        """Submit translation inputs as one Azure operation and wait for its result."""
+        poller = self.client.begin_translation(inputs, polling_interval=self.SDK_POLLING_INTERVAL_SECONDS)
+        self.logger.info(f"Translation operation submitted: {poller.id} ({len(inputs)} input(s))")
+        
+        if on_submitted:
+            on_submitted(poller)
+        
+        return self._collect_translation_result(poller.id, on_progress=on_progress)
+    
+    def _translated_blob_name(self, user_id_hash: str, blob_name: str, language: str) -> str:
+        """Target blob for a user's source blob: '<user_id_hash>/report.pdf' -> '<user_id_hash>/<lang>/report.pdf'."""
+        user_prefix = f"{user_id_hash}/"
+        relative_name = blob_name[len(user_prefix):] if blob_name.startswith(user_prefix) else blob_name
+        return f"{user_prefix}{language}/{relative_name}"
+    
+    def _build_user_inputs(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        languages_by_blob: Dict[str, List[str]],
+        source_language: Optional[str] = None
+    ) -> List[DocumentTranslationInput]:
+        """Build one File input per source blob, with a target per language under '<user_id_hash>/<lang>/'."""
+        input_kwargs = {'source_language': source_language} if source_language else {}
+        
+        inputs = []
+        for blob_name, languages in languages_by_blob.items():
+            targets = [
+                TranslationTarget(
+                    target_url=self._blob_url(target_uri, self._translated_blob_name(user_id_hash, blob_name, language)),
+                    language=language
+                )
+                for language in languages
+            ]
+            inputs.append(DocumentTranslationInput(
+                source_url=self._blob_url(source_uri, blob_name),
+                targets=targets,
+                storage_type='File',
+                **input_kwargs
+            ))
+        return inputs
+    
+    def translate_documents_for_users(
+        self,
+        user_requests: List[Dict[str, Any]],
+        on_submitted: Optional[Callable[[Any, List[str]], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        cleanup_old_target_hours: int = 24,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate documents for several users in a single Azure operation using default container URIs.
+        
+        Each user's blobs become their own inputs in one Azure operation, and the per-document
+        results are split back per user, so many small requests share one operation's queueing and polling.
+        
+        Args:
+            user_requests (List[Dict[str, Any]]): One entry per user with keys 'user_id_hash',
+                'target_languages', and optionally 'source_language', 'clear_target', 'cleanup_source'
+                and 'content_hashes' (SHA-256 of source blobs already known, keyed by blob name).
+                Each user may appear only once.
+            on_submitted (callable, optional): Called with the poller and the user_id_hashes included in the
+                operation once Azure accepts it (users without source files are left out).
+            on_progress (callable, optional): Called with the latest operation status periodically while the operation is running.
+            cleanup_old_target_hours (int, optional): Hours threshold for cleaning up old target files. Defaults to 24 hours.
+            on_cached (callable, optional): Called before submission with each submitted user's user_id_hash and cache
+                state, to be passed back to resume_translation_for_user() if the operation is resumed elsewhere.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Results keyed by user_id_hash, each shaped like translate_documents_user_specific()
+        """
+        source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
+        target_uri = os.getenv('AZURE_TRANSLATION_TARGET_URI')
+        
+        if not source_uri or not target_uri:
+            raise ValueError("AZURE_TRANSLATION_SOURCE_URI and AZURE_TRANSLATION_TARGET_URI must be set")
+        
+        return self._translate_for_users(
+            source_uri, target_uri, user_requests,
+            on_submitted=on_submitted,
+            on_progress=on_progress,
+            cleanup_old_target_hours=cleanup_old_target_hours,
+            on_cached=on_cached
+        )
+    
+    def _translate_for_users(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_requests: List[Dict[str, Any]],
+        on_submitted: Optional[Callable[[Any, List[str]], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        cleanup_old_target_hours: int = 24,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Shared implementation of translate_documents_for_users() and translate_documents_with_cleanup_for_user().
+        
+        Translations found in the translation cache are copied into place instead of being submitted;
+        everything else is submitted as one Azure operation and successful results are added to the cache.
+        If Azure rejects that submission, each user is resubmitted as their own operation before failing.
+        """
+        results = {}
+        users = {}
+        inputs = []
+        target_paths = []
+        # Each user prefix is listed once for the whole request, however many phases look at it
+        snapshot = BlobListingSnapshot(self.blob_service_client) if self.blob_service_client else None
+        target_container = self._extract_container_name_from_uri(target_uri)
+        for request in user_requests:
+            user_id_hash = request['user_id_hash']
+            target_languages = list(request['target_languages'])
+            source_language = request.get('source_language')
+            old_target_cleanup_result, source_blobs = self._prepare_user_translation(
+                source_uri, target_uri, user_id_hash, request.get('clear_target', True), cleanup_old_target_hours,
+                snapshot=snapshot
+            )
+            if not source_blobs:
+                results[user_id_hash] = self._no_source_files_result(user_id_hash, old_target_cleanup_result)
+                continue
             
-            self.logger.info(f"Translation completed. Status: {response['status']}")
-            self.logger.info(f"Total: {response['total_documents']}, Succeeded: {response['succeeded_documents']}, Failed: {response['failed_documents']}")
+            cached_documents, languages_by_blob, content_hashes = self._apply_cached_translations(
+                source_uri, target_uri, user_id_hash, source_blobs, target_languages, source_language,
+                request.get('content_hashes')
+            )
+            if snapshot and cached_documents:
+                snapshot.invalidate(target_container, f"{user_id_hash}/")
+            users[user_id_hash] = {
+                'request': request,
+                'old_target_cleanup': old_target_cleanup_result,
+                'cached_documents': cached_documents,
+                'content_hashes': content_hashes,
+                'submitted': bool(languages_by_blob),
+                'inputs': self._build_user_inputs(source_uri, target_uri, user_id_hash, languages_by_blob, source_language),
+                'cache': {
+                    'hits': len(cached_documents),
+                    'misses': len(source_blobs) * len(target_languages) - len(cached_documents)
+                } if self.translation_cache else None
+            }
+            inputs.extend(users[user_id_hash]['inputs'])
+            target_paths.extend(
+                self._translated_blob_name(user_id_hash, blob_name, language)
+                for blob_name, languages in languages_by_blob.items() for language in languages
+            )
+        
+        submitted_results = {}
+        if inputs:
+            if self.deletion_queue and self.blob_service_client:
+                # Blobs queued for deletion are still in storage, and the translator refuses to overwrite a target
+                self._delete_blobs(
+                    target_container, self.blob_service_client.get_container_client(target_container), target_paths,
+                    snapshot=snapshot, inline=True
+                )
+            submitted_users = [user_id_hash for user_id_hash, user in users.items() if user['submitted']]
+            if on_cached:
+                for user_id_hash in submitted_users:
+                    if users[user_id_hash]['cache'] is not None:
+                        on_cached(user_id_hash, self._cache_state(users[user_id_hash]))
+            self.logger.info(f"Submitting {len(inputs)} document(s) for {len(submitted_users)} user(s) as one operation")
+            accepted = []
+            
+            def record_submission(poller):
+                accepted.append(poller.id)
+                if on_submitted:
+                    on_submitted(poller, submitted_users)
+            
+            errors = {}
+            try:
+                submitted_results = dict.fromkeys(
+                    submitted_users, self._submit_translation(inputs, record_submission, on_progress)
+                )
+            except Exception as e:
+                self.logger.error(f"Translation operation failed: {str(e)}")
+                if accepted or len(submitted_users) == 1:
+                    errors = dict.fromkeys(submitted_users, e)
+                else:
+                    # Azure rejected the batch as a whole (e.g. over one user's input), so one user can't fail the rest
+                    submitted_results, errors = self._submit_each_user(users, submitted_users, on_submitted, on_progress)
+            for user_id_hash, error in errors.items():
+                results[user_id_hash] = {
+                    'status': 'Failed',
+                    'success': False,
+                    'error': f"Document translation failed: {str(error)}",
+                    'user_id_hash': user_id_hash,
+                    'old_target_cleanup': users[user_id_hash]['old_target_cleanup']
+                }
+            # The translator has written into these users' target prefixes
+            if snapshot:
+                for user_id_hash in submitted_users:
+                    snapshot.invalidate(target_container, f"{user_id_hash}/")
+        
+        # Split the shared operation result back out to each user
+        for user_id_hash, user in users.items():
+            if user_id_hash in results:
+                continue
+            request = user['request']
+            if user['submitted']:
+                combined_result = submitted_results[user_id_hash]
+                user_result = dict(combined_result, documents=combined_result['documents'] + user['cached_documents'])
+            else:
+                self.logger.info(f"All translations for user {user_id_hash} served from the translation cache")
+                user_result = self._cached_translation_result(user['cached_documents'])
+            user_result['target_languages'] = list(request['target_languages'])
+            user_result = self._finalize_user_translation(
+                user_result, source_uri, user_id_hash, request.get('cleanup_source', False), snapshot=snapshot
+            )
+            # Counts describe this user's documents, not the whole shared operation
+            user_result['total_documents'] = len(user_result['documents'])
+            user_result['succeeded_documents'] = sum(1 for doc in user_result['documents'] if doc.get('status') == 'Succeeded')
+            user_result['failed_documents'] = user_result['total_documents'] - user_result['succeeded_documents']
+            user_result['old_target_cleanup'] = user['old_target_cleanup']
+            if user['cache'] is not None:
+                user_result['cache'] = user['cache']
+                if user['submitted']:
+                    self._cache_new_translations(
+                        source_uri, target_uri, user_id_hash, user_result['documents'],
+                        user['content_hashes'], request.get('source_language')
+                    )
+            results[user_id_hash] = user_result
+        
+        if snapshot:
+            self.logger.info(f"Blob listings for this request: {snapshot.list_calls}")
+        return results
+    
+    def _submit_each_user(
+        self,
+        users: Dict[str, Dict[str, Any]],
+        submitted_users: List[str],
+        on_submitted: Optional[Callable[[Any, List[str]], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Exception]]:
+        """Submit each user's inputs as their own operation after a shared submission was rejected; returns results and errors by user."""
+        self.logger.info(f"Resubmitting {len(submitted_users)} user(s) as separate operations")
+        results = {}
+        errors = {}
+        for user_id_hash in submitted_users:
+            def record_submission(poller, user_ids=[user_id_hash]):
+                if on_submitted:
+                    on_submitted(poller, user_ids)
             
-            return response
+            try:
+                results[user_id_hash] = self._submit_translation(users[user_id_hash]['inputs'], record_submission, on_progress)
+            except Exception as e:
+                self.logger.error(f"Translation operation for user {user_id_hash} failed: {str(e)}")
+                errors[user_id_hash] = e
+        return results, errors
+    
+    def _cache_state(self, user: Dict[str, Any]) -> Dict[str, Any]:
+        """What a resumed operation needs to return a submitted user's cache hits and cache their new translations."""
+        return {
+            'cached_documents': user['cached_documents'],
+            'content_hashes': user['content_hashes'],
+            'source_language': user['request'].get('source_language'),
+            'cache': user['cache']
+        }
+    
+    def _cached_translation_result(self, cached_documents: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Result for a request served entirely from the translation cache (no Azure operation)."""
+        now = datetime.now(timezone.utc)
+        return {
+            'operation_id': None,
+            'status': 'Succeeded',
+            'created_on': now,
+            'last_updated_on': now,
+            'total_documents': len(cached_documents),
+            'failed_documents': 0,
+            'succeeded_documents': len(cached_documents),
+            'documents': list(cached_documents)
+        }
+    
+    def _apply_cached_translations(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        source_blobs: List[str],
+        target_languages: List[str],
+        source_language: Optional[str] = None,
+        known_hashes: Optional[Dict[str, str]] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, List[str]], Dict[str, str]]:
+        """
+        Copy translations already in the cache into the user's target prefix.
+        
+        Returns:
+            Tuple: Per-document results for cache hits, the languages still to translate for each
+            source blob (blobs with nothing left are omitted), and the content hash of each source blob
+        """
+        languages_by_blob = {blob_name: list(target_languages) for blob_name in source_blobs}
+        if not self.translation_cache:
+            return [], languages_by_blob, {}
+        
+        content_hashes = self._source_content_hashes(source_uri, source_blobs, known_hashes or {})
+        target_container = self._extract_container_name_from_uri(target_uri)
+        
+        cached_documents = []
+        for blob_name in source_blobs:
+            content_hash = content_hashes.get(blob_name)
+            if not content_hash:
+                continue
+            for language in target_languages:
+                cache_blob_name = self.translation_cache.lookup(content_hash, source_language, language)
+                if not cache_blob_name:
+                    continue
+                target_blob_name = self._translated_blob_name(user_id_hash, blob_name, language)
+                if not self._copy_blob(self.translation_cache.container_name, cache_blob_name, target_container, target_blob_name):
+                    # The cached blob is gone; forget the entry and translate normally
+                    self.translation_cache.invalidate(content_hash, source_language, language)
+                    continue
+                
+                self.translation_cache.record_hit(content_hash, source_language, language)
+                self.logger.info(f"Translation cache hit for {blob_name} ({language})")
+                languages_by_blob[blob_name].remove(language)
+                translated_url = self._blob_url(target_uri, target_blob_name).split('?')[0]
+                cached_documents.append({
+                    'id': f"cache-{content_hash[:16]}-{language}",
+                    'status': 'Succeeded',
+                    'source_filename': blob_name.split('/')[-1],
+                    'translated_filename': target_blob_name.split('/')[-1],
+                    'source_document_url': self._blob_url(source_uri, blob_name).split('?')[0],
+                    'translated_document_url': translated_url,
+                    'translated_to': language,
+                    'translation_progress': 1.0,
+                    'characters_charged': 0,
+                    'cached': True,
+                    'error': None
+                })
+        
+        return cached_documents, {blob: langs for blob, langs in languages_by_blob.items() if langs}, content_hashes
+    
+    def _cache_new_translations(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        documents: List[Dict[str, Any]],
+        content_hashes: Dict[str, str],
+        source_language: Optional[str] = None
+    ):
+        """Copy freshly translated documents into the cache container and record them in the cache."""
+        # Map the source URLs Azure reports back to blob names
+        blob_by_url = {
+            urllib.parse.unquote(self._blob_url(source_uri, blob_name).split('?')[0]): blob_name
+            for blob_name in content_hashes
+        }
+        target_container = self._extract_container_name_from_uri(target_uri)
+        cache_container = self.translation_cache.container_name
+        container_ready = False
+        
+        for doc in documents:
+            if doc.get('cached') or doc.get('status') != 'Succeeded' or not doc.get('translated_to'):
+                continue
+            blob_name = blob_by_url.get(urllib.parse.unquote((doc.get('source_document_url') or '').split('?')[0]))
+            if not blob_name:
+                continue
+            language = doc['translated_to']
+            content_hash = content_hashes[blob_name]
+            cache_blob_name = f"{content_hash}/{source_language or 'auto'}/{language}/{blob_name.split('/')[-1]}"
             
+            try:
+                if not container_ready:
+                    container_ready = self._create_container_if_not_exists(cache_container)
+                target_blob_name = self._translated_blob_name(user_id_hash, blob_name, language)
+                if not self._copy_blob(target_container, target_blob_name, cache_container, cache_blob_name):
+                    continue
+                size_bytes = self.blob_service_client.get_blob_client(cache_container, cache_blob_name).get_blob_properties().size
+                self.translation_cache.store(content_hash, source_language, language, cache_blob_name, size_bytes)
+                self.logger.info(f"Cached translation of {blob_name} ({language}) as {cache_blob_name}")
+            except Exception as e:
+                self.logger.warning(f"Failed to cache translation of {blob_name} ({language}): {str(e)}")
+    
+    def _source_content_hashes(self, source_uri: str, source_blobs: List[str], known_hashes: Dict[str, str]) -> Dict[str, str]:
+        """SHA-256 of each source blob, using known hashes and downloading only the blobs without one."""
+        content_hashes = {blob_name: known_hashes[blob_name] for blob_name in source_blobs if known_hashes.get(blob_name)}
+        missing = [blob_name for blob_name in source_blobs if blob_name not in content_hashes]
+        if not missing or not self.blob_service_client:
+            return content_hashes
+        
+        container_client = self.blob_service_client.get_container_client(self._extract_container_name_from_uri(source_uri))
+        for blob_name in missing:
+            try:
+                digest = hashlib.sha256()
+                for chunk in container_client.download_blob(blob_name).chunks():
+                    digest.update(chunk)
+                content_hashes[blob_name] = digest.hexdigest()
+            except Exception as e:
+                self.logger.warning(f"Could not hash source blob {blob_name}: {str(e)}")
+        return content_hashes
+    
+    def _copy_blob(self, source_container: str, source_blob: str, target_container: str, target_blob: str) -> bool:
+        """Server-side copy of a blob within the storage account. Returns True once the copy has succeeded."""
+        if not self.blob_service_client:
+            return False
+        
+        # Copies inside one account normally finish immediately; wait briefly if not
+        result = copy_blobs(
+            self.blob_service_client,
+            [CopyRequest(source_container, source_blob, target_container, target_blob)],
+            timeout=30
+        )
+        if result['copied']:
+            self._record_blob(target_container, target_blob)
+        return bool(result['copied'])
+    
+    def _blob_url(self, container_uri: str, blob_name: str) -> str:
+        """Build the URL of a blob inside a container URI, keeping any SAS query string."""
+        base, _, query = container_uri.partition('?')
+        url = f"{base.rstrip('/')}/{urllib.parse.quote(blob_name, safe='/')}"
+        return f"{url}?{query}" if query else url
+    
+    def _wait_for_operation(
+        self,
+        operation_id: str,
+        on_progress: Optional[Callable[[Any], None]] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Poll a translation operation until it reaches a terminal state, following the polling strategy.
+        
+        Args:
+            operation_id (str): Azure translation operation ID
+            on_progress (callable, optional): Called with the latest TranslationStatus while the operation is
+                still running, whenever its document counts change and at least every PROGRESS_INTERVAL_SECONDS
+        
+        Returns:
+            Tuple[TranslationStatus, Dict[str, Any]]: Final operation status and polling metrics
+            ('status_calls', 'wait_seconds', 'detection_lag_seconds')
+        
+        Raises:
+            Exception: The operation has been running for longer than TranslationConfig.max_operation_seconds;
+                it is canceled first.
+        """
+        started = time.monotonic()
+        last_progress = started
+        last_counts = None
+        status_calls = 0
+        max_operation_seconds = get_config().max_operation_seconds
+        
+        for delay in self.polling_strategy.intervals():
+            time.sleep(delay)
+            status = self.client.get_translation_status(operation_id)
+            status_calls += 1
+            if status.status in self.TERMINAL_STATUSES:
+                break
+            
+            if self._operation_overdue(status, max_operation_seconds):
+                try:
+                    self.client.cancel_translation(operation_id)
+                except Exception as e:
+                    self.logger.warning(f"Could not cancel overdue operation {operation_id}: {str(e)}")
+                raise Exception(f"Translation operation {operation_id} did not finish within {max_operation_seconds:g} seconds")
+            
+            # Report as soon as any document changes state so progress reaches users without delay
+            counts = (
+                status.status,
+                status.documents_succeeded_count,
+                status.documents_failed_count,
+                status.documents_in_progress_count,
+            )
+            if on_progress and (counts != last_counts or time.monotonic() - last_progress >= self.PROGRESS_INTERVAL_SECONDS):
+                on_progress(status)
+                last_progress = time.monotonic()
+                last_counts = counts
+        
+        # How long after Azure finished the operation we noticed it
+        detection_lag = None
+        if status.last_updated_on:
+            detection_lag = max(0.0, (datetime.now(timezone.utc) - status.last_updated_on).total_seconds())
+        
+        metrics = {
+            'status_calls': status_calls,
+            'wait_seconds': round(time.monotonic() - started, 3),
+            'detection_lag_seconds': round(detection_lag, 3) if detection_lag is not None else None,
+        }
+        self.logger.info(
+            f"Operation {operation_id} reached {status.status} after {status_calls} status call(s), "
+            f"detection lag {metrics['detection_lag_seconds']}s"
+        )
+        return status, metrics
+    
+    def _operation_overdue(self, status: Any, max_operation_seconds: float) -> bool:
+        """Whether an operation has been running longer than allowed, counted from its creation in Azure so resumes don't restart the clock."""
+        if not max_operation_seconds or not status.created_on:
+            return False
+        return (datetime.now(timezone.utc) - status.created_on).total_seconds() > max_operation_seconds
+    
+    def _collect_translation_result(self, operation_id: str, on_progress: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
+        """
+        Wait for a submitted (or resumed) translation operation and build the result dictionary.
+        
+        Args:
+            operation_id (str): Azure translation operation ID
+            on_progress (callable, optional): Called with the latest operation status while the operation is still running
+        
+        Returns:
+            Dict[str, Any]: Translation results including status, per-document details and polling metrics
+        
+        Raises:
+            Exception: If the operation failed, was canceled or failed validation
+        """
+        details, polling_metrics = self._wait_for_operation(operation_id, on_progress=on_progress)
+        if details.status != 'Succeeded':
+            error_message = details.error.message if details.error else 'no error details'
+            raise Exception(f"Translation operation {details.status}: {error_message}")
+        
+        result = self.client.list_document_statuses(operation_id)
+        
+        # Safely get document counts with defaults
+        total_docs = getattr(details, 'documents_total_count', None)
+        failed_docs = getattr(details, 'documents_failed_count', None)
+        succeeded_docs = getattr(details, 'documents_succeeded_count', None)
+        
+        self.logger.info(f"Document counts - Total: {total_docs}, Failed: {failed_docs}, Succeeded: {succeeded_docs}")
+        
+        # Prepare response data
+        response = {
+            'operation_id': operation_id,
+            'status': details.status,
+            'created_on': details.created_on,
+            'last_updated_on': details.last_updated_on,
+            'total_documents': total_docs,
+            'failed_documents': failed_docs,
+            'succeeded_documents': succeeded_docs,
+            'polling': polling_metrics,
+            'documents': []
+        }
+        
+        # Process individual document results
+        succeeded_count = 0
+        failed_count = 0
+        total_count = 0
+        
+        for document in result:
+            total_count += 1
+            if document.status == 'Succeeded':
+                succeeded_count += 1
+            else:
+                failed_count += 1
+        
+            doc_info = self._document_info(document)
+            response['documents'].append(doc_info)
+            
+            if doc_info['translated_document_url'] and self.blob_inventory:
+                # Translator output: https://account/<container>/<blob>; the size is filled in by reconciliation
+                container_name, _, blob_name = urllib.parse.unquote(
+                    urllib.parse.urlparse(doc_info['translated_document_url']).path
+                ).strip('/').partition('/')
+                self._record_blob(container_name, blob_name, last_modified=document.last_updated_on)
+        
+        # Use actual counts if operation details don't have them
+        if response['total_documents'] is None:
+            response['total_documents'] = total_count
+        if response['succeeded_documents'] is None:
+            response['succeeded_documents'] = succeeded_count
+        if response['failed_documents'] is None:
+            response['failed_documents'] = failed_count
+        
+        self.logger.info(f"Translation completed. Status: {response['status']}")
+        self.logger.info(f"Total: {response['total_documents']}, Succeeded: {response['succeeded_documents']}, Failed: {response['failed_documents']}")
+        
+        return response
+
+    def _document_info(self, document: Any) -> Dict[str, Any]:
+        """Per-document result entry for a DocumentStatus reported by Azure."""
+        # Extract filename from source document URL
+        source_url = document.source_document_url if hasattr(document, 'source_document_url') else None
+        translated_url = document.translated_document_url if document.status == 'Succeeded' else None
+    
+        source_filename = self._extract_filename_from_url(source_url)
+        translated_filename = self._extract_filename_from_url(translated_url)
+    
+        # Try alternative filename extraction methods if URLs don't work
+        if not source_filename and hasattr(document, 'source_document_name'):
+            source_filename = document.source_document_name
+    
+        if not translated_filename and hasattr(document, 'translated_document_name'):
+            translated_filename = document.translated_document_name
+    
+        # Log for debugging
+        self.logger.info(f"Document ID: {document.id}")
+        self.logger.info(f"Source URL: {source_url}")
+        self.logger.info(f"Translated URL: {translated_url}")
+        self.logger.info(f"Source filename: {source_filename}")
+        self.logger.info(f"Translated filename: {translated_filename}")
+    
+        # Log all available document attributes for debugging
+        self.logger.info(f"Document attributes: {[attr for attr in dir(document) if not attr.startswith('_')]}")
+    
+        doc_info = {
+            'id': document.id,
+            'status': document.status,
+            'source_filename': source_filename,
+            'translated_filename': translated_filename,
+            'source_document_url': source_url,
+            'translated_document_url': translated_url,
+            'translated_to': document.translated_to if document.status == 'Succeeded' else None,
+            'translation_progress': document.translation_progress,
+            'characters_charged': document.characters_charged,
+            'created_on': document.created_on,
+            'last_updated_on': document.last_updated_on,
+            'error': {
+                'code': document.error.code if hasattr(document, 'error') and document.error else None,
+                'message': document.error.message if hasattr(document, 'error') and document.error else None
+            } if document.status != 'Succeeded' else None
+        }
+        return doc_info
+
+    def resume_translation(self, continuation_token: str, on_progress: Optional[Callable[[Any], None]] = None) -> Dict[str, Any]:
+        """
+        Resume waiting on a translation operation started earlier, possibly by another process.
+        
+        Args:
+            continuation_token (str): Token obtained from continuation_token() when the operation was submitted
+            on_progress (callable, optional): Called with the latest operation status while the operation is still running
+        
+        Returns:
+            Dict[str, Any]: Translation results, same shape as translate_documents()
+        
+        Raises:
+            Exception: If the operation cannot be resumed or fails
+        """
+        try:
+            self.logger.info(f"Resuming translation operation from continuation token: {continuation_token}")
+            # The Document Translation continuation token is the operation ID, so poll it directly
+            return self._collect_translation_result(continuation_token, on_progress=on_progress)
         except Exception as e:
-            self.logger.error(f"Translation operation failed: {str(e)}")
+            self.logger.error(f"Failed to resume translation operation: {str(e)}")
             raise Exception(f"Document translation failed: {str(e)}")
     
     def _clear_target_container(self, target_uri: str) -> bool:
@@ -218,23 +821,10 @@ class DocumentTranslationService:
             # Get container client
             container_client = self.blob_service_client.get_container_client(container_name)
             
-            # List all blobs in the container
-            blob_list = container_client.list_blobs()
-            deleted_count = 0
-            
-            for blob in blob_list:
-                try:
-                    # Delete each blob
-                    blob_client = container_client.get_blob_client(blob.name)
-                    blob_client.delete_blob()
-                    deleted_count += 1
-                    self.logger.debug(f"Deleted blob: {blob.name}")
-                except ResourceNotFoundError:
-                    # Blob was already deleted, continue
-                    self.logger.debug(f"Blob {blob.name} was already deleted")
-                except Exception as e:
-                    self.logger.warning(f"Failed to delete blob {blob.name}: {str(e)}")
-                    # Continue with other blobs even if one fails
+            # Delete every blob in batches; blobs that fail are logged and skipped
+            blob_names = (blob.name for blob in container_client.list_blobs())
+            result = self._delete_blobs(container_name, container_client, blob_names, inline=True)
+            deleted_count = len(result['deleted'])
             
             if deleted_count > 0:
                 self.logger.info(f"Successfully cleared {deleted_count} files from target container {container_name}")
@@ -258,13 +848,58 @@ class DocumentTranslationService:
             Dict[str, Any]: Operation status and details
         """
         try:
-            # This would require storing operation IDs and implementing status checking
-            # For now, this is a placeholder for future implementation
-            pass
+            details = self.client.get_translation_status(operation_id)
+            
+            return {
+                'operation_id': details.id,
+                'status': details.status,
+                'created_on': details.created_on,
+                'last_updated_on': details.last_updated_on,
+                'total_documents': details.documents_total_count,
+                'succeeded_documents': details.documents_succeeded_count,
+                'failed_documents': details.documents_failed_count,
+                'in_progress_documents': details.documents_in_progress_count,
+                'not_yet_started_documents': details.documents_not_started_count,
+                'canceled_documents': details.documents_canceled_count,
+                'total_characters_charged': details.total_characters_charged,
+                'error': {
+                    'code': details.error.code,
+                    'message': details.error.message
+                } if details.error else None
+            }
         except Exception as e:
             self.logger.error(f"Failed to get translation status: {str(e)}")
             raise Exception(f"Failed to get translation status: {str(e)}")
     
+    def get_document_progress(self, operation_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the current state of every document in a translation operation.
+        
+        Args:
+            operation_id (str): The operation ID returned from a translation request
+        
+        Returns:
+            List[Dict[str, Any]]: Per-document id, owner user_id_hash, filename, target language,
+            status, progress (0-1) and error message
+        """
+        try:
+            documents = []
+            for document in self.client.list_document_statuses(operation_id):
+                source_url = getattr(document, 'source_document_url', None)
+                documents.append({
+                    'id': document.id,
+                    'user_id_hash': self._blob_owner(source_url),
+                    'source_filename': self._extract_filename_from_url(source_url),
+                    'translated_to': document.translated_to,
+                    'status': document.status,
+                    'translation_progress': document.translation_progress,
+                    'error': document.error.message if document.error else None
+                })
+            return documents
+        except Exception as e:
+            self.logger.error(f"Failed to get document progress: {str(e)}")
+            raise Exception(f"Failed to get document progress: {str(e)}")
+    
     def list_supported_languages(self) -> List[Dict[str, str]]:
         """
         Get list of supported languages for translation.
@@ -331,39 +966,22 @@ class DocumentTranslationService:
             # Get container client
             container_client = self.blob_service_client.get_container_client(container_name)
             
-            cleaned_files = 0
-            failed_cleanups = 0
-            cleanup_errors = []
-            
-            # Process each document result to clean up the corresponding source file
+            # Collect the source file of each document result, then delete them in batches
+            source_filenames = []
             for doc_result in document_results:
                 source_filename = doc_result.get('source_filename')
                 
                 if not source_filename:
                     self.logger.warning(f"No source filename found for document ID: {doc_result.get('id', 'unknown')}")
                     continue
-                
-                try:
-                    # Get blob client for the source file
-                    blob_client = container_client.get_blob_client(source_filename)
-                    
-                    # Check if blob exists before attempting deletion
-                    if blob_client.exists():
-                        # Delete the source file
-                        blob_client.delete_blob()
-                        cleaned_files += 1
-                        self.logger.info(f"Successfully deleted source file: {source_filename}")
-                    else:
-                        self.logger.info(f"Source file {source_filename} was already deleted or doesn't exist")
-                        
-                except ResourceNotFoundError:
-                    # File was already deleted, this is not an error
-                    self.logger.info(f"Source file {source_filename} was already deleted")
-                except Exception as e:
-                    failed_cleanups += 1
-                    error_msg = f"Failed to delete source file {source_filename}: {str(e)}"
-                    cleanup_errors.append(error_msg)
-                    self.logger.error(error_msg)
+                source_filenames.append(source_filename)
+            
+            result = self._delete_blobs(container_name, container_client, source_filenames)
+            cleaned_files = len(result['deleted'])
+            failed_cleanups = len(result['failed'])
+            cleanup_errors = [f"Failed to delete source file {f['name']}: {f['error']}" for f in result['failed']]
+            if result['missing']:
+                self.logger.info(f"Source files already deleted: {', '.join(result['missing'])}")
             
             cleanup_result = {
                 'cleanup_attempted': True,
@@ -415,9 +1033,12 @@ class DocumentTranslationService:
         Returns:
             Dict[str, Any]: Translation results including cleanup information
         """
-        # First, clean up old target files (older than specified hours)
-        self.logger.info(f"Starting automatic cleanup of old target files (older than {cleanup_old_target_hours} hours)")
-        old_target_cleanup_result = self.cleanup_old_target_files(target_uri, cleanup_old_target_hours)
+        # First, clean up old target files (older than specified hours) unless the scheduled sweeper does it
+        if get_config().inline_expiry_cleanup:
+            self.logger.info(f"Starting automatic cleanup of old target files (older than {cleanup_old_target_hours} hours)")
+            old_target_cleanup_result = self.cleanup_old_target_files(target_uri, cleanup_old_target_hours)
+        else:
+            old_target_cleanup_result = self._inline_cleanup_disabled_result()
         
         # Log old target cleanup summary
         if old_target_cleanup_result['cleanup_attempted']:
@@ -644,18 +1265,35 @@ class DocumentTranslationService:
                 'results': []
             }
         
-        cleaned_files = 0
-        failed_cleanups = 0
-        results = []
+        container_name = self._extract_container_name_from_uri(target_uri)
+        if not self.blob_service_client or not container_name:
+            # Report the reason per file, as cleanup_target_file does
+            results = [self.cleanup_target_file(target_uri, filename) for filename in filenames]
+        else:
+            container_client = self.blob_service_client.get_container_client(container_name)
+            deletion = self._delete_blobs(container_name, container_client, filenames)
+            failures = {failure['name']: failure['error'] for failure in deletion['failed']}
+            missing = set(deletion['missing'])
+            results = []
+            for filename in dict.fromkeys(filenames):
+                if filename in failures:
+                    results.append({
+                        'success': False,
+                        'reason': f"Failed to delete target file {filename}: {failures[filename]}",
+                        'filename': filename
+                    })
+                elif filename in missing:
+                    results.append({
+                        'success': True,
+                        'reason': 'File already deleted or does not exist',
+                        'filename': filename,
+                        'container_name': container_name
+                    })
+                else:
+                    results.append({'success': True, 'filename': filename, 'container_name': container_name})
         
-        for filename in filenames:
-            result = self.cleanup_target_file(target_uri, filename)
-            results.append(result)
-            
-            if result['success']:
-                cleaned_files += 1
-            else:
-                failed_cleanups += 1
+        cleaned_files = sum(1 for result in results if result['success'])
+        failed_cleanups = len(results) - cleaned_files
         
         cleanup_result = {
             'cleanup_attempted': True,
@@ -728,9 +1366,8 @@ class DocumentTranslationService:
                     'errors': []
                 }
             
-            cleaned_files = 0
-            failed_cleanups = 0
             old_files_found = 0
+            old_files = []
             cleanup_errors = []
             
             # List all blobs in the container with their properties
@@ -751,18 +1388,7 @@ class DocumentTranslationService:
                         old_files_found += 1
                         age_hours = (datetime.now(timezone.utc) - last_modified).total_seconds() / 3600
                         self.logger.info(f"Found old file: {blob.name} (age: {age_hours:.1f} hours)")
-                        
-                        try:
-                            # Delete the old file
-                            blob_client = container_client.get_blob_client(blob.name)
-                            blob_client.delete_blob()
-                            cleaned_files += 1
-                            self.logger.info(f"Successfully deleted old target file: {blob.name}")
-                        except Exception as delete_error:
-                            failed_cleanups += 1
-                            error_msg = f"Failed to delete old target file {blob.name}: {str(delete_error)}"
-                            cleanup_errors.append(error_msg)
-                            self.logger.error(error_msg)
+                        old_files.append(blob.name)
                     else:
                         # File is recent, keep it
                         age_hours = (datetime.now(timezone.utc) - last_modified).total_seconds() / 3600
@@ -773,6 +1399,12 @@ class DocumentTranslationService:
                     cleanup_errors.append(error_msg)
                     self.logger.error(error_msg)
             
+            # Delete the old files in batches; one already gone counts as cleaned
+            result = self._delete_blobs(container_name, container_client, old_files)
+            cleaned_files = len(result['deleted']) + len(result['missing'])
+            failed_cleanups = len(result['failed'])
+            cleanup_errors.extend(f"Failed to delete old target file {f['name']}: {f['error']}" for f in result['failed'])
+            
             cleanup_result = {
                 'cleanup_attempted': True,
                 'cleaned_files': cleaned_files,
@@ -806,12 +1438,16 @@ class DocumentTranslationService:
         self, 
         source_uri: str, 
         target_uri: str, 
-        target_language: str,
+        target_language: Union[str, List[str]],
         user_id_hash: str,
         source_language: Optional[str] = None,
         clear_target: bool = True,
         cleanup_source: bool = False,
-        cleanup_old_target_hours: int = 24
+        cleanup_old_target_hours: int = 24,
+        on_submitted: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        content_hashes: Optional[Dict[str, str]] = None,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Translate documents for a specific user with container-level access but user isolation.
@@ -819,135 +1455,249 @@ class DocumentTranslationService:
         Args:
             source_uri (str): URI of the source blob container (container level)
             target_uri (str): URI of the target blob container (container level)
-            target_language (str): Target language code (e.g., 'en', 'es', 'fr')
+            target_language (str or List[str]): Target language code, or a list of codes to translate into
+                in one operation (e.g., 'fr' or ['fr', 'de', 'es'])
             user_id_hash (str): User ID hash for filtering and isolation
             source_language (str, optional): Source language code. If not provided, auto-detection is used.
             clear_target (bool, optional): Whether to clear user's target files before translation. Defaults to True.
             cleanup_source (bool, optional): Whether to clean up user's source files after translation. Defaults to False.
             cleanup_old_target_hours (int, optional): Hours threshold for cleaning up old target files. Defaults to 24 hours.
+            on_submitted (callable, optional): Called with the poller once the Azure operation is accepted.
+            on_progress (callable, optional): Called with the latest operation status periodically while the operation is running.
+            content_hashes (Dict[str, str], optional): Known SHA-256 of source blobs, keyed by blob name,
+                used for translation cache lookups (other blobs are hashed on demand).
+            on_cached (callable, optional): Called with the user_id_hash and cache state before submission; see
+                translate_documents_for_users().
         
         Returns:
             Dict[str, Any]: Translation results including cleanup information
         """
         self.logger.info(f"Starting user-specific translation for user hash: {user_id_hash}")
+        target_languages = [target_language] if isinstance(target_language, str) else list(target_language)
         
-        # First, clean up old target files for this user
-        old_target_cleanup_result = self.cleanup_old_target_files_for_user(target_uri, user_id_hash, cleanup_old_target_hours)
+        results = self._translate_for_users(
+            source_uri,
+            target_uri,
+            [{
+                'user_id_hash': user_id_hash,
+                'target_languages': target_languages,
+                'source_language': source_language,
+                'clear_target': clear_target,
+                'cleanup_source': cleanup_source,
+                'content_hashes': content_hashes,
+            }],
+            on_submitted=(lambda poller, submitted_users: on_submitted(poller)) if on_submitted else None,
+            on_progress=on_progress,
+            cleanup_old_target_hours=cleanup_old_target_hours,
+            on_cached=on_cached
+        )
+        return results[user_id_hash]
+
+    def _prepare_user_translation(
+        self,
+        source_uri: str,
+        target_uri: str,
+        user_id_hash: str,
+        clear_target: bool,
+        cleanup_old_target_hours: int,
+        snapshot: Optional[BlobListingSnapshot] = None
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """
+        Run the per-user target cleanup that precedes a submission and list the blobs to translate.
+        
+        All steps plan from `snapshot`, so the user's target and source prefixes are listed once each.
+        
+        Returns:
+            Tuple[Dict[str, Any], List[str]]: Old target cleanup result and the user's source blob names
+        """
+        # First, clean up old target files for this user unless the scheduled sweeper does it
+        if get_config().inline_expiry_cleanup:
+            old_target_cleanup_result = self.cleanup_old_target_files_for_user(
+                target_uri, user_id_hash, cleanup_old_target_hours, snapshot=snapshot
+            )
+        else:
+            old_target_cleanup_result = self._inline_cleanup_disabled_result()
         
         # Clear user's target files if requested
         if clear_target:
             self.logger.info(f"Clearing target files for user: {user_id_hash}")
-            user_target_cleanup_result = self._clear_user_target_files(target_uri, user_id_hash)
+            self._clear_user_target_files(target_uri, user_id_hash, snapshot=snapshot)
         
-        # Check if user has any source files to translate
-        if not self._user_has_source_files(source_uri, user_id_hash):
-            return {
-                'status': 'No files to translate',
-                'success': False,
-                'error': 'No source files found for the current user',
-                'user_id_hash': user_id_hash,
-                'old_target_cleanup': old_target_cleanup_result,
-                'source_files_found': 0
-            }
+        return old_target_cleanup_result, self._list_user_source_blobs(source_uri, user_id_hash, snapshot=snapshot)
+
+    def _inline_cleanup_disabled_result(self) -> Dict[str, Any]:
+        """Old target cleanup result when expiry is left to `manage.py sweep_expired_blobs`."""
+        return {
+            'cleanup_attempted': False,
+            'reason': 'Expired files are removed by the scheduled sweep_expired_blobs command',
+            'cleaned_files': 0,
+            'failed_cleanups': 0,
+            'old_files_found': 0,
+            'errors': []
+        }
+
+    def _no_source_files_result(self, user_id_hash: str, old_target_cleanup_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Result returned when a user has nothing to translate."""
+        return {
+            'status': 'No files to translate',
+            'success': False,
+            'error': 'No source files found for the current user',
+            'user_id_hash': user_id_hash,
+            'old_target_cleanup': old_target_cleanup_result,
+            'source_files_found': 0
+        }
+
+    def _finalize_user_translation(
+        self,
+        result: Dict[str, Any],
+        source_uri: str,
+        user_id_hash: str,
+        cleanup_source: bool = False,
+        snapshot: Optional[BlobListingSnapshot] = None
+    ) -> Dict[str, Any]:
+        """
+        Restrict a finished translation result to the user's documents and clean up their source files.
+        
+        Args:
+            result (Dict[str, Any]): Result returned by translate_documents() or resume_translation()
+            source_uri (str): URI of the source blob container
+            user_id_hash (str): User ID hash for filtering and isolation
+            cleanup_source (bool, optional): Whether to clean up user's source files after translation. Defaults to False.
+            snapshot (BlobListingSnapshot, optional): Listings already made for this request
+        
+        Returns:
+            Dict[str, Any]: The user-scoped translation result
+        """
+        self._restrict_to_user(result, user_id_hash)
+        
+        # Add user-specific cleanup information
+        result['user_id_hash'] = user_id_hash
+        result['cleanup_source_requested'] = cleanup_source
+        
+        # Clean up user's source files if requested and translation was successful
+        if cleanup_source and result.get('status') == 'Succeeded':
+            self.logger.info(f"Cleaning up source files for user: {user_id_hash}")
+            source_cleanup_result = self.cleanup_source_files_for_user(source_uri, user_id_hash, snapshot=snapshot)
+            result['source_cleanup'] = source_cleanup_result
+        else:
+            result['source_cleanup'] = {'cleanup_attempted': False, 'reason': 'Translation not successful or cleanup not requested'}
+        
+        return result
+
+    def _restrict_to_user(self, result: Dict[str, Any], user_id_hash: str):
+        """Drop the documents of other users from a translation result, in place."""
+        # Filter the results to only include this user's files
+        if 'documents' in result:
+            user_documents = []
+            self.logger.info(f"Filtering documents for user: {user_id_hash}")
+            self.logger.info(f"Total documents before filtering: {len(result['documents'])}")
+        
+            for doc in result['documents']:
+                # Check if this document belongs to the user
+                source_url = doc.get('source_url', '')
+                source_document_url = doc.get('source_document_url', '')
+        
+                self.logger.info(f"Checking document: source_url={source_url}, source_document_url={source_document_url}")
+        
+                # Check both URL fields
+                url_to_check = source_url or source_document_url
+                belongs_to_user = user_id_hash in url_to_check or self._is_user_document(url_to_check, user_id_hash)
+        
+                self.logger.info(f"Document belongs to user {user_id_hash}: {belongs_to_user}")
+        
+                if belongs_to_user:
+                    user_documents.append(doc)
+                    self.logger.info(f"Added document to user documents: {doc.get('source_filename', doc.get('id', 'unknown'))}")
+        
+            self.logger.info(f"Documents after filtering: {len(user_documents)}")
+            result['documents'] = user_documents
+            result['user_documents_count'] = len(user_documents)
+            result['total_documents_in_container'] = len(result.get('all_documents', []))
+
+    def resume_translation_for_user(
+        self,
+        continuation_token: str,
+        user_id_hash: str,
+        cleanup_source: bool = False,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        cache_state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Resume a user-specific translation that was submitted before a worker restart.
+        
+        Args:
+            continuation_token (str): Continuation token stored when the operation was submitted
+            user_id_hash (str): User ID hash for filtering and isolation
+            cleanup_source (bool, optional): Whether to clean up user's source files after translation. Defaults to False.
+            on_progress (callable, optional): Called with the latest operation status while the operation is still running
+            cache_state (Dict[str, Any], optional): The state passed to on_cached at submission; its cache hits are
+                returned with the operation's documents and the new translations are added to the cache.
+        
+        Returns:
+            Dict[str, Any]: Translation results, same shape as translate_documents_user_specific()
+        """
+        source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
+        target_uri = os.getenv('AZURE_TRANSLATION_TARGET_URI')
+        if not source_uri:
+            raise ValueError("AZURE_TRANSLATION_SOURCE_URI must be set")
+        cache_state = cache_state or {}
         
-        # Create user-specific source and target URIs with SAS tokens if needed
-        # The translation service needs container-level access, but we can use filters
         try:
-            # Use the entire container for translation (Azure Document Translation needs this)
-            # But the service will translate ALL files in the container
-            self.logger.info(f"Translating documents in container with user filtering")
-            
-            # Perform the actual translation using the base method
-            result = self.translate_documents(
-                source_uri=source_uri,
-                target_uri=target_uri,
-                target_language=target_language,
-                source_language=source_language,
-                clear_target=False  # We already handled user-specific clearing
-            )
-            
-            # Filter the results to only include this user's files
-            if 'documents' in result:
-                user_documents = []
-                self.logger.info(f"Filtering documents for user: {user_id_hash}")
-                self.logger.info(f"Total documents before filtering: {len(result['documents'])}")
-                
-                for doc in result['documents']:
-                    # Check if this document belongs to the user
-                    source_url = doc.get('source_url', '')
-                    source_document_url = doc.get('source_document_url', '')
-                    
-                    self.logger.info(f"Checking document: source_url={source_url}, source_document_url={source_document_url}")
-                    
-                    # Check both URL fields
-                    url_to_check = source_url or source_document_url
-                    belongs_to_user = user_id_hash in url_to_check or self._is_user_document(url_to_check, user_id_hash)
-                    
-                    self.logger.info(f"Document belongs to user {user_id_hash}: {belongs_to_user}")
-                    
-                    if belongs_to_user:
-                        user_documents.append(doc)
-                        self.logger.info(f"Added document to user documents: {doc.get('source_filename', doc.get('id', 'unknown'))}")
-                
-                self.logger.info(f"Documents after filtering: {len(user_documents)}")
-                result['documents'] = user_documents
-                result['user_documents_count'] = len(user_documents)
-                result['total_documents_in_container'] = len(result.get('all_documents', []))
-            
-            # Add user-specific cleanup information
-            result['user_id_hash'] = user_id_hash
-            result['old_target_cleanup'] = old_target_cleanup_result
-            result['cleanup_source_requested'] = cleanup_source
-            
-            # Clean up user's source files if requested and translation was successful
-            if cleanup_source and result.get('status') == 'Succeeded':
-                self.logger.info(f"Cleaning up source files for user: {user_id_hash}")
-                source_cleanup_result = self.cleanup_source_files_for_user(source_uri, user_id_hash)
-                result['source_cleanup'] = source_cleanup_result
-            else:
-                result['source_cleanup'] = {'cleanup_attempted': False, 'reason': 'Translation not successful or cleanup not requested'}
-            
+            result = self.resume_translation(continuation_token, on_progress=on_progress)
+            result['documents'] = result['documents'] + cache_state.get('cached_documents', [])
+            result = self._finalize_user_translation(result, source_uri, user_id_hash, cleanup_source)
+            # Counts describe this user's documents, not the whole shared operation
+            result['total_documents'] = len(result['documents'])
+            result['succeeded_documents'] = sum(1 for doc in result['documents'] if doc.get('status') == 'Succeeded')
+            result['failed_documents'] = result['total_documents'] - result['succeeded_documents']
+            if self.translation_cache and cache_state.get('cache') is not None:
+                result['cache'] = cache_state['cache']
+                if target_uri and cache_state.get('content_hashes'):
+                    self._cache_new_translations(
+                        source_uri, target_uri, user_id_hash, result['documents'],
+                        cache_state['content_hashes'], cache_state.get('source_language')
+                    )
             return result
-            
         except Exception as e:
-            self.logger.error(f"Translation failed for user {user_id_hash}: {str(e)}")
+            self.logger.error(f"Resumed translation failed for user {user_id_hash}: {str(e)}")
             return {
                 'status': 'Failed',
                 'success': False,
                 'error': str(e),
-                'user_id_hash': user_id_hash,
-                'old_target_cleanup': old_target_cleanup_result
+                'user_id_hash': user_id_hash
             }
 
-    def _user_has_source_files(self, source_uri: str, user_id_hash: str) -> bool:
+    def _user_has_source_files(self, source_uri: str, user_id_hash: str,
+                               snapshot: Optional[BlobListingSnapshot] = None) -> bool:
         """Check if user has any source files to translate."""
+        return bool(self._list_user_source_blobs(source_uri, user_id_hash, snapshot=snapshot))
+
+    def _list_user_source_blobs(self, source_uri: str, user_id_hash: str,
+                                snapshot: Optional[BlobListingSnapshot] = None) -> List[str]:
+        """List the names of the user's blobs in the source container."""
         if not self.blob_service_client:
-            return False
+            return []
         
         try:
             # Extract container name from URI
             container_name = self._extract_container_name_from_uri(source_uri)
             if not container_name:
-                return False
-            
-            container_client = self.blob_service_client.get_container_client(container_name)
+                return []
             
-            # Check if any blobs exist with the user's prefix
-            blob_list = container_client.list_blobs(name_starts_with=f"{user_id_hash}/")
+            blob_names = self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
             
-            # Check if there are any blobs
-            for blob in blob_list:
-                self.logger.info(f"Found source file for user {user_id_hash}: {blob.name}")
-                return True
-            
-            self.logger.info(f"No source files found for user {user_id_hash}")
-            return False
+            if blob_names:
+                self.logger.info(f"Found {len(blob_names)} source file(s) for user {user_id_hash}")
+            else:
+                self.logger.info(f"No source files found for user {user_id_hash}")
+            return blob_names
             
         except Exception as e:
-            self.logger.error(f"Error checking user source files: {str(e)}")
-            return False
+            self.logger.error(f"Error listing user source files: {str(e)}")
+            return []
 
-    def _clear_user_target_files(self, target_uri: str, user_id_hash: str) -> Dict[str, Any]:
+    def _clear_user_target_files(self, target_uri: str, user_id_hash: str,
+                                 snapshot: Optional[BlobListingSnapshot] = None) -> Dict[str, Any]:
         """Clear target files for a specific user."""
         if not self.blob_service_client:
             return {'cleanup_attempted': False, 'error': 'No blob service client'}
@@ -959,21 +1709,13 @@ class DocumentTranslationService:
             
             container_client = self.blob_service_client.get_container_client(container_name)
             
-            # List and delete blobs with user prefix
-            blob_list = container_client.list_blobs(name_starts_with=f"{user_id_hash}/")
-            deleted_count = 0
-            
-            for blob in blob_list:
-                try:
-                    container_client.delete_blob(blob.name)
-                    deleted_count += 1
-                    self.logger.info(f"Deleted user target file: {blob.name}")
-                except Exception as e:
-                    self.logger.error(f"Failed to delete target file {blob.name}: {str(e)}")
+            # Delete blobs with user prefix
+            blob_names = self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
+            result = self._delete_blobs(container_name, container_client, blob_names, snapshot=snapshot)
             
             return {
                 'cleanup_attempted': True,
-                'deleted_count': deleted_count,
+                'deleted_count': len(result['deleted']),
                 'user_id_hash': user_id_hash
             }
             
@@ -981,7 +1723,8 @@ class DocumentTranslationService:
             self.logger.error(f"Error clearing user target files: {str(e)}")
             return {'cleanup_attempted': False, 'error': str(e)}
 
-    def cleanup_source_files_for_user(self, source_uri: str, user_id_hash: str) -> Dict[str, Any]:
+    def cleanup_source_files_for_user(self, source_uri: str, user_id_hash: str,
+                                      snapshot: Optional[BlobListingSnapshot] = None) -> Dict[str, Any]:
         """Clean up source files for a specific user."""
         if not self.blob_service_client:
             return {'cleanup_attempted': False, 'error': 'No blob service client'}
@@ -993,24 +1736,14 @@ class DocumentTranslationService:
             
             container_client = self.blob_service_client.get_container_client(container_name)
             
-            # List and delete blobs with user prefix
-            blob_list = container_client.list_blobs(name_starts_with=f"{user_id_hash}/")
-            deleted_count = 0
-            failed_count = 0
-            
-            for blob in blob_list:
-                try:
-                    container_client.delete_blob(blob.name)
-                    deleted_count += 1
-                    self.logger.info(f"Deleted user source file: {blob.name}")
-                except Exception as e:
-                    failed_count += 1
-                    self.logger.error(f"Failed to delete source file {blob.name}: {str(e)}")
+            # Delete blobs with user prefix
+            blob_names = self._user_blob_names(container_name, user_id_hash, snapshot=snapshot)
+            result = self._delete_blobs(container_name, container_client, blob_names, snapshot=snapshot)
             
             return {
                 'cleanup_attempted': True,
-                'cleaned_files': deleted_count,
-                'failed_cleanups': failed_count,
+                'cleaned_files': len(result['deleted']),
+                'failed_cleanups': len(result['failed']),
                 'user_id_hash': user_id_hash
             }
             
@@ -1018,7 +1751,8 @@ class DocumentTranslationService:
             self.logger.error(f"Error cleaning up user source files: {str(e)}")
             return {'cleanup_attempted': False, 'error': str(e)}
 
-    def cleanup_old_target_files_for_user(self, target_uri: str, user_id_hash: str, hours_threshold: int = 72) -> Dict[str, Any]:
+    def cleanup_old_target_files_for_user(self, target_uri: str, user_id_hash: str, hours_threshold: int = 72,
+                                          snapshot: Optional[BlobListingSnapshot] = None) -> Dict[str, Any]:
         """Clean up old target files for a specific user."""
         if not self.blob_service_client:
             return {'cleanup_attempted': False, 'error': 'No blob service client'}
@@ -1031,28 +1765,15 @@ class DocumentTranslationService:
             container_client = self.blob_service_client.get_container_client(container_name)
             cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours_threshold)
             
-            # List blobs with user prefix and check age
-            blob_list = container_client.list_blobs(name_starts_with=f"{user_id_hash}/", include=['metadata'])
-            old_files_found = 0
-            cleaned_files = 0
-            failed_cleanups = 0
-            
-            for blob in blob_list:
-                if blob.last_modified and blob.last_modified < cutoff_time:
-                    old_files_found += 1
-                    try:
-                        container_client.delete_blob(blob.name)
-                        cleaned_files += 1
-                        self.logger.info(f"Deleted old target file: {blob.name}")
-                    except Exception as e:
-                        failed_cleanups += 1
-                        self.logger.error(f"Failed to delete old target file {blob.name}: {str(e)}")
+            # Find the user's old blobs
+            old_files = self._user_blob_names(container_name, user_id_hash, modified_before=cutoff_time, snapshot=snapshot)
+            result = self._delete_blobs(container_name, container_client, old_files, snapshot=snapshot)
             
             return {
                 'cleanup_attempted': True,
-                'old_files_found': old_files_found,
-                'cleaned_files': cleaned_files,
-                'failed_cleanups': failed_cleanups,
+                'old_files_found': len(old_files),
+                'cleaned_files': len(result['deleted']) + len(result['missing']),
+                'failed_cleanups': len(result['failed']),
                 'hours_threshold': hours_threshold,
                 'user_id_hash': user_id_hash
             }
@@ -1078,6 +1799,83 @@ class DocumentTranslationService:
             self.logger.error(f"Error checking if document belongs to user: {str(e)}")
             return False
 
+    def _delete_blobs(self, container_name: str, container_client: Any, blob_names,
+                      snapshot: Optional[BlobListingSnapshot] = None, inline: bool = False) -> Dict[str, List[Any]]:
+        """
+        Bulk-delete blobs from a container (or queue them for deletion) and drop them from the blob inventory and listing snapshot.
+        
+        Pass inline=True for blobs that are about to be overwritten: the translator fails documents whose
+        target blob exists, and a queued deletion only removes the blob later.
+        """
+        if self.deletion_queue and not inline:
+            blob_names = list(blob_names)
+            buried = self.deletion_queue.bury(
+                container_name, blob_names, last_modified=snapshot.last_modified(container_name, blob_names) if snapshot else None
+            )
+            if snapshot:
+                snapshot.discard(container_name, buried)
+            return {'deleted': buried, 'missing': [], 'modified': [], 'failed': []}
+        result = bulk_delete_blobs(container_client, blob_names)
+        if snapshot:
+            snapshot.discard(container_name, result['deleted'] + result['missing'])
+        if self.deletion_queue:
+            try:
+                self.deletion_queue.cancel(container_name, result['deleted'] + result['missing'])
+            except Exception as e:
+                self.logger.warning(f"Could not drop queued deletions in {container_name}: {str(e)}")
+        if self.blob_inventory:
+            try:
+                self.blob_inventory.forget(container_name, result['deleted'] + result['missing'])
+            except Exception as e:
+                self.logger.warning(f"Could not update blob inventory of {container_name}: {str(e)}")
+        return result
+    
+    def _record_blob(self, container_name: str, blob_name: str, size: Optional[int] = None,
+                     last_modified: Optional[datetime] = None):
+        """Add a blob this service wrote to the blob inventory and drop any queued deletion of its name."""
+        if self.deletion_queue:
+            try:
+                # The deleter would keep the rewritten blob anyway; this makes it visible again right away
+                self.deletion_queue.cancel(container_name, [blob_name])
+            except Exception as e:
+                self.logger.warning(f"Could not cancel queued deletion of {container_name}/{blob_name}: {str(e)}")
+        if self.blob_inventory:
+            try:
+                self.blob_inventory.record(container_name, blob_name, size=size, last_modified=last_modified)
+            except Exception as e:
+                # The next reconciliation picks the blob up; never fail a translation over bookkeeping
+                self.logger.warning(f"Could not record {container_name}/{blob_name} in blob inventory: {str(e)}")
+    
+    def _inventory_blob_names(self, container_name: Optional[str], user_id_hash: str,
+                              modified_before: Optional[datetime] = None) -> Optional[List[str]]:
+        """A user's blob names from the blob inventory, or None when it cannot answer and the container must be listed."""
+        if self.blob_inventory and self.blob_inventory.is_authoritative(container_name):
+            return self.blob_inventory.names(container_name, user_id_hash, modified_before)
+        return None
+    
+    def _user_blob_names(self, container_name: str, user_id_hash: str, modified_before: Optional[datetime] = None,
+                         snapshot: Optional[BlobListingSnapshot] = None) -> List[str]:
+        """A user's blob names, from the blob inventory when it can answer, else from a listing of their prefix."""
+        blob_names = self._inventory_blob_names(container_name, user_id_hash, modified_before)
+        if blob_names is None:
+            snapshot = snapshot or BlobListingSnapshot(self.blob_service_client)
+            blob_names = snapshot.names(container_name, f"{user_id_hash}/", modified_before)
+        return self._without_buried(container_name, blob_names)
+    
+    def _without_buried(self, container_name: str, blob_names: List[str]) -> List[str]:
+        """Leave out blobs queued for deletion; they may still be in storage but are deleted for the app."""
+        if not self.deletion_queue or not blob_names:
+            return blob_names
+        buried = self.deletion_queue.buried(container_name, blob_names)
+        return [blob_name for blob_name in blob_names if blob_name not in buried]
+    
+    def _blob_owner(self, url: Optional[str]) -> Optional[str]:
+        """Return the user_id_hash prefix of a blob URL laid out as container/user_id_hash/..., if any."""
+        if not url:
+            return None
+        path_parts = urllib.parse.urlparse(url).path.strip('/').split('/')
+        return path_parts[1] if len(path_parts) >= 3 else None
+
     def _extract_container_name_from_uri(self, uri: str) -> Optional[str]:
         """Extract container name from a blob storage URI."""
         try:
@@ -1130,6 +1928,7 @@ class DocumentTranslationService:
         try:
             if not self.blob_service_client:
                 raise Exception("Blob service client not available")
+            snapshot = BlobListingSnapshot(self.blob_service_client)
             
             # Extract container names
             temp_source_container = self._extract_container_name_from_uri(temp_source_uri)
@@ -1146,7 +1945,7 @@ class DocumentTranslationService:
             
             # Step 2: Copy user's files to temporary source container
             copied_files = self._copy_user_files_to_temp_container(
-                original_source_container, temp_source_container, user_id_hash
+                original_source_container, temp_source_container, user_id_hash, snapshot=snapshot
             )
             
             if copied_files == 0:
@@ -1180,7 +1979,7 @@ class DocumentTranslationService:
                 
                 # Step 5: Clean up source files if requested
                 if cleanup_source:
-                    source_cleanup = self._cleanup_user_source_files(original_source_container, user_id_hash)
+                    source_cleanup = self._cleanup_user_source_files(original_source_container, user_id_hash, snapshot=snapshot)
                     translation_result['source_cleanup'] = source_cleanup
             
             # Add user-specific information
@@ -1218,35 +2017,27 @@ class DocumentTranslationService:
                 self.logger.error(f"Failed to create container {container_name}: {str(e)}")
                 return False
 
-    def _copy_user_files_to_temp_container(self, source_container: str, temp_container: str, user_id_hash: str) -> int:
+    def _copy_user_files_to_temp_container(self, source_container: str, temp_container: str, user_id_hash: str,
+                                           snapshot: Optional[BlobListingSnapshot] = None) -> int:
         """Copy user's files from main container to temporary container."""
         try:
-            source_client = self.blob_service_client.get_container_client(source_container)
-            temp_client = self.blob_service_client.get_container_client(temp_container)
-            
-            # List user's blobs
-            user_blobs = source_client.list_blobs(name_starts_with=f"{user_id_hash}/")
-            copied_count = 0
-            
-            for blob in user_blobs:
-                # Copy blob to temp container without the user prefix
-                # Original: user_hash/filename.pdf -> Temp: filename.pdf
-                filename = blob.name.replace(f"{user_id_hash}/", "")
-                
-                # Get source blob client
-                source_blob_client = source_client.get_blob_client(blob.name)
-                
-                # Get temp blob client
-                temp_blob_client = temp_client.get_blob_client(filename)
-                
-                # Copy the blob
-                copy_source = source_blob_client.url
-                temp_blob_client.start_copy_from_url(copy_source)
-                
-                copied_count += 1
-                self.logger.info(f"Copied {blob.name} -> {filename}")
-            
-            return copied_count
+            # List user's blobs and copy them to the temp container without the user prefix
+            # Original: user_hash/filename.pdf -> Temp: filename.pdf
+            snapshot = snapshot or BlobListingSnapshot(self.blob_service_client)
+            user_blobs = snapshot.blobs(source_container, f"{user_id_hash}/")
+            live_names = set(self._without_buried(source_container, [blob.name for blob in user_blobs]))
+            user_blobs = [blob for blob in user_blobs if blob.name in live_names]
+            copies = [
+                CopyRequest(source_container, blob.name, temp_container, blob.name.replace(f"{user_id_hash}/", ""), blob.size)
+                for blob in user_blobs
+            ]
+            
+            # Returns once every copy has landed, so translation never starts on a half-copied container
+            result = copy_blobs(self.blob_service_client, copies)
+            for copy in result['copied']:
+                self.logger.info(f"Copied {copy.source_blob} -> {copy.target_blob}")
+            
+            return len(result['copied'])
             
         except Exception as e:
             self.logger.error(f"Error copying user files to temp container: {str(e)}")
@@ -1256,59 +2047,41 @@ class DocumentTranslationService:
         """Move translated files from temp container to main target container with user prefix."""
         try:
             temp_client = self.blob_service_client.get_container_client(temp_container)
-            target_client = self.blob_service_client.get_container_client(target_container)
             
-            # List all blobs in temp target container
+            # Copy all blobs in temp target container to the target container with user prefix
+            # Temp: filename.pdf -> Target: user_hash/filename.pdf
             temp_blobs = temp_client.list_blobs()
-            moved_count = 0
+            copies = [
+                CopyRequest(temp_container, blob.name, target_container, f"{user_id_hash}/{blob.name}", blob.size)
+                for blob in temp_blobs
+            ]
             
-            for blob in temp_blobs:
-                # Move blob to target container with user prefix
-                # Temp: filename.pdf -> Target: user_hash/filename.pdf
-                target_blob_name = f"{user_id_hash}/{blob.name}"
-                
-                # Get temp blob client
-                temp_blob_client = temp_client.get_blob_client(blob.name)
-                
-                # Get target blob client
-                target_blob_client = target_client.get_blob_client(target_blob_name)
-                
-                # Copy the blob
-                copy_source = temp_blob_client.url
-                target_blob_client.start_copy_from_url(copy_source)
-                
-                moved_count += 1
-                self.logger.info(f"Moved {blob.name} -> {target_blob_name}")
+            # Returns once every copy has landed, so the temp containers can be deleted safely afterwards
+            result = copy_blobs(self.blob_service_client, copies)
+            for copy in result['copied']:
+                self._record_blob(copy.target_container, copy.target_blob, size=copy.size)
+                self.logger.info(f"Moved {copy.source_blob} -> {copy.target_blob}")
             
-            return moved_count
+            return len(result['copied'])
             
         except Exception as e:
             self.logger.error(f"Error moving translated files: {str(e)}")
             return 0
 
-    def _cleanup_user_source_files(self, source_container: str, user_id_hash: str) -> Dict[str, Any]:
+    def _cleanup_user_source_files(self, source_container: str, user_id_hash: str,
+                                   snapshot: Optional[BlobListingSnapshot] = None) -> Dict[str, Any]:
         """Clean up user's source files after successful translation."""
         try:
             container_client = self.blob_service_client.get_container_client(source_container)
             
-            # List and delete user's blobs
-            user_blobs = container_client.list_blobs(name_starts_with=f"{user_id_hash}/")
-            deleted_count = 0
-            failed_count = 0
-            
-            for blob in user_blobs:
-                try:
-                    container_client.delete_blob(blob.name)
-                    deleted_count += 1
-                    self.logger.info(f"Deleted source file: {blob.name}")
-                except Exception as e:
-                    failed_count += 1
-                    self.logger.error(f"Failed to delete source file {blob.name}: {str(e)}")
+            # Delete user's blobs
+            blob_names = self._user_blob_names(source_container, user_id_hash, snapshot=snapshot)
+            result = self._delete_blobs(source_container, container_client, blob_names, snapshot=snapshot)
             
             return {
                 'cleanup_attempted': True,
-                'cleaned_files': deleted_count,
-                'failed_cleanups': failed_count,
+                'cleaned_files': len(result['deleted']),
+                'failed_cleanups': len(result['failed']),
                 'user_id_hash': user_id_hash
             }
             
@@ -1332,20 +2105,28 @@ class DocumentTranslationService:
     def translate_documents_user_specific(
         self,
         user_id_hash: str,
-        target_language: str,
+        target_language: Union[str, List[str]],
         source_language: Optional[str] = None,
         clear_target: bool = True,
-        cleanup_source: bool = False
+        cleanup_source: bool = False,
+        on_submitted: Optional[Callable[[Any], None]] = None,
+        on_progress: Optional[Callable[[Any], None]] = None,
+        content_hashes: Optional[Dict[str, str]] = None,
+        on_cached: Optional[Callable[[str, Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Translate documents for a specific user using default container URIs.
         
         Args:
             user_id_hash (str): User ID hash for filtering and isolation
-            target_language (str): Target language code (e.g., 'en', 'es', 'fr')
+            target_language (str or List[str]): Target language code, or a list of codes (e.g., 'fr' or ['fr', 'de'])
             source_language (str, optional): Source language code. If not provided, auto-detection is used.
             clear_target (bool, optional): Whether to clear user's target files before translation. Defaults to True.
             cleanup_source (bool, optional): Whether to clean up user's source files after translation. Defaults to False.
+            on_submitted (callable, optional): Called with the poller once the Azure operation is accepted.
+            on_progress (callable, optional): Called with the latest operation status periodically while the operation is running.
+            content_hashes (Dict[str, str], optional): Known SHA-256 of source blobs, keyed by blob name.
+            on_cached (callable, optional): Called with the user_id_hash and cache state before submission.
         
         Returns:
             Dict[str, Any]: Translation results including cleanup information
@@ -1364,16 +2145,29 @@ class DocumentTranslationService:
             user_id_hash=user_id_hash,
             source_language=source_language,
             clear_target=clear_target,
-            cleanup_source=cleanup_source
+            cleanup_source=cleanup_source,
+            on_submitted=on_submitted,
+            on_progress=on_progress,
+            content_hashes=content_hashes,
+            on_cached=on_cached
         )
 
-def create_translation_service(key: Optional[str] = None, endpoint: Optional[str] = None) -> DocumentTranslationService:
+def create_translation_service(
+    key: Optional[str] = None,
+    endpoint: Optional[str] = None,
+    translation_cache: Optional[Any] = None,
+    blob_inventory: Optional[Any] = None,
+    deletion_queue: Optional[Any] = None
+) -> DocumentTranslationService:
     """
     Factory function to create a DocumentTranslationService instance.
     
     Args:
         key (str, optional): Azure Cognitive Services API key. If not provided, will use config.
         endpoint (str, optional): Azure Cognitive Services endpoint URL. If not provided, will use config.
+        translation_cache (optional): Translated document cache to consult before submitting to Azure.
+        blob_inventory (optional): Blob inventory to keep up to date and answer per-user blob lookups from.
+        deletion_queue (optional): Queue to hand blob deletions to instead of deleting them inline.
     
     Returns:
         DocumentTranslationService: Configured translation service instance
@@ -1381,7 +2175,10 @@ def create_translation_service(key: Optional[str] = None, endpoint: Optional[str
     config = get_config()
     actual_key = key or config.key
     actual_endpoint = endpoint or config.endpoint
-    return DocumentTranslationService(actual_key, actual_endpoint)
+    return DocumentTranslationService(
+        actual_key, actual_endpoint, translation_cache=translation_cache, blob_inventory=blob_inventory,
+        deletion_queue=deletion_queue
+    )
 
 
 # Convenience function for backward compatibility with the original script
@@ -1454,7 +2251,7 @@ def translate_documents_with_cleanup(
 def translate_documents_with_cleanup_for_user(
     source_uri: str, 
     target_uri: str, 
-    target_language: str,
+    target_language: Union[str, List[str]],
     user_id_hash: str,
     source_language: Optional[str] = None,
     key: Optional[str] = None,
@@ -1469,7 +2266,7 @@ def translate_documents_with_cleanup_for_user(
     Args:
         source_uri (str): URI of the source blob container
         target_uri (str): URI of the target blob container
-        target_language (str): Target language code
+        target_language (str or List[str]): Target language code, or a list of codes
         user_id_hash (str): User ID hash for filtering and isolation
         source_language (str, optional): Source language code. If not provided, auto-detection is used.
         key (str, optional): Azure Cognitive Services API key. If not provided, will use config.
@@ -85,6 +85,7 @@ const translations = {    'en': {
         'finalizing_translation': 'Starting translation process - Finalizing translation',        'translation_process_seconds': 'Starting translation process ({seconds} seconds)',
         'connecting_service_seconds': 'Starting translation process - Connecting to translation service ({seconds} seconds)',
         'translating_content_seconds': 'Starting translation process - Translating content ({seconds} seconds)',
+        'translating_documents_progress': 'Translating documents - {done} of {total} finished',
         'second': 'second',
         'seconds': 'seconds'
     },    'fr': {
@@ -168,6 +169,7 @@ const translations = {    'en': {
         'finalizing_translation': 'Démarrage du processus de traduction - Finalisation de la traduction',        'translation_process_seconds': 'Démarrage du processus de traduction ({seconds} secondes)',
         'connecting_service_seconds': 'Démarrage du processus de traduction - Connexion au service de traduction ({seconds} secondes)',
         'translating_content_seconds': 'Démarrage du processus de traduction - Traduction du contenu ({seconds} secondes)',
+        'translating_documents_progress': 'Traduction des documents - {done} sur {total} terminés',
         'second': 'seconde',
         'seconds': 'secondes'
     }
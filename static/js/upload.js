@@ -464,6 +464,21 @@ document.addEventListener('DOMContentLoaded', function() {
         let totalFiles = files.length;
         let uploadResults = [];
 
+        // Several files go up in one request, so the previous documents are replaced once for all of them
+        if (totalFiles > 1) {
+            files.forEach((file, index) => showFileProgress(index));
+            uploadFilesBatch(files).then(results => {
+                results.forEach((result, index) => {
+                    hideFileProgress(index);
+                    if (result.success) {
+                        showFileTick(index);
+                    }
+                });
+                showUploadResults(results);
+            });
+            return;
+        }
+
         files.forEach((file, index) => {
             // Show progress indicator for this file
             showFileProgress(index);
@@ -567,62 +582,10 @@ document.addEventListener('DOMContentLoaded', function() {
                     return;
                 }
 
-                // Disable button and show loading status with enhanced progress
+                // Disable button; from here on progress is reported by the server as the job runs
                 launchTranslationBtn.disabled = true;
                 launchTranslationBtn.textContent = window.BabelScribI18n ? window.BabelScribI18n.t('translation_in_progress') : 'Translation in Progress...';
-                
-                // Start elapsed time tracking
-                const startTime = Date.now();
-                let elapsedSeconds = 0;
-                
-                // Show initial progress with elapsed time
-                showTranslationProgressWithTime('Starting translation process', elapsedSeconds);
-                
-                // Timer to update elapsed time every second
-                const timeInterval = setInterval(() => {
-                    elapsedSeconds = Math.floor((Date.now() - startTime) / 1000);
-                    const currentMessage = getCurrentProgressMessage(elapsedSeconds);
-                    showTranslationProgressWithTime(currentMessage, elapsedSeconds);
-                }, 1000);
-                
-                // Simulate progress updates during translation
-                let progressMessages = [
-                    'Preparing documents for translation',
-                    'Connecting to translation service',
-                    'Processing documents',
-                    'Translating content',
-                    'Finalizing translation'
-                ];
-                
-                let currentStep = 0;
-                const progressInterval = setInterval(() => {
-                    if (currentStep < progressMessages.length) {
-                        // Don't call showTranslationProgress here anymore, let the timer handle it
-                        currentStep++;
-                    }
-                }, 2000); // Update every 2 seconds
-                
-                // Helper function to get current progress message based on elapsed time
-                function getCurrentProgressMessage(seconds) {
-                    if (!window.BabelScribI18n) {
-                        // Fallback to English if i18n not available
-                        if (seconds < 2) return 'Starting translation process';
-                        if (seconds < 4) return 'Starting translation process - Preparing documents for translation';
-                        if (seconds < 6) return 'Starting translation process - Connecting to translation service';
-                        if (seconds < 8) return 'Starting translation process - Processing documents';
-                        if (seconds < 10) return 'Starting translation process - Translating content';
-                        return 'Starting translation process - Finalizing translation';
-                    }
-                    
-                    // Use i18n translations
-                    const t = window.BabelScribI18n.t;
-                    if (seconds < 2) return t('starting_translation_process');
-                    if (seconds < 4) return t('preparing_documents');
-                    if (seconds < 6) return t('connecting_service');
-                    if (seconds < 8) return t('processing_documents');
-                    if (seconds < 10) return t('translating_content');
-                    return t('finalizing_translation');
-                }
+                showTranslationProgress(window.BabelScribI18n ? window.BabelScribI18n.t('preparing_documents') : 'Preparing documents for translation');
 
                 // Prepare request data - email is now handled by session
                 const requestData = {
@@ -645,10 +608,6 @@ document.addEventListener('DOMContentLoaded', function() {
                 })
                 .then(response => {
                     if (response.status === 409) {
-                        // Clear both intervals
-                        clearInterval(progressInterval);
-                        clearInterval(timeInterval);
-                        
                         // Handle conflict (target files already exist)
                         return response.json().then(data => {
                             throw new Error(data.error || 'Translation conflict occurred');
@@ -657,10 +616,6 @@ document.addEventListener('DOMContentLoaded', function() {
                     
                     // Check for other error status codes
                     if (!response.ok) {
-                        // Clear both intervals
-                        clearInterval(progressInterval);
-                        clearInterval(timeInterval);
-                        
                         return response.json().then(data => {
                             throw new Error(data.error || `Translation failed with status ${response.status}`);
                         });
@@ -669,10 +624,14 @@ document.addEventListener('DOMContentLoaded', function() {
                     return response.json();
                 })
                 .then(data => {
-                    // Clear both intervals
-                    clearInterval(progressInterval);
-                    clearInterval(timeInterval);
-                    
+                    // The translation runs in a background job; wait for it to finish
+                    if (data.success && data.job_id) {
+                        console.log('Translation job queued:', data.job_id);
+                        return waitForTranslationJob(data.events_url, data.status_url);
+                    }
+                    return data;
+                })
+                .then(data => {
                     // Debug logging
                     console.log('Translation response received:', data);
                     console.log('Translation data.data:', data.data);
@@ -775,8 +734,10 @@ document.addEventListener('DOMContentLoaded', function() {
                                     const actualFileName = fileName.includes('/') ? fileName.split('/').pop() : fileName;
                                     const fullPath = fileName; // Keep the full path for internal operations
                                     
-                                    const downloadUrl = `/download/${encodeURIComponent(actualFileName)}/`;
-                                    const deleteUrl = `/delete-individual/${encodeURIComponent(actualFileName)}/`;
+                                    // Translations are stored per language, so tell the server which one
+                                    const langQuery = doc.translated_to ? `?lang=${encodeURIComponent(doc.translated_to)}` : '';
+                                    const downloadUrl = `/download/${encodeURIComponent(actualFileName)}/${langQuery}`;
+                                    const deleteUrl = `/delete-individual/${encodeURIComponent(actualFileName)}/${langQuery}`;
                                     downloadLinksHtml += `
                                         <li style="margin: 8px 0; padding: 8px; background-color: #e8f5e8; border-radius: 4px; border-left: 3px solid #43a047;">
                                             <strong>${actualFileName}</strong><br>
@@ -885,10 +846,6 @@ document.addEventListener('DOMContentLoaded', function() {
                     }
                 })
                 .catch(error => {
-                    // Clear both intervals
-                    clearInterval(progressInterval);
-                    clearInterval(timeInterval);
-                    
                     console.error('Translation error:', error);
                     const errorMessage = error.message || (window.BabelScribI18n ? window.BabelScribI18n.t('translation_request_failed') : 'Translation request failed. Please try again.');
                     
@@ -920,6 +877,98 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Follow a translation job until it has finished, resolving with the final job payload.
+    // Progress arrives over Server-Sent Events; without EventSource support the status URL is polled instead.
+    function waitForTranslationJob(eventsUrl, statusUrl, intervalMs = 2000) {
+        if (!eventsUrl || !window.EventSource) {
+            return pollTranslationJob(statusUrl, intervalMs);
+        }
+
+        return new Promise((resolve, reject) => {
+            const source = new EventSource(eventsUrl);
+            source.addEventListener('progress', event => {
+                showJobProgress(JSON.parse(event.data).job || {});
+            });
+            source.addEventListener('complete', event => {
+                source.close();
+                resolve(JSON.parse(event.data));
+            });
+            source.onerror = () => {
+                // The server ends each stream after a while and the browser reconnects on its own;
+                // only fall back to polling once the browser has given up on the stream
+                if (source.readyState === EventSource.CLOSED) {
+                    pollTranslationJob(statusUrl, intervalMs).then(resolve, reject);
+                }
+            };
+        });
+    }
+
+    // Poll a translation job until it has finished, resolving with the final job payload
+    function pollTranslationJob(statusUrl, intervalMs = 2000) {
+        return new Promise((resolve, reject) => {
+            function poll() {
+                fetch(statusUrl, { headers: { 'Accept': 'application/json' } })
+                    .then(response => response.json().then(data => {
+                        if (!response.ok) {
+                            throw new Error(data.error || `Translation status check failed with status ${response.status}`);
+                        }
+                        return data;
+                    }))
+                    .then(data => {
+                        const job = data.job || {};
+                        if (job.status === 'succeeded' || job.status === 'failed') {
+                            resolve(data);
+                        } else {
+                            showJobProgress(job);
+                            setTimeout(poll, intervalMs);
+                        }
+                    })
+                    .catch(reject);
+            }
+            poll();
+        });
+    }
+
+    // Show the actual state of a running translation job and of each of its documents
+    function showJobProgress(job) {
+        const t = window.BabelScribI18n ? window.BabelScribI18n.t : null;
+        const progress = job.progress || {};
+
+        if (job.status === 'queued') {
+            showTranslationProgress(t ? t('preparing_documents') : 'Preparing documents for translation');
+            return;
+        }
+        if (!progress.total_documents) {
+            showTranslationProgress(t ? t('connecting_service') : 'Connecting to translation service');
+            return;
+        }
+
+        const done = progress.succeeded_documents + progress.failed_documents;
+        showTranslationProgress(
+            t ? t('translating_documents_progress', {done: done, total: progress.total_documents}) :
+                `Translating documents - ${done} of ${progress.total_documents} finished`,
+            progress.percent_complete
+        );
+
+        const translationStatus = document.getElementById('translation-status');
+        if (translationStatus && job.documents && job.documents.length > 0) {
+            let documentsHtml = '<ul style="list-style: none; padding-left: 0; margin-top: 8px;">';
+            job.documents.forEach(doc => {
+                const percentage = Math.round((doc.translation_progress || 0) * 100);
+                const icon = doc.status === 'Succeeded' ? '✅' : (doc.status === 'Running' || doc.status === 'NotStarted') ? '⏳' : '❌';
+                documentsHtml += `<li>${icon} ${doc.source_filename || doc.id} (${doc.translated_to}): ${doc.status} ${percentage}%`;
+                // Finished documents can be downloaded while the rest of the batch is still translating
+                if (doc.status === 'Succeeded' && doc.source_filename) {
+                    const downloadUrl = `/download/${encodeURIComponent(doc.source_filename)}/?lang=${encodeURIComponent(doc.translated_to)}`;
+                    documentsHtml += ` <a href="${downloadUrl}" download="${doc.source_filename}" style="color: #2e7d32; font-weight: bold;">📥 ` +
+                        (window.BabelScribI18n ? window.BabelScribI18n.t('download_translated_document') : 'Download Translated Document') + '</a>';
+                }
+                documentsHtml += '</li>';
+            });
+            translationStatus.innerHTML += documentsHtml + '</ul>';
+        }
+    }
+
     // Function to show translation status messages with enhanced progress bar
     function showTranslationStatus(message, type) {
         const translationStatus = document.getElementById('translation-status');
@@ -954,54 +1003,6 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    // Add new function to show translation progress with elapsed time
-    function showTranslationProgressWithTime(message, elapsedSeconds) {
-        const translationStatus = document.getElementById('translation-status');
-        const progressContainer = document.getElementById('progress-container');
-        
-        if (translationStatus) {
-            // Format the message to always show "Starting translation process (X seconds)..."
-            let displayMessage;
-            
-            if (!window.BabelScribI18n) {
-                // Fallback without i18n
-                if (message === 'Starting translation process') {
-                    displayMessage = `Starting translation process (${elapsedSeconds} seconds)`;
-                } else {
-                    displayMessage = `${message} (${elapsedSeconds} seconds)`;
-                }
-            } else {
-                // Use i18n translations
-                const t = window.BabelScribI18n.t;
-                if (message === 'Starting translation process' || message === t('starting_translation_process')) {
-                    displayMessage = t('translation_process_seconds', {seconds: elapsedSeconds});
-                } else if (message.includes('Connecting to translation service') || message === t('connecting_service')) {
-                    displayMessage = t('connecting_service_seconds', {seconds: elapsedSeconds});
-                } else if (message.includes('Translating content') || message === t('translating_content')) {
-                    displayMessage = t('translating_content_seconds', {seconds: elapsedSeconds});
-                } else {
-                    // For other messages, keep the elapsed time format
-                    const secondsWord = window.BabelScribI18n.t(elapsedSeconds === 1 ? 'second' : 'seconds');
-                    displayMessage = `${message} (${elapsedSeconds} ${secondsWord})`;
-                }
-            }
-            
-            const progressHtml = `
-                <div class="translation-progress-text">
-                    <div class="translation-spinner"></div>
-                    <span>${displayMessage}...</span>
-                </div>
-            `;
-            translationStatus.innerHTML = progressHtml;
-            translationStatus.className = 'translation-status show loading';
-        }
-        
-        if (progressContainer) {
-            progressContainer.classList.add('show');
-            progressContainer.style.animation = 'pulseContainer 2s ease-in-out infinite';
-        }
-    }
-
     // Add new function to show translation progress with percentage (if available)
     function showTranslationProgress(message, percentage = null) {
         const translationStatus = document.getElementById('translation-status');
@@ -1029,7 +1030,297 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Cleared once the server says direct uploads are off or storage refuses one, so later files skip the attempt
+    let directUploadAvailable = true;
+
+    // Cleared once the server says resumable uploads are off, so later files skip the attempt
+    let resumableUploadAvailable = true;
+
     function uploadFile(file, fileNumber, totalFiles) {
+        // The hash also goes with resumable and direct uploads, where no single request lets the server compute it
+        return fileSha256(file).then(hash => uploadFileIfChanged(file, hash).then(result => {
+            if (result) {
+                return result;
+            }
+            if (resumableUploadAvailable && file.size >= RESUMABLE_MIN_BYTES) {
+                return uploadFileResumable(file, hash).then(result => result || uploadFileToStorage(file, hash));
+            }
+            return uploadFileToStorage(file, hash);
+        }));
+    }
+
+    function uploadFileToStorage(file, hash) {
+        if (!directUploadAvailable) {
+            return uploadFileThroughServer(file);
+        }
+        return uploadFileDirect(file, hash).then(result => result || uploadFileThroughServer(file));
+    }
+
+    // Web Crypto cannot hash incrementally, so larger files skip the check and are simply uploaded
+    const HASH_CHECK_MAX_BYTES = 128 * 1024 * 1024;
+    const HASH_READ_CHUNK_BYTES = 8 * 1024 * 1024;
+
+    // Read the file in slices into one buffer (avoids Blob.arrayBuffer() on older browsers), then SHA-256 it
+    function sha256Hex(file) {
+        const buffer = new Uint8Array(file.size);
+        let offset = 0;
+        function readNext() {
+            if (offset >= file.size) {
+                return crypto.subtle.digest('SHA-256', buffer);
+            }
+            return new Response(file.slice(offset, offset + HASH_READ_CHUNK_BYTES)).arrayBuffer().then(chunk => {
+                buffer.set(new Uint8Array(chunk), offset);
+                offset += chunk.byteLength;
+                return readNext();
+            });
+        }
+        return readNext().then(digest => Array.from(new Uint8Array(digest), b => b.toString(16).padStart(2, '0')).join(''));
+    }
+
+    // SHA-256 of the file, or null when it is too large to hash or the browser cannot
+    function fileSha256(file) {
+        if (!window.crypto || !window.crypto.subtle || file.size === 0 || file.size > HASH_CHECK_MAX_BYTES) {
+            return Promise.resolve(null);
+        }
+        return sha256Hex(file).catch(error => {
+            console.warn('Could not hash the file, uploading without a duplicate check:', error);
+            return null;
+        });
+    }
+
+    // Ask the server whether this exact file is already stored for the user; resolves to null when it must be uploaded
+    function uploadFileIfChanged(file, hash) {
+        if (!hash) {
+            return Promise.resolve(null);
+        }
+        return Promise.resolve()
+            .then(() => fetch('/upload/check/', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ user_email: emailInput.value.trim(), filename: file.name, size: file.size, sha256: hash }),
+            }))
+            .then(response => response.ok ? response.json() : null)
+            .then(data => {
+                if (!data || !data.exists) {
+                    return null;
+                }
+                let message = data.message || 'File already uploaded';
+                if (data.previous_documents_deleted && data.previous_documents_deleted.count > 0) {
+                    message += ` (${data.previous_documents_deleted.count} previous document(s) were automatically deleted)`;
+                }
+                return { success: true, message: message };
+            })
+            .catch(error => {
+                console.warn('Could not check for a stored copy, uploading instead:', error);
+                return null;
+            });
+    }
+
+    // Large files go up in chunks so a dropped connection only costs the chunks in flight
+    const RESUMABLE_MIN_BYTES = 32 * 1024 * 1024;
+    const RESUMABLE_PARALLEL_CHUNKS = 4;
+    const RESUMABLE_CHUNK_ATTEMPTS = 5;
+    const RESUMABLE_ROUNDS = 3;
+
+    function resumableUploadKey(file) {
+        return `babelscrib-upload:${emailInput.value.trim()}:${file.name}:${file.size}:${file.lastModified}`;
+    }
+
+    function rememberUploadSession(file, session) {
+        try {
+            if (session) {
+                localStorage.setItem(resumableUploadKey(file), JSON.stringify({ status_url: session.status_url, complete_url: session.complete_url }));
+            } else {
+                localStorage.removeItem(resumableUploadKey(file));
+            }
+        } catch (error) {
+            // Storage disabled (e.g. private mode): the upload still works, it just cannot resume after a reload
+        }
+    }
+
+    // Continue this file's unfinished session if the server still has it, else start one; resolves to null when unavailable
+    function openUploadSession(file, hash) {
+        let stored = null;
+        try {
+            stored = JSON.parse(localStorage.getItem(resumableUploadKey(file)) || 'null');
+        } catch (error) {
+            stored = null;
+        }
+        const resumed = stored
+            ? fetch(stored.status_url, { headers: { 'Accept': 'application/json' } })
+                .then(response => response.ok ? response.json() : null)
+                .catch(() => null)
+            : Promise.resolve(null);
+        return resumed.then(session => {
+            if (session && !session.completed) {
+                return Object.assign(session, stored);
+            }
+            return fetch('/upload/sessions/', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ user_email: emailInput.value.trim(), filename: file.name, size: file.size, sha256: hash || undefined }),
+            }).then(response => {
+                if (response.status === 404) {
+                    resumableUploadAvailable = false;
+                    return null;
+                }
+                return response.json().then(data => {
+                    if (!response.ok) {
+                        throw new Error(data.error || `Upload could not start: ${response.status}`);
+                    }
+                    rememberUploadSession(file, data);
+                    return data;
+                });
+            });
+        });
+    }
+
+    // PUT one chunk, retrying with backoff; resolves to false when it did not get through
+    function putChunk(file, session, index, attempt) {
+        const start = index * session.chunk_size;
+        return fetch(`${session.status_url}chunks/${index}/`, {
+            method: 'PUT',
+            headers: { 'Content-Type': 'application/octet-stream' },
+            body: file.slice(start, start + session.chunk_size),
+        })
+        .then(response => {
+            if (response.ok) {
+                return true;
+            }
+            if (response.status < 500 && response.status !== 429) {
+                return false;
+            }
+            throw new Error(`Chunk ${index} failed: ${response.status}`);
+        })
+        .catch(() => {
+            if (attempt + 1 >= RESUMABLE_CHUNK_ATTEMPTS) {
+                return false;
+            }
+            return new Promise(resolve => setTimeout(resolve, 1000 * 2 ** attempt))
+                .then(() => putChunk(file, session, index, attempt + 1));
+        });
+    }
+
+    // Send chunks with at most RESUMABLE_PARALLEL_CHUNKS requests in flight
+    function putChunks(file, session, indexes) {
+        const queue = indexes.slice();
+        const workers = [];
+        for (let i = 0; i < Math.min(RESUMABLE_PARALLEL_CHUNKS, queue.length); i++) {
+            workers.push((function next() {
+                const index = queue.shift();
+                return index === undefined ? Promise.resolve() : putChunk(file, session, index, 0).then(next);
+            })());
+        }
+        return Promise.all(workers);
+    }
+
+    // Upload in resumable chunks, sending only what the server is missing; resolves to null when the caller should fall back
+    function uploadFileResumable(file, hash) {
+        return openUploadSession(file, hash).then(session => {
+            if (!session) {
+                return null;
+            }
+            let round = 0;
+            function sendMissing(missing) {
+                return putChunks(file, session, missing)
+                    .then(() => fetch(session.complete_url, { method: 'POST' }))
+                    .then(response => {
+                        // The server lists chunks that still did not arrive
+                        if (response.status === 409 && round < RESUMABLE_ROUNDS) {
+                            round += 1;
+                            return response.json().then(data => sendMissing(data.missing_chunks || []));
+                        }
+                        if (response.ok || response.status === 404 || response.status === 410) {
+                            rememberUploadSession(file, null);
+                        }
+                        return handleUploadResponse(response);
+                    });
+            }
+            return sendMissing(session.missing_chunks);
+        })
+        .catch(error => ({
+            success: false,
+            // fetch() rejects with a TypeError when the network is down; other errors carry the server's message
+            message: !(error instanceof TypeError) && error.message
+                ? error.message
+                : (window.BabelScribI18n ? window.BabelScribI18n.t('network_error_upload') : 'Network error during upload.')
+        }));
+    }
+
+    // Upload straight to blob storage with a short-lived SAS URL; resolves to null when the caller should fall back
+    function uploadFileDirect(file, hash) {
+        const userEmail = emailInput.value.trim();
+        return fetch('/upload/init/', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ user_email: userEmail, filename: file.name, size: file.size }),
+        })
+        .then(response => {
+            if (response.status === 404 || response.status === 501) {
+                directUploadAvailable = false;
+                return null;
+            }
+            if (!response.ok) {
+                return handleUploadResponse(response);
+            }
+            return response.json().then(upload => fetch(upload.upload_url, {
+                method: upload.method,
+                headers: Object.assign({ 'Content-Type': file.type || 'application/octet-stream' }, upload.headers),
+                body: file,
+            })
+            .then(storageResponse => {
+                if (!storageResponse.ok) {
+                    throw new Error(`Storage rejected upload: ${storageResponse.status}`);
+                }
+                return fetch(upload.commit_url, {
+                    method: 'POST',
+                    headers: { 'Content-Type': 'application/json' },
+                    body: JSON.stringify({ filename: file.name, sha256: hash || undefined }),
+                }).then(handleUploadResponse);
+            }, error => {
+                // Usually storage CORS is not configured for this site
+                console.warn('Direct upload to storage failed, uploading through the server instead:', error);
+                directUploadAvailable = false;
+                return null;
+            }));
+        })
+        .catch(() => ({
+            success: false,
+            message: window.BabelScribI18n ? window.BabelScribI18n.t('network_error_upload') : 'Network error during upload.'
+        }));
+    }
+
+    // Upload all files in one multipart request; resolves to one result per file, in order
+    function uploadFilesBatch(files) {
+        const userEmail = emailInput.value.trim();
+        const formData = new FormData();
+        files.forEach(file => formData.append('file', file));
+        formData.append('user_email', userEmail);
+        formData.append('csrfmiddlewaretoken', document.querySelector('[name=csrfmiddlewaretoken]').value);
+
+        const failedMessage = window.BabelScribI18n ? window.BabelScribI18n.t('upload_failed_generic') : 'Upload failed.';
+        return fetch('/upload/batch/', {
+            method: 'POST',
+            // The form field arrives after the files; the header lets the server stream them straight to storage
+            headers: { 'X-User-Email': userEmail },
+            body: formData,
+        })
+        .then(response => response.json().then(data => {
+            const uploaded = new Set((data.uploaded || []).map(u => u.filename));
+            const errors = {};
+            (data.failed || []).forEach(f => { errors[f.filename] = f.error; });
+            return files.map(file => uploaded.has(file.name)
+                ? { file: file.name, success: true, message: 'File uploaded successfully' }
+                : { file: file.name, success: false, message: errors[file.name] || data.error || failedMessage });
+        }))
+        .catch(() => files.map(file => ({
+            file: file.name,
+            success: false,
+            message: window.BabelScribI18n ? window.BabelScribI18n.t('network_error_upload') : 'Network error during upload.'
+        })));
+    }
+
+    function uploadFileThroughServer(file) {
         const url = '/upload/';
         const formData = new FormData();
         formData.append('file', file);
@@ -1041,39 +1332,42 @@ document.addEventListener('DOMContentLoaded', function() {
 
         return fetch(url, {
             method: 'POST',
+            // The form field arrives after the file; the header lets the server stream the file straight to storage
+            headers: { 'X-User-Email': emailInput.value.trim() },
             body: formData,
         })
-        .then(response => {
-            if (response.ok) {
-                return response.json().then(data => {
-                    let message = data.message || 'Upload successful!';
-                    
-                    // Add information about deleted documents if any
-                    if (data.previous_documents_deleted && data.previous_documents_deleted.count > 0) {
-                        message += ` (${data.previous_documents_deleted.count} previous document(s) were automatically deleted)`;
-                    }
-                    
-                    return ({
-                        success: true,
-                        message: message
-                    });
-                });
-            } else {
-                return response.json().then(data => ({
-                    success: false,
-                    message: data.error || (window.BabelScribI18n ? window.BabelScribI18n.t('upload_failed_generic') : 'Upload failed.')
-                })).catch(() => ({
-                    success: false,
-                    message: window.BabelScribI18n ? window.BabelScribI18n.t('upload_failed_generic') : 'Upload failed.'
-                }));
-            }
-        })
+        .then(handleUploadResponse)
         .catch(() => ({
             success: false,
             message: window.BabelScribI18n ? window.BabelScribI18n.t('network_error_upload') : 'Network error during upload.'
         }));
     }
 
+    function handleUploadResponse(response) {
+        if (response.ok) {
+            return response.json().then(data => {
+                let message = data.message || 'Upload successful!';
+                
+                // Add information about deleted documents if any
+                if (data.previous_documents_deleted && data.previous_documents_deleted.count > 0) {
+                    message += ` (${data.previous_documents_deleted.count} previous document(s) were automatically deleted)`;
+                }
+                
+                return ({
+                    success: true,
+                    message: message
+                });
+            });
+        }
+        return response.json().then(data => ({
+            success: false,
+            message: data.error || (window.BabelScribI18n ? window.BabelScribI18n.t('upload_failed_generic') : 'Upload failed.')
+        })).catch(() => ({
+            success: false,
+            message: window.BabelScribI18n ? window.BabelScribI18n.t('upload_failed_generic') : 'Upload failed.'
+        }));
+    }
+
     // Email validation functions
     function isValidEmail(email) {
         const emailRegex = /^[^\s@]+@[^\s@]+\.[^\s@]+$/;
@@ -1254,7 +1548,7 @@ document.addEventListener('DOMContentLoaded', function() {
                     `Successfully deleted ${filename}`;
                 
                 // Remove the individual file from the download list 
-                const deleteBtn = document.querySelector(`[data-filename="${filename}"]`);
+                const deleteBtn = document.querySelector(`[data-delete-url="${deleteUrl}"]`);
                 if (deleteBtn) {
                     const listItem = deleteBtn.closest('li');
                     if (listItem) {
@@ -0,0 +1,108 @@
+"""
+Incremental, resumable deletion of expired blobs.
+
+Translation requests used to find expired target files by listing the target
+container before each submission, which made every user wait for the listing.
+sweep_expired_blobs() does that work off the request path: it pages through a
+container with continuation tokens, deletes each page's expired blobs in
+batches, and stores the token of the next page in a ContainerCheckpoint after
+every page. A run stops when its time budget is spent and the next run resumes
+from the checkpoint, so even very large containers are swept in bounded steps.
+"""
+
+import logging
+import time
+from datetime import timedelta, timezone as dt_timezone
+from typing import Any, Dict, Optional
+
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from django.utils import timezone
+
+from services.blob_operations import bulk_delete_blobs
+from services.config import get_config
+from .blob_inventory import get_blob_inventory
+from .models import ContainerCheckpoint
+
+logger = logging.getLogger(__name__)
+
+SWEEP_TASK = 'sweep_expired'
+
+
+def sweep_expired_blobs(blob_service_client: Any, container: str, max_age_hours: Optional[int] = None,
+                        time_budget: Optional[float] = None, page_size: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Delete blobs last modified more than `max_age_hours` ago, resuming from the container's checkpoint.
+
+    At least one page is processed per run. Settings left as None come from TranslationConfig.
+
+    Args:
+        blob_service_client: BlobServiceClient of the storage account
+        container (str): Container to sweep
+        max_age_hours (int): Age after which a blob is deleted
+        time_budget (float): Seconds after which the run checkpoints and stops
+        page_size (int): Blobs listed per page
+
+    Returns:
+        Dict[str, Any]: Counts of 'pages', 'scanned', 'expired', 'deleted' and 'failed' blobs,
+        whether the run 'resumed' a previous pass and whether it 'completed' the pass
+    """
+    config = get_config()
+    max_age_hours = config.sweep_max_age_hours if max_age_hours is None else max_age_hours
+    time_budget = config.sweep_time_budget if time_budget is None else time_budget
+    page_size = max(1, min(page_size or config.sweep_page_size, 5000))
+
+    deadline = time.monotonic() + time_budget
+    cutoff = timezone.now() - timedelta(hours=max_age_hours)
+    checkpoint, _ = ContainerCheckpoint.objects.get_or_create(container=container, task=SWEEP_TASK)
+    inventory = get_blob_inventory()
+    container_client = blob_service_client.get_container_client(container)
+
+    result = {
+        'container': container, 'cutoff_time': cutoff.isoformat(), 'resumed': bool(checkpoint.marker),
+        'pages': 0, 'scanned': 0, 'expired': 0, 'deleted': 0, 'failed': 0, 'completed': False,
+    }
+    pages = container_client.list_blobs(results_per_page=page_size).by_page(continuation_token=checkpoint.marker or None)
+    try:
+        for page in pages:
+            expired = []
+            for blob in page:
+                result['scanned'] += 1
+                last_modified = blob.last_modified
+                if last_modified.tzinfo is None:
+                    last_modified = last_modified.replace(tzinfo=dt_timezone.utc)
+                if last_modified < cutoff:
+                    expired.append(blob.name)
+
+            outcome = bulk_delete_blobs(container_client, expired)
+            inventory.forget(container, outcome['deleted'] + outcome['missing'])
+            result['pages'] += 1
+            result['expired'] += len(expired)
+            result['deleted'] += len(outcome['deleted']) + len(outcome['missing'])
+            # Failed deletions are retried on the next pass
+            result['failed'] += len(outcome['failed'])
+
+            # Only checkpoint once the page is done, so a crash repeats a page rather than skipping one
+            checkpoint.marker = pages.continuation_token or ''
+            if not checkpoint.marker:
+                checkpoint.completed_at = timezone.now()
+                result['completed'] = True
+            checkpoint.save()
+            if result['completed'] or time.monotonic() >= deadline:
+                break
+    except ResourceNotFoundError:
+        logger.info(f"Container {container} does not exist - nothing to sweep")
+        result['completed'] = True
+    except HttpResponseError as e:
+        if not result['resumed'] or result['pages']:
+            raise
+        # A stored continuation token Azure no longer accepts; the next run starts a fresh pass
+        logger.warning(f"Checkpoint of {container} sweep rejected, restarting from the beginning: {str(e)}")
+        checkpoint.marker = ''
+        checkpoint.save()
+
+    logger.info(
+        f"Swept {container}: {result['scanned']} blobs in {result['pages']} pages, {result['deleted']} of "
+        f"{result['expired']} expired deleted, {result['failed']} failed, pass "
+        f"{'complete' if result['completed'] else 'continues next run'}"
+    )
+    return result
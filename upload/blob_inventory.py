@@ -0,0 +1,157 @@
+"""
+Database inventory of the blobs in the source, target and cache containers.
+
+Uploads, translations, copies and deletions record what they do in BlobRecord
+rows, so questions like "which blobs does this user have?" are answered by an
+indexed query instead of listing the container. Listings are still the source
+of truth: `python manage.py reconcile_blob_inventory` compares each container
+with its rows and fixes any drift. A container's inventory is only trusted
+while its last reconciliation is recent enough; until the first one, or once
+reconciliations stop, callers fall back to listing it.
+"""
+
+import logging
+import os
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.utils import timezone
+
+from .models import BlobRecord, ContainerCheckpoint
+
+logger = logging.getLogger(__name__)
+
+RECONCILE_TASK = 'reconcile_inventory'
+
+
+class BlobInventory:
+    """
+    Inventory of blobs in the containers the app manages.
+
+    Args:
+        roles (Dict[str, str]): Role ('source', 'target' or 'cache') of each tracked container
+        max_age_hours (float, optional): How long a reconciliation keeps the inventory authoritative;
+            0 or None keeps it authoritative indefinitely
+    """
+
+    def __init__(self, roles: Dict[str, str], max_age_hours: Optional[float] = None):
+        self.roles = roles
+        self.max_age_hours = max_age_hours
+
+    def tracks(self, container: Optional[str]) -> bool:
+        """Whether blobs of this container are recorded."""
+        return container in self.roles
+
+    def is_authoritative(self, container: Optional[str]) -> bool:
+        """Whether the container's inventory was reconciled with a listing recently enough to replace one."""
+        if not self.tracks(container):
+            return False
+        reconciled = ContainerCheckpoint.objects.filter(container=container, task=RECONCILE_TASK, completed_at__isnull=False)
+        if self.max_age_hours:
+            reconciled = reconciled.filter(completed_at__gte=timezone.now() - timedelta(hours=self.max_age_hours))
+        return reconciled.exists()
+
+    def record(self, container: str, name: str, size: Optional[int] = None, etag: Optional[str] = None,
+               last_modified: Optional[datetime] = None):
+        """Record a blob that was written; size and etag left as None keep what is already known."""
+        if not self.tracks(container):
+            return
+        defaults = {'owner_hash': _owner_hash(name), 'role': self.roles[container]}
+        if size is not None:
+            defaults['size'] = size
+        if etag is not None:
+            defaults['etag'] = etag
+        defaults['last_modified'] = last_modified or timezone.now()
+        BlobRecord.objects.update_or_create(container=container, name=name, defaults=defaults)
+
+    def forget(self, container: str, names: Iterable[str]):
+        """Remove records of blobs that were deleted (or found missing)."""
+        names = list(names)
+        if names and self.tracks(container):
+            BlobRecord.objects.filter(container=container, name__in=names).delete()
+
+    def last_modified(self, container: str, names: Iterable[str]) -> Dict[str, datetime]:
+        """Last-Modified times of the named blobs, for records whose times came from storage (they carry an etag)."""
+        names = list(names)
+        found = {}
+        for i in range(0, len(names), 500):
+            found.update(
+                BlobRecord.objects.filter(container=container, name__in=names[i:i + 500], last_modified__isnull=False)
+                .exclude(etag='').values_list('name', 'last_modified')
+            )
+        return found
+
+    def names(self, container: str, owner_hash: str, modified_before: Optional[datetime] = None) -> List[str]:
+        """Names of a user's blobs in a container, optionally only those last modified before a time."""
+        records = BlobRecord.objects.filter(container=container, owner_hash=owner_hash)
+        if modified_before is not None:
+            records = records.filter(last_modified__lt=modified_before)
+        return list(records.order_by('name').values_list('name', flat=True))
+
+    def has_blobs(self, container: str, owner_hash: str) -> bool:
+        """Whether a user has any blob in a container."""
+        return BlobRecord.objects.filter(container=container, owner_hash=owner_hash).exists()
+
+    def reconcile(self, blob_service_client: Any, container: str) -> Dict[str, int]:
+        """
+        Make the container's records match a full listing, then mark the inventory authoritative.
+
+        Records written while the listing runs are kept even if the listing missed them.
+
+        Returns:
+            Dict[str, int]: Numbers of blobs 'listed' and records 'created', 'updated' and 'removed'
+        """
+        started = timezone.now()
+        existing = {
+            record.name: record
+            for record in BlobRecord.objects.filter(container=container).only('name', 'size', 'etag', 'last_modified')
+        }
+        counts = {'listed': 0, 'created': 0, 'updated': 0, 'removed': 0}
+        listed = set()
+        to_create = []
+        for blob in blob_service_client.get_container_client(container).list_blobs():
+            counts['listed'] += 1
+            listed.add(blob.name)
+            record = existing.get(blob.name)
+            if record is None:
+                to_create.append(BlobRecord(
+                    container=container, name=blob.name, size=blob.size or 0, etag=blob.etag or '',
+                    last_modified=blob.last_modified, owner_hash=_owner_hash(blob.name), role=self.roles[container]
+                ))
+            elif (record.size, record.etag, record.last_modified) != (blob.size or 0, blob.etag or '', blob.last_modified):
+                BlobRecord.objects.filter(pk=record.pk).update(
+                    size=blob.size or 0, etag=blob.etag or '', last_modified=blob.last_modified
+                )
+                counts['updated'] += 1
+        BlobRecord.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+        counts['created'] = len(to_create)
+
+        stale = [name for name in existing if name not in listed]
+        for i in range(0, len(stale), 500):
+            counts['removed'] += BlobRecord.objects.filter(
+                container=container, name__in=stale[i:i + 500], updated_at__lt=started
+            ).delete()[0]
+
+        ContainerCheckpoint.objects.update_or_create(
+            container=container, task=RECONCILE_TASK, defaults={'completed_at': timezone.now()}
+        )
+        logger.info(f"Reconciled blob inventory of {container}: {counts}")
+        return counts
+
+
+def _owner_hash(name: str) -> str:
+    # Blobs are laid out as <user_id_hash>/...; anything else has no owner
+    return name.split('/', 1)[0] if '/' in name else ''
+
+
+def get_blob_inventory() -> BlobInventory:
+    """Build the inventory for the configured source, target and cache containers."""
+    from services.config import get_config
+    roles = {
+        os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source'): 'source',
+        os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target'): 'target',
+    }
+    config = get_config()
+    if config.cache_enabled:
+        roles.setdefault(config.cache_container, 'cache')
+    return BlobInventory(roles, max_age_hours=config.inventory_max_age_hours)
@@ -0,0 +1,173 @@
+"""
+Blob deletions queued as tombstones and drained in the background.
+
+Replacing a user's documents used to delete every old source blob and each
+possible translation path before the upload could finish, one storage round
+trip per blob, so the request got slower the more files the user had.
+DeletionQueue.bury() records a BlobTombstone per blob instead and returns at
+once. From then on the blob counts as deleted: it leaves the blob inventory and
+translations skip it when listing a user's files. `python manage.py
+run_blob_deleter` removes buried blobs from storage in batches and retries
+failures with backoff.
+
+A tombstone only deletes the blob as it was when buried: the delete is
+conditional on the blob not having been written since, so a file uploaded or
+translated again under the same name is never lost. The condition compares
+against storage's own Last-Modified time, taken from the caller's listing or
+the blob inventory when known; otherwise the burial time plus CLOCK_SKEW is
+used, so a host clock running behind Azure cannot keep a blob forever. Code
+about to write a blob also cancel()s its tombstone, so a rewrite within that
+margin and uncommitted blocks are not deleted with it.
+"""
+
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.db.models import Q
+from django.utils import timezone
+
+from services.blob_operations import bulk_delete_blobs
+from services.config import get_config
+from services.sas import CLOCK_SKEW
+from .blob_inventory import _owner_hash, get_blob_inventory
+from .models import BlobTombstone
+
+logger = logging.getLogger(__name__)
+
+# Failed deletions are retried after 30s, 60s, 120s, ... up to an hour
+RETRY_BASE_SECONDS = 30
+RETRY_MAX_SECONDS = 3600
+
+
+class DeletionQueue:
+    """Tombstones for blobs that are deleted logically now and physically by run_blob_deleter."""
+
+    def bury(self, container: str, names: Iterable[str], last_modified: Optional[Dict[str, datetime]] = None) -> List[str]:
+        """
+        Mark blobs deleted and queue them for removal. Returns the names buried.
+
+        Args:
+            last_modified (Dict[str, datetime], optional): Last-Modified times storage reported for some of the blobs,
+                e.g. from a listing. The blob inventory is consulted for the others.
+        """
+        names = list(dict.fromkeys(name for name in names if name))
+        if not names:
+            return []
+        now = timezone.now()
+        inventory = get_blob_inventory()
+        known = inventory.last_modified(container, names)
+        known.update(last_modified or {})
+        BlobTombstone.objects.bulk_create(
+            [
+                BlobTombstone(
+                    container=container, name=name, owner_hash=_owner_hash(name), buried_at=now,
+                    last_modified=known.get(name), next_attempt_at=now
+                )
+                for name in names
+            ],
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=['container', 'name'],
+            update_fields=['buried_at', 'last_modified', 'next_attempt_at', 'attempts', 'last_error'],
+        )
+        inventory.forget(container, names)
+        logger.info(f"Queued {len(names)} blobs in {container} for deletion")
+        return names
+
+    def cancel(self, container: str, names: Iterable[str]):
+        """Drop the tombstones of blobs that are about to be written again."""
+        names = list(names)
+        if names:
+            BlobTombstone.objects.filter(container=container, name__in=names).delete()
+
+    def buried(self, container: str, names: Iterable[str]) -> Set[str]:
+        """Which of the names are deleted but possibly still in storage."""
+        names = list(names)
+        result = set()
+        for i in range(0, len(names), 500):
+            result.update(
+                BlobTombstone.objects.filter(container=container, name__in=names[i:i + 500]).values_list('name', flat=True)
+            )
+        return result
+
+    def backlog(self) -> Dict[str, int]:
+        """Numbers of tombstones 'queued' in total and 'retrying' after a failed attempt."""
+        return {
+            'queued': BlobTombstone.objects.count(),
+            'retrying': BlobTombstone.objects.filter(attempts__gt=0).count(),
+        }
+
+    def drain(self, blob_service_client: Any, limit: Optional[int] = None) -> Dict[str, int]:
+        """
+        Delete up to `limit` buried blobs that are due, oldest first.
+
+        Returns:
+            Dict[str, int]: Numbers of blobs 'deleted', already 'missing', 'modified' since burial
+            (kept) and 'failed' (retried later)
+        """
+        limit = limit or get_config().async_delete_drain_size
+        now = timezone.now()
+        due = list(BlobTombstone.objects.filter(next_attempt_at__lte=now).order_by('next_attempt_at')[:limit])
+        counts = {'deleted': 0, 'missing': 0, 'modified': 0, 'failed': 0}
+        if not due:
+            return counts
+
+        by_container = defaultdict(list)
+        for tombstone in due:
+            by_container[tombstone.container].append(tombstone)
+
+        for container, tombstones in by_container.items():
+            unmodified_since = {
+                tombstone.name: tombstone.last_modified or tombstone.buried_at + CLOCK_SKEW for tombstone in tombstones
+            }
+            try:
+                result = bulk_delete_blobs(
+                    blob_service_client.get_container_client(container), list(unmodified_since),
+                    unmodified_since=unmodified_since
+                )
+            except Exception as e:
+                logger.error(f"Deleting {len(tombstones)} buried blobs from {container} failed: {str(e)}")
+                result = {'deleted': [], 'missing': [], 'modified': [], 'failed': [
+                    {'name': tombstone.name, 'error': str(e)} for tombstone in tombstones
+                ]}
+
+            for key in counts:
+                counts[key] += len(result[key])
+            done = set(result['deleted'] + result['missing'] + result['modified'])
+            self._remove([tombstone for tombstone in tombstones if tombstone.name in done])
+
+            errors = {failure['name']: failure['error'] for failure in result['failed']}
+            for tombstone in tombstones:
+                if tombstone.name in errors:
+                    delay = min(RETRY_BASE_SECONDS * 2 ** tombstone.attempts, RETRY_MAX_SECONDS)
+                    BlobTombstone.objects.filter(pk=tombstone.pk, buried_at=tombstone.buried_at).update(
+                        attempts=tombstone.attempts + 1,
+                        next_attempt_at=now + timedelta(seconds=delay),
+                        last_error=errors[tombstone.name][:1000],
+                    )
+
+        logger.info(
+            f"Blob deleter: {counts['deleted']} deleted, {counts['missing']} already gone, "
+            f"{counts['modified']} rewritten and kept, {counts['failed']} failed"
+        )
+        return counts
+
+    def _remove(self, tombstones: List[BlobTombstone]):
+        # A blob buried again while being drained keeps its newer tombstone
+        for i in range(0, len(tombstones), 100):
+            chunk = tombstones[i:i + 100]
+            if chunk:
+                BlobTombstone.objects.filter(
+                    reduce(or_, (Q(pk=tombstone.pk, buried_at=tombstone.buried_at) for tombstone in chunk))
+                ).delete()
+
+
+def get_deletion_queue() -> Optional[DeletionQueue]:
+    """The deletion queue when AZURE_ASYNC_DELETE_ENABLED is set, else None (blobs are deleted inline)."""
+    if not get_config().async_delete_enabled:
+        return None
+    return DeletionQueue()
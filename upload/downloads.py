@@ -0,0 +1,99 @@
+"""
+Streaming blob downloads with HTTP Range support.
+
+download_blob().readall() holds the whole document in the worker before the
+first byte is sent, and even download_blob().chunks() fetches up to the SDK's
+32 MiB max_single_get_size before yielding anything. iter_blob_range() instead
+fetches fixed-size ranges and yields each as soon as it arrives, so
+time-to-first-byte and memory per download do not depend on the file size.
+Large downloads can prefetch a few ranges in parallel to keep throughput up.
+"""
+
+import logging
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterator, Optional, Tuple
+
+from azure.core import MatchConditions
+
+logger = logging.getLogger(__name__)
+
+BYTE_RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def parse_byte_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header against a blob of `size` bytes.
+
+    Only a single byte range is supported; anything else (multiple ranges, other units)
+    is ignored, which RFC 9110 allows, and the whole blob is served.
+
+    Returns:
+        Tuple[int, int]: First and last byte (inclusive), or None to serve the whole blob
+
+    Raises:
+        ValueError: If the range cannot be satisfied (416)
+    """
+    match = BYTE_RANGE_PATTERN.match((header or '').strip())
+    if not match or match.group(1) == match.group(2) == '':
+        return None
+
+    first, last = match.group(1), match.group(2)
+    if first == '':
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise ValueError("Range starts beyond the end of the blob")
+    return start, end
+
+
+def iter_blob_range(blob_client: Any, offset: int, length: int, chunk_size: int,
+                    prefetch: int = 1, etag: Optional[str] = None) -> Iterator[bytes]:
+    """
+    Yield `length` bytes of a blob from `offset`, one `chunk_size` range request at a time.
+
+    Args:
+        blob_client: BlobClient of the blob to read
+        offset (int): First byte to read
+        length (int): Number of bytes to read
+        chunk_size (int): Bytes fetched per request
+        prefetch (int): Ranges fetched ahead in parallel; at most this many chunks are held in memory
+        etag (str): If given, reads fail instead of mixing content should the blob be replaced mid-download
+
+    Yields:
+        bytes: Consecutive chunks of the range
+    """
+    conditions = {'etag': etag, 'match_condition': MatchConditions.IfNotModified} if etag else {}
+
+    def fetch(start: int) -> bytes:
+        return blob_client.download_blob(
+            offset=start, length=min(chunk_size, offset + length - start), **conditions
+        ).readall()
+
+    starts = iter(range(offset, offset + length, chunk_size))
+    if prefetch <= 1:
+        for start in starts:
+            yield fetch(start)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=prefetch)
+    pending = deque()
+    try:
+        for start in starts:
+            pending.append(executor.submit(fetch, start))
+            if len(pending) >= prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Reached on completion, on error and when the client disconnects (the response closes the generator)
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
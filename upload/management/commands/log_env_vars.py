@@ -24,6 +24,7 @@ class Command(BaseCommand):
                 'AZURE_STORAGE_CONNECTION_STRING',
                 'AZURE_STORAGE_CONTAINER_NAME_SOURCE',
                 'AZURE_STORAGE_CONTAINER_NAME_TARGET',
+                'AZURE_STORAGE_CONTAINER_NAME_CACHE',
                 'AZURE_TRANSLATION_KEY',
                 'AZURE_TRANSLATION_ENDPOINT',
                 'AZURE_TRANSLATION_SOURCE_URI',
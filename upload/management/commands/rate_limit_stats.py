@@ -0,0 +1,28 @@
+import json
+import logging
+from django.core.management.base import BaseCommand, CommandError
+
+from services.rate_limit import get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Show per-bucket wait-time stats of the shared Azure rate limiter'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--reset',
+            action='store_true',
+            help='Clear the accumulated stats after printing them',
+        )
+
+    def handle(self, *args, **options):
+        limiter = get_rate_limiter()
+        if limiter is None:
+            raise CommandError('Rate limiting is disabled (AZURE_RATE_LIMIT_ENABLED=False)')
+
+        self.stdout.write(json.dumps(limiter.stats(), indent=2))
+
+        if options['reset']:
+            limiter.backend.reset_stats()
+            self.stdout.write(self.style.SUCCESS('Rate limiter stats reset'))
@@ -0,0 +1,45 @@
+import json
+import logging
+from django.core.management.base import BaseCommand, CommandError
+
+from services.clients import get_blob_service_client
+from upload.blob_inventory import get_blob_inventory
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Reconcile the blob inventory with full listings of the source, target and cache containers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--container',
+            action='append',
+            default=[],
+            help='Only reconcile this container (may be repeated; default: every tracked container)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            blob_service_client = get_blob_service_client()
+        except ValueError as e:
+            raise CommandError(str(e))
+        if blob_service_client is None:
+            raise CommandError('AZURE_STORAGE_CONNECTION_STRING is not configured')
+
+        inventory = get_blob_inventory()
+        containers = options['container'] or list(inventory.roles)
+        untracked = [container for container in containers if not inventory.tracks(container)]
+        if untracked:
+            raise CommandError(f"Not a tracked container: {', '.join(untracked)}")
+
+        results = {}
+        for container in containers:
+            try:
+                results[container] = inventory.reconcile(blob_service_client, container)
+            except Exception as e:
+                logger.error(f"Reconciling blob inventory of {container} failed: {str(e)}")
+                results[container] = {'error': str(e)}
+
+        self.stdout.write(json.dumps(results, indent=2))
+        if any('error' in result for result in results.values()):
+            raise CommandError('Some containers could not be reconciled')
@@ -0,0 +1,60 @@
+import json
+import logging
+import signal
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+from services.clients import get_blob_service_client
+from upload.deletion_queue import DeletionQueue
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Run the background deleter that removes queued (tombstoned) blobs from storage'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=5.0,
+            help='Seconds to wait between queue checks when nothing is due (default: 5)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Delete everything currently due and exit',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            blob_service_client = get_blob_service_client()
+        except ValueError as e:
+            raise CommandError(str(e))
+        if blob_service_client is None:
+            raise CommandError('AZURE_STORAGE_CONNECTION_STRING is not configured')
+
+        queue = DeletionQueue()
+        poll_interval = options['poll_interval']
+        self._stopping = False
+
+        def request_stop(signum, frame):
+            # Finish the round in progress, then exit
+            logger.info(f"Blob deleter received signal {signum}, stopping after current round")
+            self._stopping = True
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        self.stdout.write(self.style.SUCCESS(f'Blob deleter started ({json.dumps(queue.backlog())})'))
+        totals = {'deleted': 0, 'missing': 0, 'modified': 0, 'failed': 0}
+
+        while not self._stopping:
+            counts = queue.drain(blob_service_client)
+            for key in totals:
+                totals[key] += counts[key]
+            if not any(counts.values()):
+                if options['once']:
+                    break
+                time.sleep(poll_interval)
+
+        self.stdout.write(self.style.SUCCESS(f'Blob deleter stopped: {json.dumps(totals)}'))
@@ -0,0 +1,112 @@
+import logging
+import signal
+import time
+from django.core.management.base import BaseCommand, CommandError
+
+from upload.models import TranslationJob
+from upload.translation_jobs import default_worker_id, process_translation_batch, process_translation_job
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Run the background worker that executes queued translation jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=2.0,
+            help='Seconds to wait between queue checks when no job is available (default: 2)',
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Process all currently queued jobs and exit',
+        )
+        parser.add_argument(
+            '--lease-seconds',
+            type=int,
+            default=300,
+            help='Seconds a claimed job stays reserved without a progress update before another worker may resume it (default: 300)',
+        )
+        parser.add_argument(
+            '--batch-window',
+            type=float,
+            default=None,
+            help='Seconds to wait for more queued jobs to submit together as one Azure operation; 0 disables (default: TRANSLATION_BATCH_WINDOW_SECONDS or 2)',
+        )
+        parser.add_argument(
+            '--batch-max-jobs',
+            type=int,
+            default=None,
+            help='Maximum number of jobs submitted as one Azure operation (default: TRANSLATION_BATCH_MAX_JOBS or 20)',
+        )
+        parser.add_argument(
+            '--worker-id',
+            default='',
+            help='Identifier recorded on claimed jobs (default: hostname:pid)',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from services.config import get_config
+            from services.translation_service import create_translation_service
+            from upload.blob_inventory import get_blob_inventory
+            from upload.deletion_queue import get_deletion_queue
+            from upload.translation_cache import get_translation_cache
+            translation_service = create_translation_service(
+                translation_cache=get_translation_cache(),
+                blob_inventory=get_blob_inventory(),
+                deletion_queue=get_deletion_queue()
+            )
+        except Exception as e:
+            raise CommandError(f"Translation service could not be created: {str(e)}")
+
+        worker_id = options['worker_id'] or default_worker_id()
+        poll_interval = options['poll_interval']
+        lease_seconds = options['lease_seconds']
+        config = get_config()
+        batch_window = options['batch_window'] if options['batch_window'] is not None else config.batch_window_seconds
+        batch_max_jobs = options['batch_max_jobs'] or config.batch_max_jobs
+        self._stopping = False
+
+        def request_stop(signum, frame):
+            # Finish the job in progress, then exit
+            logger.info(f"Translation worker {worker_id} received signal {signum}, stopping after current job")
+            self._stopping = True
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+        self.stdout.write(self.style.SUCCESS(f'Translation worker {worker_id} started'))
+        processed = 0
+
+        while not self._stopping:
+            job = TranslationJob.claim_next(worker_id, lease_seconds=lease_seconds)
+            if job is None:
+                if options['once']:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            if job.continuation_token or batch_window <= 0 or batch_max_jobs <= 1:
+                # Jobs being resumed already have their own Azure operation
+                process_translation_job(job, translation_service, lease_seconds=lease_seconds)
+                processed += 1
+                continue
+
+            jobs = [job] + TranslationJob.claim_queued(
+                worker_id, batch_max_jobs - 1, exclude_user_id_hashes=[job.user_id_hash], lease_seconds=lease_seconds
+            )
+            if 1 < len(jobs) < batch_max_jobs:
+                # Other users' requests are arriving too: give the burst a moment so it shares one Azure operation.
+                # A job that is alone in the queue is submitted straight away.
+                time.sleep(batch_window)
+                jobs += TranslationJob.claim_queued(
+                    worker_id, batch_max_jobs - len(jobs),
+                    exclude_user_id_hashes=[claimed.user_id_hash for claimed in jobs], lease_seconds=lease_seconds
+                )
+            process_translation_batch(jobs, translation_service, lease_seconds=lease_seconds)
+            processed += len(jobs)
+
+        self.stdout.write(self.style.SUCCESS(f'Translation worker {worker_id} stopped after {processed} job(s)'))
@@ -0,0 +1,54 @@
+import json
+import logging
+import os
+from django.core.management.base import BaseCommand, CommandError
+
+from services.clients import get_blob_service_client
+from upload.blob_expiry import SWEEP_TASK, sweep_expired_blobs
+from upload.models import ContainerCheckpoint
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Delete expired blobs page by page, resuming from where the previous run stopped'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--container',
+            default=os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target'),
+            help='Container to sweep (default: the target container)',
+        )
+        parser.add_argument(
+            '--max-age-hours',
+            type=int,
+            help='Delete blobs last modified longer ago than this (default: AZURE_SWEEP_MAX_AGE_HOURS)',
+        )
+        parser.add_argument(
+            '--time-budget',
+            type=float,
+            help='Seconds to run before checkpointing and stopping (default: AZURE_SWEEP_TIME_BUDGET_SECONDS)',
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Discard the stored checkpoint and start a new pass from the beginning of the container',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            blob_service_client = get_blob_service_client()
+        except ValueError as e:
+            raise CommandError(str(e))
+        if blob_service_client is None:
+            raise CommandError('AZURE_STORAGE_CONNECTION_STRING is not configured')
+
+        if options['restart']:
+            ContainerCheckpoint.objects.filter(container=options['container'], task=SWEEP_TASK).update(marker='')
+
+        result = sweep_expired_blobs(
+            blob_service_client,
+            options['container'],
+            max_age_hours=options['max_age_hours'],
+            time_budget=options['time_budget'],
+        )
+        self.stdout.write(json.dumps(result, indent=2))
@@ -0,0 +1,28 @@
+import json
+import logging
+from django.core.management.base import BaseCommand, CommandError
+
+from upload.translation_cache import get_translation_cache
+
+logger = logging.getLogger(__name__)
+
+class Command(BaseCommand):
+    help = 'Show translation cache statistics and optionally evict expired or excess entries'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--evict',
+            action='store_true',
+            help='Evict entries past TRANSLATION_CACHE_MAX_AGE_DAYS or beyond TRANSLATION_CACHE_MAX_BYTES',
+        )
+
+    def handle(self, *args, **options):
+        cache = get_translation_cache()
+        if cache is None:
+            raise CommandError('Translation cache is disabled (TRANSLATION_CACHE_ENABLED=False)')
+
+        if options['evict']:
+            evicted = cache.evict()
+            self.stdout.write(self.style.SUCCESS(f'Evicted {evicted} cache entries'))
+
+        self.stdout.write(json.dumps(cache.stats(), indent=2))
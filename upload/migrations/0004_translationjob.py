@@ -0,0 +1,39 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:33
+
+import django.core.serializers.json
+from django.db import migrations, models
+import uuid
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0003_usersession_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TranslationJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('job_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('user_email', models.EmailField(max_length=254)),
+                ('user_id_hash', models.CharField(db_index=True, max_length=64)),
+                ('target_language', models.CharField(max_length=10)),
+                ('source_language', models.CharField(blank=True, max_length=10, null=True)),
+                ('clear_target', models.BooleanField(default=True)),
+                ('cleanup_source', models.BooleanField(default=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=20)),
+                ('operation_id', models.CharField(blank=True, default='', max_length=64)),
+                ('result', models.JSONField(blank=True, encoder=django.core.serializers.json.DjangoJSONEncoder, null=True)),
+                ('error', models.TextField(blank=True, default='')),
+                ('worker_id', models.CharField(blank=True, default='', max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='upload_tran_status_c6309b_idx'), models.Index(fields=['user_id_hash', 'created_at'], name='upload_tran_user_id_dac605_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:35
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0004_translationjob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationjob',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='continuation_token',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='documents',
+            field=models.JSONField(blank=True, default=list, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='last_polled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='submitted_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='translationjob',
+            index=models.Index(fields=['status', 'lease_expires_at'], name='upload_tran_status_7e87e0_idx'),
+        ),
+    ]
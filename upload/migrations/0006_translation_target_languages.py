@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0005_translationjob_resume_state'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='translated_languages',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='target_languages',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
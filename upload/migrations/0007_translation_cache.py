@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0006_translation_target_languages'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='cache_hits',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='cache_misses',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.CreateModel(
+            name='TranslationCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_hash', models.CharField(max_length=64)),
+                ('source_language', models.CharField(blank=True, default='', max_length=10)),
+                ('target_language', models.CharField(max_length=10)),
+                ('glossary', models.CharField(blank=True, default='', max_length=500)),
+                ('blob_name', models.CharField(max_length=500)),
+                ('size_bytes', models.BigIntegerField(default=0)),
+                ('hit_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('last_used_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['last_used_at'], name='upload_tran_last_us_92cea3_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='translationcacheentry',
+            constraint=models.UniqueConstraint(fields=('content_hash', 'source_language', 'target_language', 'glossary'), name='unique_translation_cache_key'),
+        ),
+    ]
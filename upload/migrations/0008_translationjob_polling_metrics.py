@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0007_translation_cache'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationjob',
+            name='detection_lag_seconds',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='translationjob',
+            name='status_calls',
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 22:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0008_translationjob_polling_metrics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationjob',
+            name='progress',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0009_translationjob_progress'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlobRecord',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('container', models.CharField(max_length=63)),
+                ('name', models.CharField(max_length=1024)),
+                ('size', models.BigIntegerField(default=0)),
+                ('etag', models.CharField(blank=True, default='', max_length=100)),
+                ('last_modified', models.DateTimeField(blank=True, null=True)),
+                ('owner_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('role', models.CharField(choices=[('source', 'Source'), ('target', 'Target'), ('cache', 'Cache')], max_length=10)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='ContainerCheckpoint',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('container', models.CharField(max_length=63)),
+                ('task', models.CharField(max_length=50)),
+                ('marker', models.TextField(blank=True, default='')),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='containercheckpoint',
+            constraint=models.UniqueConstraint(fields=('container', 'task'), name='unique_container_checkpoint'),
+        ),
+        migrations.AddIndex(
+            model_name='blobrecord',
+            index=models.Index(fields=['container', 'owner_hash'], name='upload_blob_contain_3a3b52_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='blobrecord',
+            index=models.Index(fields=['container', 'last_modified'], name='upload_blob_contain_7053b4_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='blobrecord',
+            constraint=models.UniqueConstraint(fields=('container', 'name'), name='unique_blob_record'),
+        ),
+    ]
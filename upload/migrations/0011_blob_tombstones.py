@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0010_blob_inventory'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BlobTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('container', models.CharField(max_length=63)),
+                ('name', models.CharField(max_length=1024)),
+                ('owner_hash', models.CharField(blank=True, default='', max_length=64)),
+                ('buried_at', models.DateTimeField()),
+                ('attempts', models.PositiveIntegerField(default=0)),
+                ('next_attempt_at', models.DateTimeField()),
+                ('last_error', models.TextField(blank=True, default='')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['next_attempt_at'], name='upload_blob_next_at_2f5248_idx'), models.Index(fields=['container', 'owner_hash'], name='upload_blob_contain_99bd4d_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='blobtombstone',
+            constraint=models.UniqueConstraint(fields=('container', 'name'), name='unique_blob_tombstone'),
+        ),
+    ]
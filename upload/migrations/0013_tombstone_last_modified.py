@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0012_upload_sessions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='blobtombstone',
+            name='last_modified',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0013_tombstone_last_modified'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='client_content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='uploadsession',
+            name='client_content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
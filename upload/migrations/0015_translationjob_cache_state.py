@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:51
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('upload', '0014_client_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='translationjob',
+            name='cache_state',
+            field=models.JSONField(blank=True, default=dict, encoder=django.core.serializers.json.DjangoJSONEncoder),
+        ),
+    ]
@@ -1,5 +1,7 @@
 from django.db import models
+from django.core.serializers.json import DjangoJSONEncoder
 import hashlib
+import uuid
 
 class Document(models.Model):
     title = models.CharField(max_length=255)
@@ -9,8 +11,11 @@ class Document(models.Model):
     user_id_hash = models.CharField(max_length=64, db_index=True, default='')
     blob_name = models.CharField(max_length=500)  # Original filename
     user_blob_name = models.CharField(max_length=500, default='')  # User-specific blob name
+    content_hash = models.CharField(max_length=64, blank=True, default='')  # SHA-256 of the uploaded bytes
+    client_content_hash = models.CharField(max_length=64, blank=True, default='')  # SHA-256 the browser reported; never keys the shared cache
     is_translated = models.BooleanField(default=False)
     translation_language = models.CharField(max_length=10, blank=True, null=True)
+    translated_languages = models.JSONField(default=list, blank=True)  # Every language a translation exists for
     
     def __str__(self):
         return f"{self.title} - {self.user_email}"
@@ -51,4 +56,356 @@ class UserSession(models.Model):
         indexes = [
             models.Index(fields=['session_key']),
             models.Index(fields=['user_email']),
-        ]
\ No newline at end of file
+        ]
+
+class TranslationJob(models.Model):
+    """A translation request queued by the web tier and executed by a background worker."""
+
+    STATUS_QUEUED = 'queued'
+    STATUS_RUNNING = 'running'
+    STATUS_SUCCEEDED = 'succeeded'
+    STATUS_FAILED = 'failed'
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, 'Queued'),
+        (STATUS_RUNNING, 'Running'),
+        (STATUS_SUCCEEDED, 'Succeeded'),
+        (STATUS_FAILED, 'Failed'),
+    ]
+    FINISHED_STATUSES = (STATUS_SUCCEEDED, STATUS_FAILED)
+
+    job_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user_email = models.EmailField()
+    user_id_hash = models.CharField(max_length=64, db_index=True)
+    target_language = models.CharField(max_length=10)  # First requested language
+    target_languages = models.JSONField(default=list, blank=True)  # All requested languages
+    source_language = models.CharField(max_length=10, blank=True, null=True)
+    clear_target = models.BooleanField(default=True)
+    cleanup_source = models.BooleanField(default=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    operation_id = models.CharField(max_length=64, blank=True, default='')  # Azure translation operation ID
+    continuation_token = models.TextField(blank=True, default='')  # Poller token used to resume after a restart
+    documents = models.JSONField(default=list, blank=True, encoder=DjangoJSONEncoder)  # Per-document state
+    progress = models.JSONField(default=dict, blank=True)  # Document counts reported while the operation runs
+    result = models.JSONField(blank=True, null=True, encoder=DjangoJSONEncoder)
+    error = models.TextField(blank=True, default='')
+    worker_id = models.CharField(max_length=100, blank=True, default='')
+    attempts = models.PositiveIntegerField(default=0)
+    cache_hits = models.PositiveIntegerField(default=0)  # Translations served from the translation cache
+    cache_misses = models.PositiveIntegerField(default=0)  # Translations that had to be sent to Azure
+    cache_state = models.JSONField(default=dict, blank=True, encoder=DjangoJSONEncoder)  # Cache hits and source hashes a resumed job merges back in
+    status_calls = models.PositiveIntegerField(default=0)  # Azure status requests spent waiting on the operation
+    detection_lag_seconds = models.FloatField(blank=True, null=True)  # Delay between Azure finishing and us noticing
+    lease_expires_at = models.DateTimeField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(blank=True, null=True)
+    submitted_at = models.DateTimeField(blank=True, null=True)
+    last_polled_at = models.DateTimeField(blank=True, null=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"Translation job {self.job_id} ({self.status}) - {self.user_email}"
+
+    @property
+    def is_finished(self):
+        return self.status in self.FINISHED_STATUSES
+
+    def to_dict(self):
+        """Serialize the job for the status API."""
+        return {
+            'job_id': str(self.job_id),
+            'status': self.status,
+            'target_language': self.target_language,
+            'target_languages': self.target_languages or [self.target_language],
+            'source_language': self.source_language,
+            'operation_id': self.operation_id or None,
+            'error': self.error or None,
+            'attempts': self.attempts,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+            'status_calls': self.status_calls,
+            'detection_lag_seconds': self.detection_lag_seconds,
+            'documents': self.documents or [],
+            'progress': self.progress or {},
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
+            'last_polled_at': self.last_polled_at.isoformat() if self.last_polled_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    @staticmethod
+    def claim_next(worker_id, lease_seconds=300, max_attempts=None):
+        """
+        Atomically claim the oldest runnable job for a worker.
+        A job is runnable when it is queued, or when it is running but the worker
+        holding it stopped renewing its lease (e.g. the container restarted).
+        Runnable jobs already claimed `max_attempts` times (TRANSLATION_JOB_MAX_ATTEMPTS by
+        default) are failed instead, so a job that keeps killing its worker is not retried forever.
+        Returns the claimed job, or None when nothing is runnable.
+        """
+        from datetime import timedelta
+        from django.db.models import F, Q
+        from django.utils import timezone
+        from services.config import get_config
+        if max_attempts is None:
+            max_attempts = get_config().job_max_attempts
+        now = timezone.now()
+        runnable = Q(status=TranslationJob.STATUS_QUEUED) | Q(
+            status=TranslationJob.STATUS_RUNNING, lease_expires_at__lt=now
+        )
+        TranslationJob.objects.filter(runnable, attempts__gte=max_attempts).update(
+            status=TranslationJob.STATUS_FAILED,
+            error=f"Gave up after {max_attempts} attempt(s): the worker stopped before the job finished",
+            finished_at=now,
+            lease_expires_at=None
+        )
+        candidates = TranslationJob.objects.filter(runnable).order_by('created_at').values_list('id', flat=True)[:5]
+
+        for job_pk in candidates:
+            # Conditional update so two workers can never claim the same job
+            claimed = TranslationJob.objects.filter(runnable, id=job_pk).update(
+                status=TranslationJob.STATUS_RUNNING,
+                worker_id=worker_id,
+                attempts=F('attempts') + 1,
+                lease_expires_at=now + timedelta(seconds=lease_seconds)
+            )
+            if claimed:
+                job = TranslationJob.objects.get(id=job_pk)
+                if job.started_at is None:
+                    job.started_at = now
+                    job.save(update_fields=['started_at'])
+                return job
+        return None
+
+    @staticmethod
+    def claim_queued(worker_id, limit, exclude_user_id_hashes=(), lease_seconds=300):
+        """
+        Claim up to `limit` more queued jobs to submit together with one already claimed.
+        Jobs for users in `exclude_user_id_hashes` are skipped, and at most one job per user is taken.
+        Returns the list of claimed jobs (possibly empty).
+        """
+        from datetime import timedelta
+        from django.db.models import F
+        from django.utils import timezone
+        now = timezone.now()
+        excluded = set(exclude_user_id_hashes)
+        candidates = TranslationJob.objects.filter(
+            status=TranslationJob.STATUS_QUEUED
+        ).exclude(user_id_hash__in=excluded).order_by('created_at').values_list('id', 'user_id_hash')[:limit * 2]
+
+        claimed_jobs = []
+        for job_pk, user_id_hash in candidates:
+            if len(claimed_jobs) >= limit:
+                break
+            if user_id_hash in excluded:
+                continue
+            # Conditional update so two workers can never claim the same job
+            claimed = TranslationJob.objects.filter(id=job_pk, status=TranslationJob.STATUS_QUEUED).update(
+                status=TranslationJob.STATUS_RUNNING,
+                worker_id=worker_id,
+                attempts=F('attempts') + 1,
+                started_at=now,
+                lease_expires_at=now + timedelta(seconds=lease_seconds)
+            )
+            if claimed:
+                excluded.add(user_id_hash)
+                claimed_jobs.append(TranslationJob.objects.get(id=job_pk))
+        return claimed_jobs
+
+    def renew_lease(self, lease_seconds=300):
+        """Extend this worker's claim on the job."""
+        from datetime import timedelta
+        from django.utils import timezone
+        self.lease_expires_at = timezone.now() + timedelta(seconds=lease_seconds)
+        self.save(update_fields=['lease_expires_at'])
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+            models.Index(fields=['status', 'lease_expires_at']),
+            models.Index(fields=['user_id_hash', 'created_at']),
+        ]
+
+
+class TranslationCacheEntry(models.Model):
+    """A translated document kept in the cache container, reusable for any upload with the same content."""
+
+    content_hash = models.CharField(max_length=64)  # SHA-256 of the source document bytes
+    source_language = models.CharField(max_length=10, blank=True, default='')  # Empty when auto-detected
+    target_language = models.CharField(max_length=10)
+    glossary = models.CharField(max_length=500, blank=True, default='')  # Glossary URL, empty when none
+    blob_name = models.CharField(max_length=500)  # Blob in the cache container
+    size_bytes = models.BigIntegerField(default=0)
+    hit_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Cached {self.content_hash[:12]} -> {self.target_language}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['content_hash', 'source_language', 'target_language', 'glossary'],
+                name='unique_translation_cache_key'
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['last_used_at']),
+        ]
+
+
+class BlobRecord(models.Model):
+    """A blob in one of the app's containers, so per-user lookups are indexed queries instead of list_blobs calls."""
+
+    ROLE_CHOICES = [
+        ('source', 'Source'),
+        ('target', 'Target'),
+        ('cache', 'Cache'),
+    ]
+
+    container = models.CharField(max_length=63)
+    name = models.CharField(max_length=1024)
+    size = models.BigIntegerField(default=0)  # 0 until known, e.g. for translator output before reconciliation
+    etag = models.CharField(max_length=100, blank=True, default='')
+    last_modified = models.DateTimeField(null=True, blank=True)
+    owner_hash = models.CharField(max_length=64, blank=True, default='')  # user_id_hash prefix, empty when none
+    role = models.CharField(max_length=10, choices=ROLE_CHOICES)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.container}/{self.name}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['container', 'name'], name='unique_blob_record'),
+        ]
+        indexes = [
+            models.Index(fields=['container', 'owner_hash']),
+            models.Index(fields=['container', 'last_modified']),
+        ]
+
+
+class ContainerCheckpoint(models.Model):
+    """Progress of a periodic task over a whole container (e.g. the last inventory reconciliation)."""
+
+    container = models.CharField(max_length=63)
+    task = models.CharField(max_length=50)
+    marker = models.TextField(blank=True, default='')  # Listing continuation token to resume from, empty at the start
+    completed_at = models.DateTimeField(null=True, blank=True)  # End of the last full pass
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.task} {self.container}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['container', 'task'], name='unique_container_checkpoint'),
+        ]
+
+
+class BlobTombstone(models.Model):
+    """A blob that is logically deleted and waits for the background deleter to remove it from storage."""
+
+    container = models.CharField(max_length=63)
+    name = models.CharField(max_length=1024)
+    owner_hash = models.CharField(max_length=64, blank=True, default='')  # user_id_hash prefix, empty when none
+    buried_at = models.DateTimeField()
+    last_modified = models.DateTimeField(null=True, blank=True)  # Storage's Last-Modified of the buried blob, when known
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField()
+    last_error = models.TextField(blank=True, default='')
+
+    def __str__(self):
+        return f"{self.container}/{self.name}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['container', 'name'], name='unique_blob_tombstone'),
+        ]
+        indexes = [
+            models.Index(fields=['next_attempt_at']),
+            models.Index(fields=['container', 'owner_hash']),
+        ]
+
+
+class UploadSession(models.Model):
+    """A resumable upload: the file arrives in numbered chunks, each staged as one block of its source blob."""
+
+    upload_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user_email = models.EmailField()
+    user_id_hash = models.CharField(max_length=64, db_index=True)
+    filename = models.CharField(max_length=255)
+    container = models.CharField(max_length=63)
+    blob_name = models.CharField(max_length=1024)
+    size = models.BigIntegerField()
+    chunk_size = models.PositiveIntegerField()
+    client_content_hash = models.CharField(max_length=64, blank=True, default='')  # SHA-256 the browser reported for the whole file
+    created_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField()
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Upload {self.upload_id} of {self.filename} - {self.user_email}"
+
+    @property
+    def chunk_count(self):
+        return -(-self.size // self.chunk_size)
+
+    def expected_chunk_size(self, index):
+        """Bytes chunk `index` must hold: chunk_size, except for the last chunk."""
+        return min(self.chunk_size, self.size - index * self.chunk_size)
+
+    def block_id(self, index):
+        """Block ID of a chunk; the same for every retry, so re-sending a chunk replaces its block."""
+        return f"{self.upload_id.hex}-{index:06d}"
+
+    def missing_chunks(self):
+        """Indexes of the chunks not received yet, in order."""
+        received = set(self.chunks.values_list('index', flat=True))
+        return [index for index in range(self.chunk_count) if index not in received]
+
+    def to_dict(self):
+        """Serialize the session for the status API."""
+        missing = self.missing_chunks()
+        return {
+            'upload_id': str(self.upload_id),
+            'filename': self.filename,
+            'blob_name': self.blob_name,
+            'size': self.size,
+            'chunk_size': self.chunk_size,
+            'chunk_count': self.chunk_count,
+            'received_chunks': self.chunk_count - len(missing),
+            'missing_chunks': missing,
+            'completed': self.completed_at is not None,
+            'expires_at': self.expires_at.isoformat(),
+        }
+
+    @staticmethod
+    def cleanup_expired():
+        """Delete sessions past their expiry; their staged blocks are discarded by Azure after a week."""
+        from django.utils import timezone
+        _, deleted = UploadSession.objects.filter(expires_at__lt=timezone.now()).delete()
+        return deleted.get('upload.UploadSession', 0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+
+class UploadChunk(models.Model):
+    """A chunk of a resumable upload that has been staged in storage."""
+
+    session = models.ForeignKey(UploadSession, on_delete=models.CASCADE, related_name='chunks')
+    index = models.PositiveIntegerField()
+    size = models.PositiveIntegerField()
+    received_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Chunk {self.index} of upload {self.session_id}"
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['session', 'index'], name='unique_upload_chunk'),
+        ]
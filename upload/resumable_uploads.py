@@ -0,0 +1,95 @@
+"""
+Resumable chunked uploads for large documents.
+
+A dropped connection halfway through a large upload to /upload/ loses
+everything sent so far. A resumable upload sends the file as numbered chunks
+of a fixed size instead, each in its own request and staged as one block of
+the source blob. Block IDs are derived from the upload ID and the chunk index,
+so chunks may arrive in any order or in parallel, and a chunk sent again
+replaces its block rather than adding one. The UploadSession records which
+chunks are staged; after an interruption the browser asks for the status,
+sends only the missing chunks and completes the upload, which commits the
+blocks in order. The SHA-256 the browser reports for the file is stored as
+client_sha256 blob metadata; no single request sees the whole file, so the
+server cannot verify it.
+
+Storage discards uncommitted blocks when something else commits the same
+blob. If the commit is refused for that reason, the chunks that are gone are
+looked up and reported as missing again.
+"""
+
+import logging
+
+from azure.core.exceptions import HttpResponseError, ResourceExistsError, ResourceNotFoundError
+
+from .models import UploadChunk
+from .upload_handlers import CLIENT_HASH_METADATA
+
+logger = logging.getLogger(__name__)
+
+# Azure accepts at most 50,000 blocks per blob
+MAX_CHUNKS = 50000
+
+
+class IncompleteUpload(Exception):
+    """The upload cannot be committed until the chunks in `missing` are sent (again)."""
+
+    def __init__(self, missing):
+        super().__init__(f"{len(missing)} chunks missing")
+        self.missing = missing
+
+
+def stage_chunk(blob_service_client, session, index, data):
+    """Stage one chunk as its block of the session's blob and record it as received."""
+    blob_client = blob_service_client.get_blob_client(container=session.container, blob=session.blob_name)
+    try:
+        blob_client.stage_block(session.block_id(index), data)
+    except ResourceNotFoundError:
+        # First upload into a new storage account: create the container and retry
+        try:
+            blob_service_client.get_container_client(session.container).create_container()
+        except ResourceExistsError:
+            pass
+        blob_client.stage_block(session.block_id(index), data)
+    UploadChunk.objects.bulk_create(
+        [UploadChunk(session=session, index=index, size=len(data))],
+        update_conflicts=True,
+        unique_fields=['session', 'index'],
+        update_fields=['size', 'received_at'],
+    )
+
+
+def commit_upload(blob_service_client, session):
+    """
+    Commit the staged chunks in order, creating or replacing the blob, with the browser's hash as metadata.
+
+    Returns:
+        dict: The etag and last_modified of the committed blob
+
+    Raises:
+        IncompleteUpload: Chunks were never received or their blocks are no longer staged
+    """
+    missing = session.missing_chunks()
+    if missing:
+        raise IncompleteUpload(missing)
+
+    blob_client = blob_service_client.get_blob_client(container=session.container, blob=session.blob_name)
+    block_ids = [session.block_id(index) for index in range(session.chunk_count)]
+    try:
+        metadata = {CLIENT_HASH_METADATA: session.client_content_hash} if session.client_content_hash else None
+        blob_properties = blob_client.commit_block_list(block_ids, metadata=metadata)
+        logger.info(f"Committed {len(block_ids)} chunks of upload {session.upload_id} to {session.blob_name}")
+        return blob_properties
+    except HttpResponseError as e:
+        if e.error_code != 'InvalidBlockList':
+            raise
+
+    # Some blocks are gone, e.g. another upload committed the same blob in the meantime
+    try:
+        staged = {block.id for block in blob_client.get_block_list('uncommitted')[1]}
+    except ResourceNotFoundError:
+        staged = set()
+    lost = [index for index, block_id in enumerate(block_ids) if block_id not in staged]
+    UploadChunk.objects.filter(session=session, index__in=lost).delete()
+    logger.warning(f"Upload {session.upload_id} lost {len(lost)} staged chunks; they have to be sent again")
+    raise IncompleteUpload(lost)
@@ -0,0 +1,118 @@
+import io
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import mock
+
+from azure.core.exceptions import HttpResponseError
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from upload.blob_expiry import SWEEP_TASK, sweep_expired_blobs
+from upload.models import ContainerCheckpoint
+from upload.tests.test_blob_operations import FakeContainerClient
+
+
+class FakePages:
+    """Pages of a listing; continuation_token names the next page once a page has been returned."""
+
+    def __init__(self, pages, continuation_token, rejected=False):
+        self.pages = pages
+        self.start = int(continuation_token or 0) if not rejected else 0
+        self.rejected = rejected
+        self.continuation_token = None
+
+    def __iter__(self):
+        # Like the SDK's pager, nothing is requested until the first page is read
+        if self.rejected:
+            raise HttpResponseError(message='InvalidQueryParameterValue')
+        for number in range(self.start, len(self.pages)):
+            self.continuation_token = str(number + 1) if number + 1 < len(self.pages) else None
+            yield iter(self.pages[number])
+
+
+class FakeSweptContainerClient(FakeContainerClient):
+    def __init__(self, pages, accepted_tokens=None):
+        super().__init__({})
+        self.pages = pages
+        self.accepted_tokens = accepted_tokens
+        self.listed_from = []
+
+    def list_blobs(self, results_per_page=None):
+        return SimpleNamespace(by_page=self.by_page)
+
+    def by_page(self, continuation_token=None):
+        self.listed_from.append(continuation_token)
+        rejected = bool(continuation_token) and self.accepted_tokens is not None and continuation_token not in self.accepted_tokens
+        return FakePages(self.pages, continuation_token, rejected)
+
+    def deleted(self):
+        return [entry for batch in self.batches for entry in batch]
+
+
+def blob(name, age_hours):
+    return SimpleNamespace(name=name, last_modified=timezone.now() - timedelta(hours=age_hours))
+
+
+class SweepExpiredBlobsTests(TestCase):
+    PAGES = [
+        [blob('u1/old.pdf', 48), blob('u1/new.pdf', 1)],
+        [blob('u2/old.pdf', 48)],
+        [blob('u3/new.pdf', 1)],
+    ]
+
+    def setUp(self):
+        self.container_client = FakeSweptContainerClient(self.PAGES)
+        self.blob_service_client = SimpleNamespace(get_container_client=lambda container: self.container_client)
+
+    def sweep(self, time_budget=0):
+        return sweep_expired_blobs(self.blob_service_client, 'target', max_age_hours=24, time_budget=time_budget)
+
+    def checkpoint(self):
+        return ContainerCheckpoint.objects.get(container='target', task=SWEEP_TASK)
+
+    def test_out_of_time_run_checkpoints_and_the_next_run_resumes(self):
+        first = self.sweep()
+
+        self.assertEqual((first['pages'], first['resumed'], first['completed']), (1, False, False))
+        self.assertEqual(self.checkpoint().marker, '1')
+
+        second = self.sweep()
+        third = self.sweep()
+
+        self.assertEqual(self.container_client.listed_from, [None, '1', '2'])
+        self.assertTrue(second['resumed'])
+        self.assertTrue(third['completed'])
+        self.assertEqual(self.checkpoint().marker, '')
+        self.assertIsNotNone(self.checkpoint().completed_at)
+        self.assertEqual(self.container_client.deleted(), ['u1/old.pdf', 'u2/old.pdf'])
+
+    def test_run_with_time_left_finishes_the_pass(self):
+        result = self.sweep(time_budget=60)
+
+        self.assertEqual((result['pages'], result['scanned'], result['expired'], result['deleted']), (3, 4, 2, 2))
+        self.assertTrue(result['completed'])
+
+    def test_rejected_checkpoint_restarts_the_pass(self):
+        ContainerCheckpoint.objects.create(container='target', task=SWEEP_TASK, marker='stale')
+        self.container_client.accepted_tokens = {'1', '2'}
+
+        rejected = self.sweep()
+
+        self.assertEqual((rejected['pages'], rejected['completed']), (0, False))
+        self.assertEqual(self.checkpoint().marker, '')
+
+        restarted = self.sweep()
+        self.assertFalse(restarted['resumed'])
+        self.assertEqual(self.container_client.listed_from, ['stale', None])
+
+    def test_restart_option_discards_the_checkpoint(self):
+        ContainerCheckpoint.objects.create(container='target', task=SWEEP_TASK, marker='2')
+
+        with mock.patch(
+            'upload.management.commands.sweep_expired_blobs.get_blob_service_client',
+            return_value=self.blob_service_client
+        ):
+            call_command('sweep_expired_blobs', '--container', 'target', '--restart', '--time-budget', '0', stdout=io.StringIO())
+
+        self.assertEqual(self.container_client.listed_from, [None])
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from types import SimpleNamespace
+
+from django.test import TestCase
+from django.utils import timezone
+
+from services.translation_service import DocumentTranslationService
+from upload.blob_inventory import RECONCILE_TASK, BlobInventory
+from upload.models import BlobRecord, ContainerCheckpoint
+
+LAST_MODIFIED = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def listed_blob(name, size=10, etag='"1"'):
+    return SimpleNamespace(name=name, size=size, etag=etag, last_modified=LAST_MODIFIED)
+
+
+class FakeBlobServiceClient:
+    """Lists a fixed set of blobs and counts the listings."""
+
+    def __init__(self, blobs):
+        self.blobs = blobs
+        self.listings = []
+
+    def get_container_client(self, container):
+        return self
+
+    def list_blobs(self, name_starts_with=None):
+        self.listings.append(name_starts_with)
+        return [blob for blob in self.blobs if not name_starts_with or blob.name.startswith(name_starts_with)]
+
+
+class BlobInventoryTests(TestCase):
+    def setUp(self):
+        self.inventory = BlobInventory({'source': 'source'}, max_age_hours=24)
+
+    def test_inventory_is_authoritative_only_while_its_reconciliation_is_recent(self):
+        self.assertFalse(self.inventory.is_authoritative('source'))
+
+        self.inventory.reconcile(FakeBlobServiceClient([]), 'source')
+        self.assertTrue(self.inventory.is_authoritative('source'))
+        self.assertFalse(self.inventory.is_authoritative('target'))
+
+        ContainerCheckpoint.objects.filter(container='source', task=RECONCILE_TASK).update(
+            completed_at=timezone.now() - timedelta(hours=25)
+        )
+        self.assertFalse(self.inventory.is_authoritative('source'))
+        # Without a maximum age a reconciliation never expires
+        self.assertTrue(BlobInventory({'source': 'source'}, max_age_hours=0).is_authoritative('source'))
+
+    def test_reconcile_makes_records_match_the_listing(self):
+        self.inventory.record('source', 'user1/changed.pdf', size=1, etag='"0"')
+        self.inventory.record('source', 'user1/deleted.pdf', size=1, etag='"0"')
+        BlobRecord.objects.update(updated_at=timezone.now() - timedelta(minutes=1))
+        client = FakeBlobServiceClient([listed_blob('user1/changed.pdf'), listed_blob('user2/new.pdf')])
+
+        counts = self.inventory.reconcile(client, 'source')
+
+        self.assertEqual(counts, {'listed': 2, 'created': 1, 'updated': 1, 'removed': 1})
+        self.assertEqual(self.inventory.names('source', 'user1'), ['user1/changed.pdf'])
+        self.assertEqual(self.inventory.names('source', 'user2'), ['user2/new.pdf'])
+        self.assertEqual(BlobRecord.objects.get(name='user1/changed.pdf').etag, '"1"')
+
+
+class InventoryListingFallbackTests(TestCase):
+    def setUp(self):
+        self.client = FakeBlobServiceClient([listed_blob('user1/report.pdf')])
+        self.service = DocumentTranslationService(
+            'key', 'https://example.cognitiveservices.azure.com',
+            blob_inventory=BlobInventory({'source': 'source'}, max_age_hours=24)
+        )
+        self.service.blob_service_client = self.client
+
+    def test_reconciled_inventory_answers_without_listing(self):
+        self.service.blob_inventory.reconcile(self.client, 'source')
+        self.client.listings.clear()
+
+        self.assertEqual(self.service._user_blob_names('source', 'user1'), ['user1/report.pdf'])
+        self.assertEqual(self.client.listings, [])
+
+    def test_expired_inventory_falls_back_to_listing(self):
+        self.service.blob_inventory.reconcile(self.client, 'source')
+        ContainerCheckpoint.objects.update(completed_at=timezone.now() - timedelta(hours=25))
+        self.client.listings.clear()
+
+        self.assertEqual(self.service._user_blob_names('source', 'user1'), ['user1/report.pdf'])
+        self.assertEqual(self.client.listings, ['user1/'])
@@ -0,0 +1,110 @@
+from datetime import datetime, timezone as dt_timezone
+from types import SimpleNamespace
+
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError, ResourceNotFoundError
+from django.test import SimpleTestCase
+
+from services.blob_operations import bulk_delete_blobs
+
+
+class FakeContainerClient:
+    """Container client whose batch sub-responses and single deletes answer with preset status codes."""
+
+    container_name = 'target'
+
+    def __init__(self, status_codes, refuse_batches=False):
+        self.status_codes = status_codes
+        self.refuse_batches = refuse_batches
+        self.batches = []
+        self.single_deletes = []
+
+    def delete_blobs(self, *entries, raise_on_any_failure=True):
+        self.batches.append(entries)
+        if self.refuse_batches:
+            raise HttpResponseError(message='Batch operations are not supported')
+        names = [entry['name'] if isinstance(entry, dict) else entry for entry in entries]
+        return iter([SimpleNamespace(status_code=self.status_codes.get(name, 202), reason='Error') for name in names])
+
+    def delete_blob(self, name, **kwargs):
+        self.single_deletes.append((name, kwargs))
+        status_code = self.status_codes.get(name, 202)
+        if status_code == 404:
+            raise ResourceNotFoundError('BlobNotFound')
+        if status_code == 412:
+            raise ResourceModifiedError('ConditionNotMet')
+        if status_code >= 300:
+            raise HttpResponseError(message=f'HTTP {status_code}')
+
+
+class BulkDeleteBlobsTests(SimpleTestCase):
+    STATUS_CODES = {'u/gone.pdf': 404, 'u/locked.pdf': 409}
+    NAMES = ['u/a.pdf', 'u/gone.pdf', 'u/locked.pdf', 'u/b.pdf']
+
+    def assertSorted(self, result):
+        self.assertEqual(result['deleted'], ['u/a.pdf', 'u/b.pdf'])
+        self.assertEqual(result['missing'], ['u/gone.pdf'])
+        self.assertEqual([failure['name'] for failure in result['failed']], ['u/locked.pdf'])
+
+    def test_batch_responses_are_sorted_by_status(self):
+        container_client = FakeContainerClient(self.STATUS_CODES)
+
+        result = bulk_delete_blobs(container_client, self.NAMES, max_concurrency=1)
+
+        self.assertSorted(result)
+        self.assertEqual(len(container_client.batches), 1)
+        self.assertIn('409', result['failed'][0]['error'])
+
+    def test_names_are_split_into_batches_and_deduplicated(self):
+        container_client = FakeContainerClient(self.STATUS_CODES)
+
+        result = bulk_delete_blobs(container_client, self.NAMES + ['u/a.pdf'], batch_size=2, max_concurrency=2)
+
+        self.assertEqual(sorted(len(batch) for batch in container_client.batches), [2, 2])
+        self.assertEqual(sorted(result['deleted']), ['u/a.pdf', 'u/b.pdf'])
+        self.assertEqual(result['missing'], ['u/gone.pdf'])
+
+    def test_refused_batch_falls_back_to_single_deletes(self):
+        container_client = FakeContainerClient(self.STATUS_CODES, refuse_batches=True)
+
+        result = bulk_delete_blobs(container_client, self.NAMES, max_concurrency=1)
+
+        self.assertSorted(result)
+        self.assertEqual([name for name, _ in container_client.single_deletes], self.NAMES)
+
+    def test_no_names_makes_no_requests(self):
+        container_client = FakeContainerClient({})
+
+        result = bulk_delete_blobs(container_client, [], max_concurrency=1)
+
+        self.assertEqual(result, {'deleted': [], 'missing': [], 'modified': [], 'failed': []})
+        self.assertEqual(container_client.batches, [])
+
+
+class ConditionalBulkDeleteTests(SimpleTestCase):
+    STATUS_CODES = {'u/rewritten.pdf': 412}
+    NAMES = ['u/a.pdf', 'u/rewritten.pdf']
+    BURIED_AT = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+    def test_unmodified_since_conditions_are_sent_per_blob(self):
+        container_client = FakeContainerClient(self.STATUS_CODES)
+
+        result = bulk_delete_blobs(
+            container_client, self.NAMES, max_concurrency=1, unmodified_since={'u/rewritten.pdf': self.BURIED_AT}
+        )
+
+        self.assertEqual(container_client.batches[0], ('u/a.pdf', {'name': 'u/rewritten.pdf', 'if_unmodified_since': self.BURIED_AT}))
+        self.assertEqual(result['deleted'], ['u/a.pdf'])
+        self.assertEqual(result['modified'], ['u/rewritten.pdf'])
+        self.assertEqual(result['failed'], [])
+
+    def test_refused_batch_sends_conditions_with_single_deletes(self):
+        container_client = FakeContainerClient(self.STATUS_CODES, refuse_batches=True)
+
+        result = bulk_delete_blobs(
+            container_client, self.NAMES, max_concurrency=1, unmodified_since={'u/rewritten.pdf': self.BURIED_AT}
+        )
+
+        self.assertEqual(container_client.single_deletes, [
+            ('u/a.pdf', {}), ('u/rewritten.pdf', {'if_unmodified_since': self.BURIED_AT})
+        ])
+        self.assertEqual(result['modified'], ['u/rewritten.pdf'])
@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from types import SimpleNamespace
+
+from django.test import TestCase
+from django.utils import timezone
+
+from services.sas import CLOCK_SKEW
+from upload.deletion_queue import DeletionQueue, RETRY_BASE_SECONDS
+from upload.models import BlobTombstone
+from upload.tests.test_blob_operations import FakeContainerClient
+
+
+class DrainTests(TestCase):
+    LAST_MODIFIED = datetime(2024, 1, 1, tzinfo=dt_timezone.utc)
+
+    def setUp(self):
+        self.queue = DeletionQueue()
+        self.container_client = FakeContainerClient({'u/rewritten.pdf': 412, 'u/locked.pdf': 409})
+        self.blob_service_client = SimpleNamespace(get_container_client=lambda container: self.container_client)
+
+    def drain(self):
+        return self.queue.drain(self.blob_service_client, limit=10)
+
+    def sent_conditions(self):
+        return {
+            entry['name']: entry['if_unmodified_since']
+            for batch in self.container_client.batches for entry in batch if isinstance(entry, dict)
+        }
+
+    def test_deletes_are_conditional_on_the_buried_blob(self):
+        self.queue.bury('target', ['u/a.pdf'], last_modified={'u/a.pdf': self.LAST_MODIFIED})
+        self.queue.bury('target', ['u/b.pdf'])
+        buried_at = BlobTombstone.objects.get(name='u/b.pdf').buried_at
+
+        counts = self.drain()
+
+        self.assertEqual(counts['deleted'], 2)
+        # Storage's own Last-Modified when known, otherwise the burial time plus the clock skew margin
+        self.assertEqual(self.sent_conditions(), {'u/a.pdf': self.LAST_MODIFIED, 'u/b.pdf': buried_at + CLOCK_SKEW})
+        self.assertFalse(BlobTombstone.objects.exists())
+
+    def test_rewritten_blob_is_kept_and_its_tombstone_dropped(self):
+        self.queue.bury('target', ['u/rewritten.pdf'], last_modified={'u/rewritten.pdf': self.LAST_MODIFIED})
+
+        counts = self.drain()
+
+        self.assertEqual(counts, {'deleted': 0, 'missing': 0, 'modified': 1, 'failed': 0})
+        self.assertFalse(BlobTombstone.objects.exists())
+
+    def test_failed_delete_is_retried_later_with_backoff(self):
+        self.queue.bury('target', ['u/locked.pdf'])
+
+        counts = self.drain()
+
+        self.assertEqual(counts['failed'], 1)
+        tombstone = BlobTombstone.objects.get(name='u/locked.pdf')
+        self.assertEqual(tombstone.attempts, 1)
+        self.assertIn('409', tombstone.last_error)
+        self.assertGreater(tombstone.next_attempt_at, timezone.now() + timedelta(seconds=RETRY_BASE_SECONDS - 5))
+        # Not due again yet
+        self.assertEqual(self.drain()['failed'], 0)
+
+    def test_cancelled_tombstone_is_not_drained(self):
+        self.queue.bury('target', ['u/a.pdf'])
+        self.queue.cancel('target', ['u/a.pdf'])
+
+        self.assertEqual(self.drain()['deleted'], 0)
+        self.assertEqual(self.container_client.batches, [])
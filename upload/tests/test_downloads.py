@@ -0,0 +1,39 @@
+from django.test import SimpleTestCase
+
+from upload.downloads import parse_byte_range
+
+
+class ParseByteRangeTests(SimpleTestCase):
+    def test_missing_or_unsupported_header_serves_whole_blob(self):
+        for header in (None, '', 'bytes=-', 'items=0-1', 'bytes=0-1,3-4', 'bytes=a-b'):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_byte_range(header, 10))
+
+    def test_satisfiable_ranges(self):
+        cases = {
+            'bytes=0-0': (0, 0),
+            'bytes=0-9': (0, 9),
+            'bytes=5-': (5, 9),
+            'bytes=5-100': (5, 9),
+            'bytes=9-9': (9, 9),
+            'bytes=-3': (7, 9),
+            'bytes=-100': (0, 9),
+            ' bytes=2-4 ': (2, 4),
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_byte_range(header, 10), expected)
+
+    def test_unsatisfiable_ranges(self):
+        cases = [
+            ('bytes=10-', 10),
+            ('bytes=10-20', 10),
+            ('bytes=5-4', 10),
+            ('bytes=-0', 10),
+            ('bytes=0-', 0),
+            ('bytes=-5', 0),
+        ]
+        for header, size in cases:
+            with self.subTest(header=header, size=size):
+                with self.assertRaises(ValueError):
+                    parse_byte_range(header, size)
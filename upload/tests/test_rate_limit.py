@@ -0,0 +1,104 @@
+import os
+import sqlite3
+import tempfile
+
+from django.test import SimpleTestCase
+
+from services.rate_limit import BucketLimits, RateLimitedClient, RateLimiter, SQLiteLimiterBackend
+
+# Slow enough that no token is refilled while a test runs
+RATE = 0.001
+
+
+class SQLiteLimiterBackendTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.backend = SQLiteLimiterBackend(os.path.join(directory.name, 'limiter.sqlite3'))
+
+    def admit(self, holder, burst=2, limit=10, stale_after=300, waited=0.0):
+        return self.backend.admit('translator', RATE, burst, limit, holder, stale_after, waited)
+
+    def test_burst_is_admitted_then_callers_wait_for_a_token(self):
+        self.assertEqual(self.admit('a'), 0)
+        self.assertEqual(self.admit('b'), 0)
+
+        wait = self.admit('c')
+
+        self.assertAlmostEqual(wait, 1 / RATE, delta=1)
+        self.assertEqual(self.backend.stats()['translator']['calls'], 2)
+
+    def test_calls_beyond_the_concurrency_limit_wait_for_a_slot_without_spending_a_token(self):
+        self.assertEqual(self.admit('a', limit=1), 0)
+
+        self.assertEqual(self.admit('b', limit=1), SQLiteLimiterBackend.SLOT_RETRY_SECONDS)
+
+        self.backend.release_slot('translator', 'a')
+        self.assertEqual(self.admit('b', limit=1), 0)
+        self.assertEqual(self.backend.stats()['translator']['in_flight'], 1)
+
+    def test_slots_of_crashed_processes_are_reclaimed(self):
+        self.assertEqual(self.admit('a', limit=1), 0)
+
+        self.assertEqual(self.admit('b', limit=1, stale_after=-1), 0)
+        self.assertEqual(self.backend.stats()['translator']['in_flight'], 1)
+
+    def test_wait_time_is_recorded_with_the_admitted_call(self):
+        self.admit('a', waited=0.0)
+        self.backend.release_slot('translator', 'a')
+        self.admit('b', waited=1.5)
+
+        stats = self.backend.stats()['translator']
+        self.assertEqual((stats['calls'], stats['delayed_calls']), (2, 1))
+        self.assertEqual(stats['max_wait_seconds'], 1.5)
+        self.assertEqual(stats['avg_wait_seconds'], 0.75)
+
+        self.backend.reset_stats()
+        self.assertNotIn('translator', self.backend.stats())
+
+
+class FakeBlobServiceClient:
+    def __init__(self, limiter):
+        self.limiter = limiter
+        self.in_flight = []
+
+    def get_blob_properties(self, name):
+        self.in_flight.append(self.limiter.stats()['storage']['in_flight'])
+        return name
+
+    def get_container_client(self, name):
+        return self
+
+
+class FailingBackend:
+    def admit(self, *args):
+        raise sqlite3.OperationalError('database is locked')
+
+
+class RateLimitedClientTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.limiter = RateLimiter(
+            SQLiteLimiterBackend(os.path.join(directory.name, 'limiter.sqlite3')),
+            {'storage': BucketLimits(rate=100, burst=10, max_concurrency=2)}
+        )
+
+    def test_calls_hold_a_slot_only_while_running(self):
+        fake = FakeBlobServiceClient(self.limiter)
+        client = RateLimitedClient(fake, self.limiter, 'storage')
+
+        self.assertEqual(client.get_blob_properties('a.pdf'), 'a.pdf')
+        # Sub-clients are limited through the same bucket
+        self.assertIsInstance(client.get_container_client('source'), RateLimitedClient)
+        client.get_container_client('source').get_blob_properties('b.pdf')
+
+        self.assertEqual(fake.in_flight, [1, 1])
+        self.assertEqual(self.limiter.stats()['storage']['in_flight'], 0)
+        self.assertEqual(self.limiter.stats()['storage']['calls'], 2)
+
+    def test_unavailable_backend_lets_calls_through(self):
+        limiter = RateLimiter(FailingBackend(), {'storage': BucketLimits(rate=1, burst=1, max_concurrency=1)})
+
+        with limiter.acquire('storage'):
+            pass
@@ -0,0 +1,106 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+from azure.core.exceptions import HttpResponseError
+from django.test import TestCase
+from django.utils import timezone
+
+from upload.models import UploadChunk, UploadSession
+from upload.resumable_uploads import IncompleteUpload, commit_upload, stage_chunk
+from upload.upload_handlers import CLIENT_HASH_METADATA
+
+
+def storage_error(error_code):
+    error = HttpResponseError(message=error_code)
+    error.error_code = error_code
+    return error
+
+
+class FakeBlockBlobClient:
+    """Block blob whose uncommitted blocks can be discarded, as storage does when another commit wins."""
+
+    def __init__(self):
+        self.staged = {}
+        self.committed = None
+        self.metadata = None
+        self.commit_error = None
+
+    def get_blob_client(self, container, blob):
+        return self
+
+    def stage_block(self, block_id, data):
+        self.staged[block_id] = data
+
+    def commit_block_list(self, block_ids, metadata=None):
+        if self.commit_error:
+            raise self.commit_error
+        if any(block_id not in self.staged for block_id in block_ids):
+            raise storage_error('InvalidBlockList')
+        self.committed = b''.join(self.staged.pop(block_id) for block_id in block_ids)
+        self.metadata = metadata
+        return {'etag': '"1"', 'last_modified': timezone.now()}
+
+    def get_block_list(self, block_list_type):
+        return [], [SimpleNamespace(id=block_id) for block_id in self.staged]
+
+
+class CommitUploadTests(TestCase):
+    def setUp(self):
+        self.blob_client = FakeBlockBlobClient()
+        self.session = UploadSession.objects.create(
+            user_email='user1@example.com', user_id_hash='user1', filename='report.pdf', container='source',
+            blob_name='user1/report.pdf', size=10, chunk_size=4, client_content_hash='a' * 64,
+            expires_at=timezone.now() + timedelta(hours=1)
+        )
+
+    def stage(self, *indexes):
+        for index in indexes:
+            stage_chunk(self.blob_client, self.session, index, b'0123456789'[index * 4:index * 4 + 4])
+
+    def test_chunks_are_committed_in_order_with_the_browsers_hash(self):
+        self.stage(2, 0, 1)
+
+        commit_upload(self.blob_client, self.session)
+
+        self.assertEqual(self.blob_client.committed, b'0123456789')
+        self.assertEqual(self.blob_client.metadata, {CLIENT_HASH_METADATA: 'a' * 64})
+
+    def test_resent_chunk_replaces_its_block(self):
+        self.stage(0, 1, 2)
+        stage_chunk(self.blob_client, self.session, 1, b'4567')
+
+        self.assertEqual(UploadChunk.objects.filter(session=self.session).count(), 3)
+        self.assertEqual(len(self.blob_client.staged), 3)
+
+    def test_missing_chunks_are_reported_without_committing(self):
+        self.stage(0, 2)
+
+        with self.assertRaises(IncompleteUpload) as raised:
+            commit_upload(self.blob_client, self.session)
+
+        self.assertEqual(raised.exception.missing, [1])
+        self.assertIsNone(self.blob_client.committed)
+
+    def test_lost_blocks_are_reported_missing_and_can_be_sent_again(self):
+        self.stage(0, 1, 2)
+        # Another upload committed the same blob and storage discarded chunk 1's block
+        del self.blob_client.staged[self.session.block_id(1)]
+
+        with self.assertRaises(IncompleteUpload) as raised:
+            commit_upload(self.blob_client, self.session)
+
+        self.assertEqual(raised.exception.missing, [1])
+        self.assertEqual(self.session.missing_chunks(), [1])
+
+        self.stage(1)
+        commit_upload(self.blob_client, self.session)
+        self.assertEqual(self.blob_client.committed, b'0123456789')
+
+    def test_other_storage_errors_are_raised(self):
+        self.stage(0, 1, 2)
+        self.blob_client.commit_error = storage_error('ServerBusy')
+
+        with self.assertRaises(HttpResponseError):
+            commit_upload(self.blob_client, self.session)
+
+        self.assertEqual(self.session.missing_chunks(), [])
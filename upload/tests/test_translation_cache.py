@@ -0,0 +1,48 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from upload.models import TranslationCacheEntry
+from upload.translation_cache import TranslationCache
+
+CONTENT_HASH = 'a' * 64
+
+
+class TranslationCacheTests(TestCase):
+    def setUp(self):
+        self.cache = TranslationCache('translation-cache', max_bytes=1000, max_age_days=30)
+
+    def test_entries_are_keyed_on_content_languages_and_glossary(self):
+        self.cache.store(CONTENT_HASH, None, 'fr', f'{CONTENT_HASH}/auto/fr/report.pdf', 10)
+
+        # An auto-detected source language is stored as ''
+        self.assertEqual(self.cache.lookup(CONTENT_HASH, '', 'fr'), f'{CONTENT_HASH}/auto/fr/report.pdf')
+        self.assertIsNone(self.cache.lookup(CONTENT_HASH, 'en', 'fr'))
+        self.assertIsNone(self.cache.lookup(CONTENT_HASH, None, 'de'))
+        self.assertIsNone(self.cache.lookup('b' * 64, None, 'fr'))
+        self.assertIsNone(self.cache.lookup(CONTENT_HASH, None, 'fr', glossary='https://example.com/glossary.tsv'))
+
+    def test_only_recorded_hits_are_counted(self):
+        self.cache.store(CONTENT_HASH, 'en', 'fr', 'cached.pdf', 10)
+
+        self.cache.lookup(CONTENT_HASH, 'en', 'fr')
+        self.assertEqual(TranslationCacheEntry.objects.get().hit_count, 0)
+
+        self.cache.record_hit(CONTENT_HASH, 'en', 'fr')
+        self.cache.record_hit(CONTENT_HASH, 'en', 'de')
+        self.assertEqual(TranslationCacheEntry.objects.get().hit_count, 1)
+
+    def test_entry_unused_for_too_long_is_a_miss(self):
+        self.cache.store(CONTENT_HASH, 'en', 'fr', 'cached.pdf', 10)
+        TranslationCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(days=31))
+
+        self.assertIsNone(self.cache.lookup(CONTENT_HASH, 'en', 'fr'))
+        self.assertFalse(TranslationCacheEntry.objects.exists())
+
+    def test_least_recently_used_entries_are_evicted_over_the_size_limit(self):
+        self.cache.store(CONTENT_HASH, 'en', 'fr', 'old.pdf', 600)
+        TranslationCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(days=1))
+        self.cache.store(CONTENT_HASH, 'en', 'de', 'new.pdf', 600)
+
+        self.assertEqual(list(TranslationCacheEntry.objects.values_list('blob_name', flat=True)), ['new.pdf'])
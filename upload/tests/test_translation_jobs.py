@@ -0,0 +1,177 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+from django.test import TestCase
+from django.utils import timezone
+
+from upload.models import TranslationJob
+from upload.translation_jobs import process_translation_batch, process_translation_job
+
+
+def create_job(user_id_hash='user1', **fields):
+    return TranslationJob.objects.create(
+        user_email=f'{user_id_hash}@example.com', user_id_hash=user_id_hash, target_language='fr', **fields
+    )
+
+
+class ClaimNextTests(TestCase):
+    def test_claims_oldest_queued_job(self):
+        first = create_job('user1')
+        create_job('user2')
+
+        job = TranslationJob.claim_next('worker-a', lease_seconds=60)
+
+        self.assertEqual(job.pk, first.pk)
+        self.assertEqual(job.status, TranslationJob.STATUS_RUNNING)
+        self.assertEqual(job.worker_id, 'worker-a')
+        self.assertEqual(job.attempts, 1)
+        self.assertIsNotNone(job.started_at)
+        self.assertGreater(job.lease_expires_at, timezone.now() + timedelta(seconds=50))
+
+    def test_job_with_live_lease_is_not_claimed_again(self):
+        create_job()
+        TranslationJob.claim_next('worker-a')
+
+        self.assertIsNone(TranslationJob.claim_next('worker-b'))
+
+    def test_finished_jobs_are_not_claimed(self):
+        create_job(status=TranslationJob.STATUS_SUCCEEDED)
+        create_job(status=TranslationJob.STATUS_FAILED)
+
+        self.assertIsNone(TranslationJob.claim_next('worker-a'))
+
+    def test_expired_lease_is_reclaimed_by_another_worker(self):
+        create_job(operation_id='op1', continuation_token='op1')
+        claimed = TranslationJob.claim_next('worker-a')
+        TranslationJob.objects.filter(pk=claimed.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+
+        reclaimed = TranslationJob.claim_next('worker-b')
+
+        self.assertEqual(reclaimed.pk, claimed.pk)
+        self.assertEqual(reclaimed.worker_id, 'worker-b')
+        self.assertEqual(reclaimed.attempts, 2)
+        self.assertEqual(reclaimed.started_at, claimed.started_at)
+        self.assertEqual(reclaimed.continuation_token, 'op1')
+        self.assertGreater(reclaimed.lease_expires_at, timezone.now())
+
+    def test_job_out_of_attempts_is_failed_instead_of_claimed(self):
+        exhausted = create_job('user1', status=TranslationJob.STATUS_RUNNING, attempts=3,
+                               lease_expires_at=timezone.now() - timedelta(seconds=1))
+        queued = create_job('user2')
+
+        job = TranslationJob.claim_next('worker-b', max_attempts=3)
+
+        self.assertEqual(job.pk, queued.pk)
+        exhausted.refresh_from_db()
+        self.assertEqual(exhausted.status, TranslationJob.STATUS_FAILED)
+        self.assertEqual(exhausted.attempts, 3)
+        self.assertIn('3 attempt', exhausted.error)
+        self.assertIsNotNone(exhausted.finished_at)
+        self.assertIsNone(exhausted.lease_expires_at)
+
+    def test_renewed_lease_keeps_the_job(self):
+        create_job()
+        claimed = TranslationJob.claim_next('worker-a', lease_seconds=1)
+        claimed.renew_lease(lease_seconds=300)
+
+        self.assertIsNone(TranslationJob.claim_next('worker-b'))
+
+
+class ClaimQueuedTests(TestCase):
+    def test_claims_at_most_one_job_per_user(self):
+        create_job('user1')
+        first = create_job('user2')
+        create_job('user2')
+        third = create_job('user3')
+
+        jobs = TranslationJob.claim_queued('worker-a', limit=5, exclude_user_id_hashes=['user1'])
+
+        self.assertEqual([job.pk for job in jobs], [first.pk, third.pk])
+        self.assertTrue(all(job.status == TranslationJob.STATUS_RUNNING and job.attempts == 1 for job in jobs))
+
+    def test_limit_and_running_jobs(self):
+        create_job('user1', status=TranslationJob.STATUS_RUNNING)
+        create_job('user2')
+        create_job('user3')
+
+        jobs = TranslationJob.claim_queued('worker-a', limit=1)
+
+        self.assertEqual([job.user_id_hash for job in jobs], ['user2'])
+
+
+class FakeBatchTranslationService:
+    """Accepts the users' requests as one operation, or as one operation per user when `split` is set."""
+
+    def __init__(self, split=False):
+        self.split = split
+        self.requests = []
+
+    def translate_documents_for_users(self, user_requests, on_submitted=None, on_progress=None, on_cached=None):
+        self.requests.append(user_requests)
+        user_ids = [request['user_id_hash'] for request in user_requests]
+        groups = [[user_id] for user_id in user_ids] if self.split else [user_ids]
+        for number, group in enumerate(groups, 1):
+            on_submitted(SimpleNamespace(id=f'op{number}', continuation_token=lambda number=number: f'op{number}'), group)
+        return {
+            user_id: {
+                'status': 'Succeeded',
+                'documents': [{'status': 'Succeeded', 'source_filename': 'report.pdf', 'translated_to': 'fr'}],
+            }
+            for user_id in user_ids
+        }
+
+
+class ProcessTranslationBatchTests(TestCase):
+    def claim_jobs(self, *user_id_hashes):
+        for user_id_hash in user_id_hashes:
+            create_job(user_id_hash)
+        return TranslationJob.claim_queued('worker-a', limit=len(user_id_hashes))
+
+    def test_jobs_share_the_operation_they_were_submitted_in(self):
+        service = FakeBatchTranslationService()
+
+        jobs = process_translation_batch(self.claim_jobs('user1', 'user2'), service)
+
+        self.assertEqual(len(service.requests), 1)
+        self.assertEqual([request['user_id_hash'] for request in service.requests[0]], ['user1', 'user2'])
+        for job in jobs:
+            job.refresh_from_db()
+            self.assertEqual(job.status, TranslationJob.STATUS_SUCCEEDED)
+            self.assertEqual((job.operation_id, job.continuation_token), ('op1', 'op1'))
+            self.assertEqual(job.progress['succeeded_documents'], 1)
+
+    def test_users_resubmitted_separately_keep_their_own_operation(self):
+        jobs = process_translation_batch(self.claim_jobs('user1', 'user2'), FakeBatchTranslationService(split=True))
+
+        operations = {}
+        for job in jobs:
+            job.refresh_from_db()
+            operations[job.user_id_hash] = job.operation_id
+        self.assertEqual(operations, {'user1': 'op1', 'user2': 'op2'})
+
+
+class ResumedJobCacheStateTests(TestCase):
+    def test_cache_state_saved_at_submission_is_passed_back_on_resume(self):
+        cache_state = {'cached_documents': [{'status': 'Succeeded', 'cached': True}], 'cache': {'hits': 1, 'misses': 0}}
+        resumed_with = []
+
+        class FakeService:
+            def translate_documents_user_specific(self, on_submitted=None, on_cached=None, **kwargs):
+                on_cached('user1', cache_state)
+                on_submitted(SimpleNamespace(id='op1', continuation_token=lambda: 'op1'))
+                raise Exception('worker stopped')
+
+            def resume_translation_for_user(self, continuation_token, user_id_hash, cache_state=None, **kwargs):
+                resumed_with.append(cache_state)
+                return {'status': 'Succeeded', 'documents': cache_state['cached_documents'], 'cache': cache_state['cache']}
+
+        create_job('user1')
+        job = process_translation_job(TranslationJob.claim_next('worker-a'), FakeService())
+        self.assertEqual(job.status, TranslationJob.STATUS_FAILED)
+        TranslationJob.objects.filter(pk=job.pk).update(status=TranslationJob.STATUS_QUEUED)
+
+        job = process_translation_job(TranslationJob.claim_next('worker-b'), FakeService())
+
+        self.assertEqual(resumed_with, [cache_state])
+        self.assertEqual(job.status, TranslationJob.STATUS_SUCCEEDED)
+        self.assertEqual(job.cache_hits, 1)
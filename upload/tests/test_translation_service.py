@@ -0,0 +1,175 @@
+import os
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from services.translation_service import DocumentTranslationService
+from upload.models import TranslationCacheEntry
+from upload.translation_cache import TranslationCache
+
+SOURCE_URI = 'https://account.blob.core.windows.net/source'
+TARGET_URI = 'https://account.blob.core.windows.net/target'
+
+
+class FakeSubmissions:
+    """Stands in for DocumentTranslationService._submit_translation: accepts or rejects each submission."""
+
+    def __init__(self, reject=lambda user_ids: False):
+        self.reject = reject
+        self.submitted = []
+
+    def __call__(self, inputs, on_submitted=None, on_progress=None):
+        user_ids = sorted({document_input.source_url.split('/')[-2] for document_input in inputs})
+        self.submitted.append(user_ids)
+        if self.reject(user_ids):
+            raise Exception('InvalidRequest')
+        poller = SimpleNamespace(id=f'op{len(self.submitted)}')
+        if on_submitted:
+            on_submitted(poller)
+        documents = [
+            {
+                'id': f'doc-{document_input.source_url}-{target.language}',
+                'status': 'Succeeded',
+                'source_document_url': document_input.source_url,
+                'source_filename': document_input.source_url.split('/')[-1],
+                'translated_to': target.language,
+            }
+            for document_input in inputs for target in document_input.targets
+        ]
+        return {'operation_id': poller.id, 'status': 'Succeeded', 'documents': documents}
+
+
+def user_request(user_id_hash, *languages):
+    return {'user_id_hash': user_id_hash, 'target_languages': list(languages or ['fr'])}
+
+
+class TranslateForUsersTests(SimpleTestCase):
+    def setUp(self):
+        self.service = DocumentTranslationService('key', 'https://example.cognitiveservices.azure.com')
+        self.service.blob_service_client = None
+        # Every user has one source document and nothing to clean up
+        self.service._prepare_user_translation = (
+            lambda source_uri, target_uri, user_id_hash, *args, **kwargs: ({}, [f'{user_id_hash}/report.pdf'])
+        )
+        self.notifications = []
+
+    def translate(self, submissions, *requests):
+        self.service._submit_translation = submissions
+        return self.service._translate_for_users(
+            SOURCE_URI, TARGET_URI, list(requests),
+            on_submitted=lambda poller, user_ids: self.notifications.append((poller.id, user_ids))
+        )
+
+    def test_users_share_one_operation_and_get_their_own_documents(self):
+        submissions = FakeSubmissions()
+
+        results = self.translate(submissions, user_request('user1', 'fr', 'de'), user_request('user2'))
+
+        self.assertEqual(submissions.submitted, [['user1', 'user2']])
+        self.assertEqual(self.notifications, [('op1', ['user1', 'user2'])])
+        self.assertEqual(sorted(doc['translated_to'] for doc in results['user1']['documents']), ['de', 'fr'])
+        self.assertEqual([doc['translated_to'] for doc in results['user2']['documents']], ['fr'])
+        self.assertEqual(results['user1']['total_documents'], 2)
+        self.assertEqual(results['user2']['succeeded_documents'], 1)
+
+    def test_rejected_batch_is_resubmitted_per_user(self):
+        submissions = FakeSubmissions(reject=lambda user_ids: len(user_ids) > 1)
+
+        results = self.translate(submissions, user_request('user1'), user_request('user2'))
+
+        self.assertEqual(submissions.submitted, [['user1', 'user2'], ['user1'], ['user2']])
+        self.assertEqual(self.notifications, [('op2', ['user1']), ('op3', ['user2'])])
+        self.assertEqual(results['user1']['status'], 'Succeeded')
+        self.assertEqual(results['user2']['status'], 'Succeeded')
+
+    def test_one_users_rejected_input_does_not_fail_the_others(self):
+        submissions = FakeSubmissions(reject=lambda user_ids: 'user1' in user_ids)
+
+        results = self.translate(submissions, user_request('user1'), user_request('user2'))
+
+        self.assertFalse(results['user1']['success'])
+        self.assertIn('InvalidRequest', results['user1']['error'])
+        self.assertEqual(results['user2']['status'], 'Succeeded')
+        self.assertEqual(self.notifications, [('op3', ['user2'])])
+
+    def test_single_user_is_not_resubmitted(self):
+        submissions = FakeSubmissions(reject=lambda user_ids: True)
+
+        results = self.translate(submissions, user_request('user1'))
+
+        self.assertEqual(submissions.submitted, [['user1']])
+        self.assertFalse(results['user1']['success'])
+
+
+class TranslationCacheServiceTests(TestCase):
+    CONTENT_HASH = 'a' * 64
+
+    def setUp(self):
+        self.cache = TranslationCache('translation-cache', max_bytes=10 ** 6, max_age_days=30)
+        self.service = DocumentTranslationService(
+            'key', 'https://example.cognitiveservices.azure.com', translation_cache=self.cache
+        )
+        self.service.blob_service_client = None
+        self.copies = []
+        self.missing_blobs = set()
+
+        def copy_blob(source_container, source_blob, target_container, target_blob):
+            self.copies.append((source_blob, target_blob))
+            return source_blob not in self.missing_blobs
+
+        self.service._copy_blob = copy_blob
+
+    def apply_cache(self, *languages):
+        return self.service._apply_cached_translations(
+            SOURCE_URI, TARGET_URI, 'user1', ['user1/report.pdf'], list(languages), None,
+            {'user1/report.pdf': self.CONTENT_HASH}
+        )
+
+    def test_hits_are_copied_into_place_and_counted(self):
+        self.cache.store(self.CONTENT_HASH, None, 'fr', 'cached-fr.pdf', 10)
+
+        cached_documents, languages_by_blob, content_hashes = self.apply_cache('fr', 'de')
+
+        self.assertEqual(self.copies, [('cached-fr.pdf', 'user1/fr/report.pdf')])
+        self.assertEqual([doc['translated_to'] for doc in cached_documents], ['fr'])
+        self.assertEqual(languages_by_blob, {'user1/report.pdf': ['de']})
+        self.assertEqual(content_hashes, {'user1/report.pdf': self.CONTENT_HASH})
+        self.assertEqual(TranslationCacheEntry.objects.get().hit_count, 1)
+
+    def test_entry_whose_blob_is_gone_is_forgotten_without_a_hit(self):
+        self.cache.store(self.CONTENT_HASH, None, 'fr', 'cached-fr.pdf', 10)
+        self.missing_blobs.add('cached-fr.pdf')
+
+        cached_documents, languages_by_blob, _ = self.apply_cache('fr')
+
+        self.assertEqual(cached_documents, [])
+        self.assertEqual(languages_by_blob, {'user1/report.pdf': ['fr']})
+        self.assertFalse(TranslationCacheEntry.objects.exists())
+
+    def test_resumed_operation_keeps_cache_hits_and_caches_new_translations(self):
+        cached_document = {
+            'status': 'Succeeded', 'cached': True, 'translated_to': 'fr',
+            'source_document_url': f'{SOURCE_URI}/user1/report.pdf',
+        }
+        new_document = {'status': 'Succeeded', 'translated_to': 'de', 'source_document_url': f'{SOURCE_URI}/user1/report.pdf'}
+        self.service.resume_translation = lambda continuation_token, on_progress=None: {
+            'status': 'Succeeded', 'documents': [new_document]
+        }
+        cached = []
+        self.service._cache_new_translations = lambda *args: cached.append(args)
+        cache_state = {
+            'cached_documents': [cached_document],
+            'content_hashes': {'user1/report.pdf': self.CONTENT_HASH},
+            'source_language': None,
+            'cache': {'hits': 1, 'misses': 1},
+        }
+
+        with mock.patch.dict(os.environ, {'AZURE_TRANSLATION_SOURCE_URI': SOURCE_URI, 'AZURE_TRANSLATION_TARGET_URI': TARGET_URI}):
+            result = self.service.resume_translation_for_user('op1', 'user1', cache_state=cache_state)
+
+        self.assertEqual(result['documents'], [new_document, cached_document])
+        self.assertEqual((result['total_documents'], result['succeeded_documents']), (2, 2))
+        self.assertEqual(result['cache'], {'hits': 1, 'misses': 1})
+        self.assertEqual(len(cached), 1)
+        self.assertEqual(cached[0][4], {'user1/report.pdf': self.CONTENT_HASH})
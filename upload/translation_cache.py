@@ -0,0 +1,164 @@
+"""
+Content-addressed cache of translated documents.
+
+Translated blobs are copied into a dedicated container and indexed by
+TranslationCacheEntry rows keyed on (SHA-256 of the source bytes, source
+language, target language, glossary). DocumentTranslationService consults the
+cache before submitting to Azure and copies hits straight into the user's
+target prefix. Entries unused for too long, or beyond the configured total
+size (least recently used first), are evicted.
+"""
+
+import logging
+from datetime import timedelta
+from django.db.models import F, Sum
+from django.utils import timezone
+from azure.core.exceptions import ResourceNotFoundError
+
+from .blob_inventory import get_blob_inventory
+from .models import TranslationCacheEntry, TranslationJob
+
+logger = logging.getLogger(__name__)
+
+
+class TranslationCache:
+    """Translation cache backed by TranslationCacheEntry rows and a blob container."""
+
+    def __init__(self, container_name, max_bytes, max_age_days, blob_service_client=None):
+        self.container_name = container_name
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.blob_service_client = blob_service_client
+
+    def _key(self, content_hash, source_language, target_language, glossary):
+        return {
+            'content_hash': content_hash,
+            'source_language': source_language or '',
+            'target_language': target_language,
+            'glossary': glossary or '',
+        }
+
+    def lookup(self, content_hash, source_language, target_language, glossary=''):
+        """
+        Find a cached translation. Call record_hit() once the cached blob has been copied.
+
+        Returns:
+            str or None: Name of the cached blob in the cache container, or None on a miss
+        """
+        entry = TranslationCacheEntry.objects.filter(
+            **self._key(content_hash, source_language, target_language, glossary)
+        ).first()
+        if entry is None:
+            return None
+
+        if entry.last_used_at < timezone.now() - timedelta(days=self.max_age_days):
+            self._delete_entries([entry])
+            return None
+
+        return entry.blob_name
+
+    def record_hit(self, content_hash, source_language, target_language, glossary=''):
+        """Count a cached translation that was copied into place, and keep it from being evicted as unused."""
+        TranslationCacheEntry.objects.filter(
+            **self._key(content_hash, source_language, target_language, glossary)
+        ).update(
+            hit_count=F('hit_count') + 1,
+            last_used_at=timezone.now()
+        )
+
+    def store(self, content_hash, source_language, target_language, blob_name, size_bytes, glossary=''):
+        """Record a translated blob that has been copied into the cache container."""
+        TranslationCacheEntry.objects.update_or_create(
+            **self._key(content_hash, source_language, target_language, glossary),
+            defaults={
+                'blob_name': blob_name,
+                'size_bytes': size_bytes,
+                'last_used_at': timezone.now(),
+            }
+        )
+        self.evict()
+
+    def invalidate(self, content_hash, source_language, target_language, glossary=''):
+        """Forget a cached translation whose blob is missing or unusable."""
+        entries = list(TranslationCacheEntry.objects.filter(
+            **self._key(content_hash, source_language, target_language, glossary)
+        ))
+        self._delete_entries(entries)
+
+    def evict(self):
+        """
+        Remove entries unused for longer than max_age_days, then the least recently used
+        entries until the cache fits in max_bytes.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        cutoff = timezone.now() - timedelta(days=self.max_age_days)
+        expired = list(TranslationCacheEntry.objects.filter(last_used_at__lt=cutoff))
+        evicted = self._delete_entries(expired)
+
+        total_bytes = TranslationCacheEntry.objects.aggregate(total=Sum('size_bytes'))['total'] or 0
+        if total_bytes > self.max_bytes:
+            over_limit = []
+            for entry in TranslationCacheEntry.objects.order_by('last_used_at').iterator():
+                if total_bytes <= self.max_bytes:
+                    break
+                over_limit.append(entry)
+                total_bytes -= entry.size_bytes
+            evicted += self._delete_entries(over_limit)
+
+        if evicted:
+            logger.info(f"Evicted {evicted} translation cache entries")
+        return evicted
+
+    def _delete_entries(self, entries):
+        """Delete cache entries and their blobs."""
+        if not entries:
+            return 0
+
+        if self.blob_service_client:
+            container_client = self.blob_service_client.get_container_client(self.container_name)
+            gone = []
+            for entry in entries:
+                try:
+                    container_client.delete_blob(entry.blob_name)
+                    gone.append(entry.blob_name)
+                except ResourceNotFoundError:
+                    gone.append(entry.blob_name)
+                except Exception as e:
+                    logger.warning(f"Failed to delete cached blob {entry.blob_name}: {str(e)}")
+            get_blob_inventory().forget(self.container_name, gone)
+
+        TranslationCacheEntry.objects.filter(pk__in=[entry.pk for entry in entries]).delete()
+        return len(entries)
+
+    def stats(self):
+        """Hit/miss counters and current size of the cache."""
+        counters = TranslationJob.objects.aggregate(hits=Sum('cache_hits'), misses=Sum('cache_misses'))
+        entries = TranslationCacheEntry.objects.aggregate(total_bytes=Sum('size_bytes'))
+        hits = counters['hits'] or 0
+        misses = counters['misses'] or 0
+        return {
+            'entries': TranslationCacheEntry.objects.count(),
+            'total_bytes': entries['total_bytes'] or 0,
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+        }
+
+
+def get_translation_cache():
+    """Build the translation cache from configuration, or return None when caching is disabled."""
+    from services.clients import get_blob_service_client
+    from services.config import get_config
+    config = get_config()
+    if not config.cache_enabled:
+        return None
+
+    return TranslationCache(
+        container_name=config.cache_container,
+        max_bytes=config.cache_max_bytes,
+        max_age_days=config.cache_max_age_days,
+        blob_service_client=get_blob_service_client(),
+    )
@@ -0,0 +1,363 @@
+"""
+Background translation job handling.
+
+The web tier only enqueues TranslationJob rows; a separate worker process
+(`python manage.py run_translation_worker`) claims them and drives the Azure
+Document Translation operation so gunicorn workers are never blocked on it.
+
+Once Azure accepts the batch, the poller continuation token is persisted on the
+job. Workers hold a renewable lease while polling; if a worker dies, another one
+re-claims the job after the lease expires and resumes polling the same Azure
+operation instead of submitting a new (billable) batch.
+
+When several users' jobs are queued within a short window, the worker submits
+them together as one Azure operation (see process_translation_batch) and splits
+the per-document results back to each job.
+
+While the operation runs, each job's per-document states and a progress summary are
+stored on the job so the web tier can stream them without calling Azure itself, and
+documents are marked translated as soon as they succeed so they can be downloaded
+before the whole operation has finished.
+"""
+
+import logging
+import os
+import socket
+from collections import Counter
+from datetime import timedelta
+from django.utils import timezone
+
+from .models import Document, TranslationJob
+
+logger = logging.getLogger(__name__)
+
+# Azure accepts at most 10 targets per document input
+MAX_TARGET_LANGUAGES = 10
+
+
+def default_worker_id():
+    """Build an identifier for the current worker process."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def enqueue_translation_job(user_email, user_id_hash, target_language, source_language=None,
+                            clear_target=True, cleanup_source=False):
+    """
+    Create a queued translation job for a user and return it.
+    `target_language` may be a single code or a list of codes translated in one operation.
+    """
+    target_languages = [target_language] if isinstance(target_language, str) else list(target_language)
+    job = TranslationJob.objects.create(
+        user_email=user_email,
+        user_id_hash=user_id_hash,
+        target_language=target_languages[0],
+        target_languages=target_languages,
+        source_language=source_language or None,
+        clear_target=clear_target,
+        cleanup_source=cleanup_source,
+    )
+    logger.info(f"Queued translation job {job.job_id} to {', '.join(target_languages)} for user: {user_email}")
+    return job
+
+
+def process_translation_job(job, translation_service, lease_seconds=300):
+    """
+    Run a claimed translation job to completion and persist its outcome.
+
+    Args:
+        job (TranslationJob): A job already claimed by this worker (status 'running')
+        translation_service (DocumentTranslationService): Service used to talk to Azure
+        lease_seconds (int): How long each lease renewal keeps other workers off this job
+
+    Returns:
+        TranslationJob: The updated job
+    """
+    logger.info(f"Processing translation job {job.job_id} for user: {job.user_email} (attempt {job.attempts})")
+
+    def record_submission(poller):
+        # Persist the operation as soon as Azure accepts it so a restarted worker can resume it
+        job.operation_id = poller.id
+        job.continuation_token = poller.continuation_token()
+        job.submitted_at = timezone.now()
+        job.save(update_fields=['operation_id', 'continuation_token', 'submitted_at'])
+        job.renew_lease(lease_seconds)
+
+    def record_cache_state(user_id_hash, cache_state):
+        # Documents copied from the cache are not part of the Azure operation, so a resumed job needs them from here
+        job.cache_state = cache_state
+        job.save(update_fields=['cache_state'])
+
+    listed_counts = None
+
+    def record_progress(status):
+        nonlocal listed_counts
+        job.last_polled_at = timezone.now()
+        update_fields = ['last_polled_at']
+        # Heartbeat calls only renew the lease; documents are listed again when the summary counts move
+        counts = _status_counts(status)
+        documents_by_user = _document_progress(translation_service, status.id) if counts != listed_counts else None
+        if documents_by_user is not None:
+            listed_counts = counts
+            job.documents = documents_by_user.get(job.user_id_hash, [])
+            job.progress = _progress_snapshot(status.status, job.documents)
+            update_fields += ['documents', 'progress']
+            # Documents that already succeeded can be downloaded before the rest of the batch finishes
+            mark_documents_translated(job.user_id_hash, job.documents)
+        job.save(update_fields=update_fields)
+        job.renew_lease(lease_seconds)
+
+    try:
+        if job.continuation_token:
+            logger.info(f"Resuming Azure operation {job.operation_id} for translation job {job.job_id}")
+            result = translation_service.resume_translation_for_user(
+                continuation_token=job.continuation_token,
+                user_id_hash=job.user_id_hash,
+                cleanup_source=job.cleanup_source,
+                on_progress=record_progress,
+                cache_state=job.cache_state
+            )
+        else:
+            _reset_cleared_documents(job)
+            result = translation_service.translate_documents_user_specific(
+                user_id_hash=job.user_id_hash,
+                target_language=job.target_languages or [job.target_language],
+                source_language=job.source_language,
+                clear_target=job.clear_target,
+                cleanup_source=job.cleanup_source,
+                on_submitted=record_submission,
+                on_progress=record_progress,
+                content_hashes=_known_content_hashes(job.user_id_hash),
+                on_cached=record_cache_state
+            )
+    except Exception as e:
+        return _fail_job(job, str(e))
+
+    return _complete_job(job, result)
+
+
+def process_translation_batch(jobs, translation_service, lease_seconds=300):
+    """
+    Submit several users' claimed jobs as a single Azure operation and persist each outcome.
+
+    Every job records the shared operation ID and continuation token, so if the worker dies
+    each job can later be resumed on its own by process_translation_job().
+
+    Args:
+        jobs (list[TranslationJob]): Claimed, not yet submitted jobs, at most one per user
+        translation_service (DocumentTranslationService): Service used to talk to Azure
+        lease_seconds (int): How long each lease renewal keeps other workers off these jobs
+
+    Returns:
+        list[TranslationJob]: The updated jobs
+    """
+    if len(jobs) == 1:
+        return [process_translation_job(jobs[0], translation_service, lease_seconds=lease_seconds)]
+
+    logger.info(f"Processing {len(jobs)} translation jobs as one batch: {', '.join(str(job.job_id) for job in jobs)}")
+    job_pks = [job.pk for job in jobs]
+
+    def lease_expiry():
+        return timezone.now() + timedelta(seconds=lease_seconds)
+
+    def record_submission(poller, submitted_user_id_hashes):
+        # Persist the shared operation on every included job so each can be resumed independently
+        TranslationJob.objects.filter(pk__in=job_pks, user_id_hash__in=submitted_user_id_hashes).update(
+            operation_id=poller.id,
+            continuation_token=poller.continuation_token(),
+            submitted_at=timezone.now(),
+            lease_expires_at=lease_expiry()
+        )
+
+    def record_cache_state(user_id_hash, cache_state):
+        TranslationJob.objects.filter(pk__in=job_pks, user_id_hash=user_id_hash).update(cache_state=cache_state)
+
+    listed_counts = None
+
+    def record_progress(status):
+        nonlocal listed_counts
+        TranslationJob.objects.filter(pk__in=job_pks).update(
+            last_polled_at=timezone.now(),
+            lease_expires_at=lease_expiry()
+        )
+        # Users are resubmitted as separate operations when the shared one is rejected, so counts are per operation
+        counts = (status.id, _status_counts(status))
+        documents_by_user = _document_progress(translation_service, status.id) if counts != listed_counts else None
+        if documents_by_user is not None:
+            listed_counts = counts
+            for job in jobs:
+                if job.user_id_hash not in documents_by_user:
+                    continue
+                documents = documents_by_user[job.user_id_hash]
+                TranslationJob.objects.filter(pk=job.pk).update(
+                    documents=documents,
+                    progress=_progress_snapshot(status.status, documents)
+                )
+                mark_documents_translated(job.user_id_hash, documents)
+
+    for job in jobs:
+        _reset_cleared_documents(job)
+
+    try:
+        results = translation_service.translate_documents_for_users(
+            [
+                {
+                    'user_id_hash': job.user_id_hash,
+                    'target_languages': job.target_languages or [job.target_language],
+                    'source_language': job.source_language,
+                    'clear_target': job.clear_target,
+                    'cleanup_source': job.cleanup_source,
+                    'content_hashes': _known_content_hashes(job.user_id_hash),
+                }
+                for job in jobs
+            ],
+            on_submitted=record_submission,
+            on_progress=record_progress,
+            on_cached=record_cache_state
+        )
+    except Exception as e:
+        return [_fail_job(job, str(e)) for job in jobs]
+
+    finished = []
+    for job in jobs:
+        job.refresh_from_db()
+        result = results.get(job.user_id_hash)
+        if result is None:
+            finished.append(_fail_job(job, 'No translation result was returned for this job'))
+        else:
+            finished.append(_complete_job(job, result))
+    return finished
+
+
+def _status_counts(status):
+    """Summary counts of an operation status; listing its documents (a paged call) is only worth it when they change."""
+    return (
+        status.status,
+        status.documents_succeeded_count,
+        status.documents_failed_count,
+        status.documents_in_progress_count,
+        status.documents_not_started_count,
+        status.documents_canceled_count,
+    )
+
+
+def _document_progress(translation_service, operation_id):
+    """Current per-document states of an Azure operation grouped by owner, or None if they could not be fetched."""
+    try:
+        documents = translation_service.get_document_progress(operation_id)
+    except Exception as e:
+        logger.warning(f"Could not fetch document progress for operation {operation_id}: {str(e)}")
+        return None
+
+    documents_by_user = {}
+    for document in documents:
+        documents_by_user.setdefault(document['user_id_hash'], []).append(document)
+    return documents_by_user
+
+
+def _progress_snapshot(operation_status, documents):
+    """Summarize a job's documents for the status API and progress stream."""
+    states = Counter(document['status'] for document in documents)
+    total = len(documents)
+    return {
+        'status': operation_status,
+        'total_documents': total,
+        'succeeded_documents': states['Succeeded'],
+        'failed_documents': states['Failed'] + states['ValidationFailed'] + states['Canceled'],
+        'in_progress_documents': states['Running'],
+        'not_yet_started_documents': states['NotStarted'],
+        'percent_complete': round(
+            100 * sum(_document_completion(document) for document in documents) / total
+        ) if total else 0,
+    }
+
+
+def _document_completion(document):
+    """Fraction of a document that is done; documents that stopped (succeeded, failed, served from cache) count as done."""
+    if document['status'] in ('NotStarted', 'Running'):
+        return document.get('translation_progress') or 0
+    return 1
+
+
+def _known_content_hashes(user_id_hash):
+    """Source blob hashes recorded at upload time, keyed by blob name, for translation cache lookups."""
+    return dict(
+        Document.objects.filter(user_id_hash=user_id_hash).exclude(content_hash='').values_list('user_blob_name', 'content_hash')
+    )
+
+
+def _reset_cleared_documents(job):
+    """The user's previous translations are removed from the target container before submitting."""
+    if job.clear_target:
+        Document.objects.filter(user_id_hash=job.user_id_hash).update(
+            is_translated=False,
+            translation_language=None,
+            translated_languages=[]
+        )
+
+
+def _fail_job(job, error):
+    """Mark a job as failed with an error message."""
+    logger.error(f"Translation job {job.job_id} failed: {error}")
+    job.status = TranslationJob.STATUS_FAILED
+    job.error = error
+    job.finished_at = timezone.now()
+    job.lease_expires_at = None
+    job.save(update_fields=['status', 'error', 'finished_at', 'lease_expires_at'])
+    return job
+
+
+def _complete_job(job, result):
+    """Persist a translation result on a job and update the user's documents."""
+    job.result = result
+    job.documents = result.get('documents', [])
+    job.progress = _progress_snapshot(result.get('status'), job.documents)
+    cache_counters = result.get('cache') or {}
+    job.cache_hits = cache_counters.get('hits', 0)
+    job.cache_misses = cache_counters.get('misses', 0)
+    polling = result.get('polling') or {}
+    # Status calls add up across attempts when a job is resumed by another worker
+    job.status_calls += polling.get('status_calls', 0)
+    job.detection_lag_seconds = polling.get('detection_lag_seconds')
+    job.finished_at = timezone.now()
+    job.lease_expires_at = None
+
+    if result.get('success') is False:
+        job.status = TranslationJob.STATUS_FAILED
+        job.error = result.get('error') or f"Translation status: {result.get('status')}"
+    else:
+        job.status = TranslationJob.STATUS_SUCCEEDED
+        mark_documents_translated(job.user_id_hash, job.documents)
+
+    job.save(update_fields=['result', 'documents', 'progress', 'cache_hits', 'cache_misses',
+                            'status_calls', 'detection_lag_seconds', 'status', 'error', 'finished_at', 'lease_expires_at'])
+    logger.info(f"Translation job {job.job_id} finished with status: {job.status}")
+    return job
+
+
+def mark_documents_translated(user_id_hash, document_results):
+    """
+    Record on each Document row which languages it was successfully translated into.
+    Called with in-flight states while an operation runs and with the final results; rows
+    that already record every succeeded language are left untouched.
+
+    Args:
+        user_id_hash (str): Owner of the documents
+        document_results (list): Per-document results from the translation service
+    """
+    languages_by_blob = {}
+    for result in document_results:
+        if result.get('status') != 'Succeeded' or not result.get('translated_to') or not result.get('source_filename'):
+            continue
+        user_blob_name = f"{user_id_hash}/{result['source_filename']}"
+        languages_by_blob.setdefault(user_blob_name, []).append(result['translated_to'])
+
+    for document in Document.objects.filter(user_id_hash=user_id_hash, user_blob_name__in=languages_by_blob):
+        languages = list(document.translated_languages or [])
+        new_languages = [language for language in languages_by_blob[document.user_blob_name] if language not in languages]
+        if document.is_translated and not new_languages:
+            continue
+        languages.extend(dict.fromkeys(new_languages))
+        document.translated_languages = languages
+        document.is_translated = True
+        document.translation_language = languages_by_blob[document.user_blob_name][0]
+        document.save(update_fields=['translated_languages', 'is_translated', 'translation_language'])
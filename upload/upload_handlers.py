@@ -0,0 +1,195 @@
+"""
+Upload handler that streams files straight into Azure Blob block staging.
+
+Django's default handlers keep each upload in memory or spool it to a temp file,
+after which the view reads it again for upload_blob(). AzureBlobUploadHandler
+stages fixed-size blocks while the multipart body is still arriving, so memory
+per upload is bounded by the block size times the staging concurrency whatever
+the file size. Blocks stay uncommitted until the view has validated the request
+and calls StagedBlobUpload.commit().
+
+The blob name depends on the uploader, but the form's email field arrives after
+the file, so the browser also sends it in an X-User-Email header. Requests
+without it are handled by Django's default handlers as before.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.core.files.uploadedfile import UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler, StopFutureHandlers
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError
+
+from services.clients import get_blob_service_client
+from services.config import get_config
+from .deletion_queue import get_deletion_queue
+from .models import UserSession
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+UNSAFE_FILENAME_CHARACTERS = re.compile(r'[^\w\-_\.]')
+# Blob metadata key holding the SHA-256 of the content, computed by the server while uploading
+CONTENT_HASH_METADATA = 'content_sha256'
+# Blob metadata key holding the SHA-256 the browser reported for a file no single request saw whole (not verified)
+CLIENT_HASH_METADATA = 'client_sha256'
+
+
+def source_blob_path(user_id_hash, filename):
+    """Path of an uploaded document in the source container: '<user>/<sanitized file name>'."""
+    return f"{user_id_hash}/{UNSAFE_FILENAME_CHARACTERS.sub('_', filename)}"
+
+
+class StagedBlobUpload(UploadedFile):
+    """An uploaded file whose bytes are already staged as uncommitted blocks of its source blob."""
+
+    def __init__(self, name, content_type, size, charset, blob_client, blob_name, block_ids,
+                 user_id_hash, content_hash, error=None):
+        super().__init__(file=None, name=name, content_type=content_type, size=size, charset=charset)
+        self.blob_client = blob_client
+        self.blob_name = blob_name
+        self.block_ids = block_ids
+        self.user_id_hash = user_id_hash
+        self.content_hash = content_hash
+        self.error = error
+
+    def commit(self):
+        """Commit the staged blocks, creating the blob or replacing an existing one. Returns the blob's etag and last_modified."""
+        if self.error:
+            raise self.error
+        blob_properties = self.blob_client.commit_block_list(
+            self.block_ids, metadata={CONTENT_HASH_METADATA: self.content_hash}
+        )
+        logger.info(f"Committed {len(self.block_ids)} staged blocks to {self.blob_name}")
+        return blob_properties
+
+
+class AzureBlobUploadHandler(FileUploadHandler):
+    """Stage uploaded files as Azure blocks as they arrive; see the module docstring."""
+
+    def __init__(self, request=None):
+        super().__init__(request)
+        config = get_config()
+        self.block_size = config.upload_block_size
+        self.max_concurrency = max(1, config.upload_max_concurrency)
+        self.container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+        self.activated = False
+
+    def new_file(self, field_name, file_name, content_type, content_length, charset=None, content_type_extra=None):
+        super().new_file(field_name, file_name, content_type, content_length, charset, content_type_extra)
+        self.activated = False
+
+        user_email = (self.request.headers.get('X-User-Email') or '').strip() if self.request else ''
+        if not EMAIL_PATTERN.match(user_email):
+            return
+        try:
+            blob_service_client = get_blob_service_client()
+        except ValueError:
+            blob_service_client = None
+        if blob_service_client is None:
+            return
+
+        self.user_id_hash = UserSession.create_user_hash(user_email)
+        self.blob_name = source_blob_path(self.user_id_hash, file_name)
+        self.container_client = blob_service_client.get_container_client(self.container_name)
+        self.blob_client = self.container_client.get_blob_client(self.blob_name)
+        deletion_queue = get_deletion_queue()
+        if deletion_queue:
+            # Deleting the blob would also discard the blocks staged below
+            deletion_queue.cancel(self.container_name, [self.blob_name])
+        # Unique per upload so concurrent uploads of the same file never mix blocks
+        self.upload_id = uuid.uuid4().hex
+        self.block_ids = []
+        self.buffer = bytearray()
+        self.hasher = hashlib.sha256()
+        self.error = None
+        self.pending = []
+        self.slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency) if self.max_concurrency > 1 else None
+        self.activated = True
+        logger.info(f"Streaming upload of {file_name} into {self.container_name}/{self.blob_name}")
+        raise StopFutureHandlers()
+
+    def receive_data_chunk(self, raw_data, start):
+        if not self.activated:
+            return raw_data
+
+        # After a failed block the rest of the body is discarded; the view reports the error
+        if self.error is None:
+            self.hasher.update(raw_data)
+            self.buffer += raw_data
+            while len(self.buffer) >= self.block_size:
+                block = bytes(self.buffer[:self.block_size])
+                del self.buffer[:self.block_size]
+                self._stage(block)
+        return None
+
+    def file_complete(self, file_size):
+        if not self.activated:
+            return None
+
+        if self.buffer and self.error is None:
+            self._stage(bytes(self.buffer))
+        self.buffer = bytearray()
+        self._drain()
+        self.activated = False
+
+        return StagedBlobUpload(
+            name=self.file_name,
+            content_type=self.content_type,
+            size=file_size,
+            charset=self.charset,
+            blob_client=self.blob_client,
+            blob_name=self.blob_name,
+            block_ids=list(self.block_ids),
+            user_id_hash=self.user_id_hash,
+            content_hash=self.hasher.hexdigest(),
+            error=self.error,
+        )
+
+    def upload_interrupted(self):
+        # The client went away; uncommitted blocks are garbage collected by Azure
+        if self.activated:
+            self._drain()
+            self.activated = False
+
+    def _stage(self, block):
+        block_id = f"{self.upload_id}-{len(self.block_ids):06d}"
+        self.block_ids.append(block_id)
+        if self.executor is None:
+            self._stage_block(block_id, block)
+            return
+
+        # Wait for a free slot so at most max_concurrency blocks are held in memory
+        self.slots.acquire()
+        future = self.executor.submit(self._stage_block, block_id, block)
+        future.add_done_callback(lambda _: self.slots.release())
+        self.pending.append(future)
+
+    def _stage_block(self, block_id, block):
+        try:
+            try:
+                self.blob_client.stage_block(block_id, block)
+            except ResourceNotFoundError:
+                # First upload into a new storage account: create the container and retry
+                try:
+                    self.container_client.create_container()
+                except ResourceExistsError:
+                    pass
+                self.blob_client.stage_block(block_id, block)
+        except Exception as e:
+            logger.error(f"Failed to stage block {block_id} of {self.blob_name}: {str(e)}")
+            if self.error is None:
+                self.error = e
+
+    def _drain(self):
+        if self.executor is not None:
+            wait(self.pending)
+            self.executor.shutdown()
+            self.executor = None
+        self.pending = []
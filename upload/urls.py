@@ -4,7 +4,17 @@ from . import views
 urlpatterns = [
     path('', views.index, name='upload_page'),
     path('upload/', views.upload_file, name='upload_file'),
+    path('upload/batch/', views.upload_batch, name='upload_batch'),
+    path('upload/init/', views.upload_init, name='upload_init'),
+    path('upload/commit/', views.upload_commit, name='upload_commit'),
+    path('upload/check/', views.upload_check, name='upload_check'),
+    path('upload/sessions/', views.upload_session_init, name='upload_session_init'),
+    path('upload/sessions/<uuid:upload_id>/', views.upload_session_status, name='upload_session_status'),
+    path('upload/sessions/<uuid:upload_id>/chunks/<int:index>/', views.upload_session_chunk, name='upload_session_chunk'),
+    path('upload/sessions/<uuid:upload_id>/complete/', views.upload_session_complete, name='upload_session_complete'),
     path('translate/', views.translate_documents, name='translate_documents'),
+    path('translate/<uuid:job_id>/', views.translation_job_status, name='translation_job_status'),
+    path('translate/<uuid:job_id>/events/', views.translation_job_events, name='translation_job_events'),
     path('download/<str:filename>/', views.download_file, name='download_file'),
     path('delete-translated/', views.delete_translated_documents, name='delete_translated_documents'),
     path('delete-individual/<str:filename>/', views.delete_individual_translated_document, name='delete_individual_translated_document'),
@@ -1,25 +1,45 @@
 from django.shortcuts import render
-from django.http import JsonResponse, HttpResponse, Http404
+from django.http import JsonResponse, HttpResponse, HttpResponseRedirect, Http404, StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
 from django.views.decorators.csrf import csrf_exempt
-from azure.storage.blob import BlobServiceClient
-from azure.core.exceptions import ResourceExistsError, AzureError, ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient, BlobSasPermissions
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceExistsError, AzureError, ResourceModifiedError, ResourceNotFoundError
 import os
 import logging
 import re
 import uuid
 import time
+import threading
 import traceback
 from django.conf import settings
+from django.db.models import Q
 from django.utils import timezone
+from django.utils.http import http_date
+from django.urls import reverse
 import json
 import urllib.parse
 import mimetypes
 import hashlib
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from django.views.decorators.http import require_http_methods
 
 # Document model imports
-from .models import Document, UserSession
+from .models import Document, UserSession, TranslationJob, UploadSession
 from .middleware import require_user_session
+from .translation_jobs import enqueue_translation_job, MAX_TARGET_LANGUAGES
+from .upload_handlers import (
+    AzureBlobUploadHandler, StagedBlobUpload, CLIENT_HASH_METADATA, CONTENT_HASH_METADATA, EMAIL_PATTERN, source_blob_path
+)
+from .downloads import iter_blob_range, parse_byte_range
+from .blob_inventory import get_blob_inventory
+from .deletion_queue import get_deletion_queue
+from .resumable_uploads import MAX_CHUNKS, IncompleteUpload, commit_upload, stage_chunk
+from services.blob_operations import CopyRequest, bulk_delete_blobs, copy_blobs
+from services.clients import get_blob_service_client, get_client_registry
+from services.config import get_config as get_service_config
+from services.sas import blob_sas_url
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +52,26 @@ except ImportError:
     TRANSLATION_AVAILABLE = False
     logger.warning("Translation services not available - storage test will skip translation tests")
 
+# Server-Sent Events stream for translation jobs: how often the job row is re-read, how often an idle
+# stream sends a keep-alive, and how long one connection is held before the browser is asked to reconnect.
+# Each open stream occupies a server thread, so connections are short and their number per process is
+# capped (TRANSLATION_JOB_EVENTS_MAX_STREAMS); browsers over the cap poll the status URL instead.
+JOB_EVENTS_POLL_SECONDS = 2
+JOB_EVENTS_KEEPALIVE_SECONDS = 15
+JOB_EVENTS_MAX_SECONDS = 25
+
+_job_event_streams = 0
+_job_event_streams_lock = threading.Lock()
+
+# Language codes as accepted by Azure Translator (e.g. 'fr', 'pt-PT', 'zh-Hans')
+LANGUAGE_CODE_PATTERN = re.compile(r'^[A-Za-z]{2,3}(-[A-Za-z0-9]{2,8})*$')
+
+def translated_blob_path(user_id_hash, filename, language=None):
+    """Path of a translated file in the target container: '<user>/<lang>/<file>', or the legacy '<user>/<file>'."""
+    if language:
+        return f"{user_id_hash}/{language}/{filename}"
+    return f"{user_id_hash}/{filename}"
+
 def create_user_hash(email):
     """Create a consistent hash from user email."""
     return hashlib.sha256(email.encode()).hexdigest()[:16]
@@ -101,9 +141,10 @@ def debug_connection_string(connection_string):
     logger.info("Connection string appears to be properly formatted")
     return connection_string
 
-def delete_user_documents(user_id_hash, user_email):
+def delete_user_documents(user_id_hash, user_email, keep_source_blobs=()):
     """
     Delete all existing documents for a user from both database and Azure storage.
+    Source blobs named in keep_source_blobs are left alone (an upload is about to replace them).
     Returns a dictionary with deletion results.
     """
     try:
@@ -136,9 +177,10 @@ def delete_user_documents(user_id_hash, user_email):
                 'blob_deletions': {'source': 0, 'target': 0}
             }
         
-        # Debug and fix connection string if needed
-        fixed_connection_string = debug_connection_string(connection_string)
-        if not fixed_connection_string:
+        # Shared blob service client; the registry validates the connection string once per process
+        try:
+            blob_service_client = get_blob_service_client()
+        except ValueError:
             logger.error("Invalid Azure Storage connection string format")
             # Still delete from database even if blob deletion fails
             deleted_db_count = user_documents.count()
@@ -150,54 +192,51 @@ def delete_user_documents(user_id_hash, user_email):
                 'blob_deletions': {'source': 0, 'target': 0}
             }
         
-        # Initialize blob service client
-        blob_service_client = BlobServiceClient.from_connection_string(fixed_connection_string)
-        
         # Get container names
         source_container = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
         target_container = os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target')
         
-        blob_deletions = {'source': 0, 'target': 0}
-        
-        # Delete blobs from Azure Storage
+        # Collect every blob the documents may own, then delete them in batches
+        inventory = get_blob_inventory()
+        source_blobs = []
+        target_blobs = []
+        # Once reconciled, the inventory knows exactly which blobs are under the user's prefix
+        if inventory.is_authoritative(source_container):
+            source_blobs.extend(
+                name for name in inventory.names(source_container, user_id_hash) if name not in keep_source_blobs
+            )
+        if inventory.is_authoritative(target_container):
+            target_blobs.extend(inventory.names(target_container, user_id_hash))
         for document in user_documents:
-            # Delete from source container (original files)
-            if document.user_blob_name:
-                try:
-                    source_blob_client = blob_service_client.get_blob_client(
-                        container=source_container, 
-                        blob=document.user_blob_name
-                    )
-                    source_blob_client.delete_blob()
-                    blob_deletions['source'] += 1
-                    logger.info(f"Deleted source blob: {document.user_blob_name}")
-                except ResourceNotFoundError:
-                    logger.warning(f"Source blob not found: {document.user_blob_name}")
-                except Exception as e:
-                    logger.error(f"Error deleting source blob {document.user_blob_name}: {str(e)}")
+            # Source container (original files)
+            if document.user_blob_name and document.user_blob_name not in keep_source_blobs:
+                source_blobs.append(document.user_blob_name)
             
-            # Delete from target container (translated files)
-            # Try both with original filename and user-specific path
-            target_blob_paths = [
-                f"{user_id_hash}/{document.blob_name}",  # User-specific path with original filename
-                f"{user_id_hash}/{document.title}",     # User-specific path with title
-            ]
+            # Target container (translated files): per-language translations live under user_id_hash/<lang>/
+            source_filename = document.user_blob_name.split('/')[-1] if document.user_blob_name else document.blob_name
+            for language in document.translated_languages or []:
+                target_blobs.append(translated_blob_path(user_id_hash, source_filename, language))
             
-            for target_blob_path in target_blob_paths:
-                try:
-                    target_blob_client = blob_service_client.get_blob_client(
-                        container=target_container, 
-                        blob=target_blob_path
-                    )
-                    target_blob_client.delete_blob()
-                    blob_deletions['target'] += 1
-                    logger.info(f"Deleted target blob: {target_blob_path}")
-                    break  # If one path works, don't try the others
-                except ResourceNotFoundError:
-                    # This is expected if the file doesn't exist or wasn't translated
-                    continue
-                except Exception as e:
-                    logger.error(f"Error deleting target blob {target_blob_path}: {str(e)}")
+            # Older translations: both the original filename and the title under the user prefix
+            target_blobs.append(f"{user_id_hash}/{document.blob_name}")
+            target_blobs.append(f"{user_id_hash}/{document.title}")
+        
+        deletion_queue = get_deletion_queue()
+        if deletion_queue:
+            # Tombstone the blobs and let run_blob_deleter remove them, so the request does not wait on storage
+            blob_deletions = {
+                'source': len(deletion_queue.bury(source_container, source_blobs)),
+                'target': len(deletion_queue.bury(target_container, target_blobs)),
+                'queued': True
+            }
+        else:
+            source_result = bulk_delete_blobs(blob_service_client.get_container_client(source_container), source_blobs)
+            target_result = bulk_delete_blobs(blob_service_client.get_container_client(target_container), target_blobs)
+            inventory.forget(source_container, source_result['deleted'] + source_result['missing'])
+            inventory.forget(target_container, target_result['deleted'] + target_result['missing'])
+            if source_result['missing']:
+                logger.warning(f"Source blobs not found: {', '.join(source_result['missing'])}")
+            blob_deletions = {'source': len(source_result['deleted']), 'target': len(target_result['deleted'])}
         
         # Delete database records
         deleted_db_count = user_documents.count()
@@ -239,15 +278,12 @@ def health_check(request):
         connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
         if connection_string:
             try:
-                # Debug and fix connection string if needed
-                fixed_connection_string = debug_connection_string(connection_string)
-                if not fixed_connection_string:
-                    storage_healthy = False
-                    storage_error = "Invalid Azure Storage connection string"
-                else:
-                    blob_service_client = BlobServiceClient.from_connection_string(fixed_connection_string)
-                    # Try to list containers to verify connection
-                    list(blob_service_client.list_containers(results_per_page=5))
+                blob_service_client = get_blob_service_client()
+                # Try to list containers to verify connection
+                list(blob_service_client.list_containers(results_per_page=5))
+            except ValueError:
+                storage_healthy = False
+                storage_error = "Invalid Azure Storage connection string"
             except Exception as e:
                 logger.warning(f"Azure Storage health check failed: {str(e)}")
                 storage_healthy = False
@@ -260,7 +296,9 @@ def health_check(request):
             'checks': {
                 'database': 'ok',
                 'azure_storage': 'ok' if storage_healthy else ('warning' if connection_string else 'not_configured')
-            }
+            },
+            # Connection reuse of this worker process's shared Azure clients
+            'azure_clients': get_client_registry().stats()
         }
         
         # Add error details if any
@@ -313,9 +351,37 @@ def readiness_check(request):
             'timestamp': timezone.now().isoformat(),
             'error': str(e)        }, status=503)
 
+def write_source_blob(blob_service_client, container_name, user_blob_name, file):
+    """
+    Store an uploaded file as the user's source blob.
+    Returns the SHA-256 of the content and the properties Azure returned for the write.
+    """
+    if isinstance(file, StagedBlobUpload):
+        # Already staged while the request body arrived; committing makes it visible
+        blob_properties = file.commit()
+        content_hash = file.content_hash
+    else:
+        # Hash the content so identical documents can reuse cached translations
+        hasher = hashlib.sha256()
+        for chunk in file.chunks():
+            hasher.update(chunk)
+        file.seek(0)
+        content_hash = hasher.hexdigest()
+        
+        # Get blob client and upload file
+        blob_client = blob_service_client.get_blob_client(container=container_name, blob=user_blob_name)
+        blob_properties = blob_client.upload_blob(
+            file, overwrite=True, metadata={CONTENT_HASH_METADATA: content_hash}
+        )
+    return content_hash, blob_properties
+
 @csrf_exempt
 def upload_file(request):
     if request.method == 'POST':
+        # Stage the file into blob storage while the body is parsed; must happen before request.POST is read
+        if get_service_config().streaming_upload_enabled:
+            request.upload_handlers.insert(0, AzureBlobUploadHandler(request))
+        
         # Debug logging to understand the request
         logger.info(f"Upload request received")
         logger.debug(f"Content-Type: {request.content_type}")
@@ -338,12 +404,20 @@ def upload_file(request):
         if not re.match(email_pattern, user_email):
             return JsonResponse({'error': 'Invalid email format'}, status=400)
         
+        # Files streamed into storage were staged under the X-User-Email owner; it must match the form
+        staged_files = [f for f in request.FILES.getlist('file') if isinstance(f, StagedBlobUpload)]
+        if any(f.user_id_hash != UserSession.create_user_hash(user_email) for f in staged_files):
+            logger.error("X-User-Email header does not match the submitted email")
+            return JsonResponse({'error': 'User email mismatch'}, status=400)
+        
         # Create or update user session
         user_session = get_or_create_user_session(request, user_email)
         
         # Delete all existing documents for this user before uploading new ones
         user_id_hash = request.user_id_hash
-        deletion_result = delete_user_documents(user_id_hash, user_email)
+        deletion_result = delete_user_documents(
+            user_id_hash, user_email, keep_source_blobs=[f.blob_name for f in staged_files]
+        )
         
         if deletion_result['deleted_count'] > 0:
             logger.info(f"Deleted {deletion_result['deleted_count']} existing documents for user: {user_email}")
@@ -369,15 +443,13 @@ def upload_file(request):
                 logger.error("Azure Storage connection string not found")
                 return JsonResponse({'error': 'Storage configuration missing'}, status=500)
             
-            # Debug and fix connection string if needed
-            fixed_connection_string = debug_connection_string(connection_string)
-            if not fixed_connection_string:
+            # Shared blob service client; the registry validates the connection string once per process
+            try:
+                blob_service_client = get_blob_service_client()
+            except ValueError:
                 logger.error("Invalid Azure Storage connection string format")
                 return JsonResponse({'error': 'Storage configuration invalid'}, status=500)
             
-            # Initialize blob service client
-            blob_service_client = BlobServiceClient.from_connection_string(fixed_connection_string)
-            
             # Define container name (you can make this configurable)
             container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
             
@@ -395,12 +467,16 @@ def upload_file(request):
             
             # Create user-specific blob name with user hash prefix
             user_id_hash = request.user_id_hash
-            sanitized_filename = re.sub(r'[^\w\-_\.]', '_', file.name)
-            user_blob_name = f"{user_id_hash}/{sanitized_filename}"
+            user_blob_name = source_blob_path(user_id_hash, file.name)
+            deletion_queue = get_deletion_queue()
+            if deletion_queue:
+                deletion_queue.cancel(container_name, [user_blob_name])
             
-            # Get blob client and upload file
-            blob_client = blob_service_client.get_blob_client(container=container_name, blob=user_blob_name)
-            blob_client.upload_blob(file, overwrite=True)
+            content_hash, blob_properties = write_source_blob(blob_service_client, container_name, user_blob_name, file)
+            get_blob_inventory().record(
+                container_name, user_blob_name, size=file.size,
+                etag=blob_properties.get('etag'), last_modified=blob_properties.get('last_modified')
+            )
             
             # Save document record in database
             document = Document(
@@ -408,7 +484,8 @@ def upload_file(request):
                 user_email=user_email,
                 user_id_hash=user_id_hash,
                 blob_name=file.name,  # Original filename
-                user_blob_name=user_blob_name  # User-specific blob name
+                user_blob_name=user_blob_name,  # User-specific blob name
+                content_hash=content_hash
             )
             document.save()
             
@@ -440,6 +517,585 @@ def upload_file(request):
 
     return JsonResponse({'error': 'Invalid request method'}, status=400)
 
+@csrf_exempt
+@require_http_methods(["POST"])
+def upload_batch(request):
+    """
+    Upload several files in one multipart request.
+    The user's previous documents are purged once, the files are written to storage concurrently
+    and their Document rows are created together.
+    """
+    config = get_service_config()
+    # Stage the files into blob storage while the body is parsed; must happen before request.POST is read
+    if config.streaming_upload_enabled:
+        request.upload_handlers.insert(0, AzureBlobUploadHandler(request))
+    
+    user_email = (request.POST.get('user_email') or request.POST.get('email') or '').strip()
+    if not user_email:
+        return JsonResponse({'error': 'User email is required'}, status=400)
+    if not EMAIL_PATTERN.match(user_email):
+        return JsonResponse({'error': 'Invalid email format'}, status=400)
+    
+    files = request.FILES.getlist('file')
+    if not files:
+        return JsonResponse({'error': 'No files provided'}, status=400)
+    user_id_hash = UserSession.create_user_hash(user_email)
+    if any(isinstance(f, StagedBlobUpload) and f.user_id_hash != user_id_hash for f in files):
+        logger.error("X-User-Email header does not match the submitted email")
+        return JsonResponse({'error': 'User email mismatch'}, status=400)
+    user_blob_names = [source_blob_path(user_id_hash, f.name) for f in files]
+    if len(set(user_blob_names)) != len(user_blob_names):
+        return JsonResponse({'error': 'Files in one upload must have different names'}, status=400)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+    except ValueError:
+        logger.error("Invalid Azure Storage connection string format")
+        return JsonResponse({'error': 'Storage configuration invalid'}, status=500)
+    if blob_service_client is None:
+        logger.error("Azure Storage connection string not found")
+        return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+    
+    get_or_create_user_session(request, user_email)
+    container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+    try:
+        blob_service_client.get_container_client(container_name).create_container()
+        logger.info(f"Created container: {container_name}")
+    except ResourceExistsError:
+        pass
+    except AzureError as e:
+        logger.error(f"Error creating container: {str(e)}")
+        return JsonResponse({'error': 'Failed to create storage container'}, status=500)
+    
+    deletion_queue = get_deletion_queue()
+    if deletion_queue:
+        deletion_queue.cancel(container_name, user_blob_names)
+    deletion_result = delete_user_documents(user_id_hash, user_email, keep_source_blobs=user_blob_names)
+    
+    def write(item):
+        file, user_blob_name = item
+        try:
+            return write_source_blob(blob_service_client, container_name, user_blob_name, file), None
+        except Exception as e:
+            logger.error(f"Failed to upload {file.name} as {user_blob_name}: {str(e)}")
+            return None, e
+    
+    logger.info(f"Batch upload of {len(files)} files for user: {user_email}")
+    with ThreadPoolExecutor(max_workers=max(1, min(config.upload_batch_concurrency, len(files)))) as executor:
+        outcomes = list(executor.map(write, zip(files, user_blob_names)))
+    
+    inventory = get_blob_inventory()
+    documents = []
+    uploaded = []
+    failed = []
+    for file, user_blob_name, (written, error) in zip(files, user_blob_names, outcomes):
+        if error is not None:
+            failed.append({
+                'filename': file.name,
+                'error': f'Storage error: {str(error)}' if isinstance(error, AzureError) else 'Upload failed'
+            })
+            continue
+        content_hash, blob_properties = written
+        inventory.record(
+            container_name, user_blob_name, size=file.size,
+            etag=blob_properties.get('etag'), last_modified=blob_properties.get('last_modified')
+        )
+        documents.append(Document(
+            title=file.name,
+            user_email=user_email,
+            user_id_hash=user_id_hash,
+            blob_name=file.name,
+            user_blob_name=user_blob_name,
+            content_hash=content_hash
+        ))
+        uploaded.append({'filename': file.name, 'blob_name': user_blob_name, 'size': file.size})
+    Document.objects.bulk_create(documents)
+    logger.info(f"Batch upload for user {user_email}: {len(uploaded)} uploaded, {len(failed)} failed")
+    
+    response_data = {
+        'message': f'{len(uploaded)} of {len(files)} files uploaded successfully',
+        'uploaded': uploaded,
+        'failed': failed,
+        'container': container_name,
+        'user_email': user_email
+    }
+    if deletion_result['deleted_count'] > 0:
+        response_data['previous_documents_deleted'] = {
+            'count': deletion_result['deleted_count'],
+            'message': deletion_result['message']
+        }
+    return JsonResponse(response_data, status=200 if uploaded else 500)
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def upload_init(request):
+    """
+    Start a direct upload: issue a short-lived write-only SAS URL for the user's source blob.
+    The browser PUTs the file to that URL and then calls upload_commit.
+    """
+    config = get_service_config()
+    if not config.direct_upload_enabled:
+        return JsonResponse({'error': 'Direct upload is not enabled'}, status=404)
+    
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    user_email = str(data.get('user_email') or '').strip()
+    filename = str(data.get('filename') or '').strip()
+    if not user_email:
+        return JsonResponse({'error': 'User email is required'}, status=400)
+    if not EMAIL_PATTERN.match(user_email):
+        return JsonResponse({'error': 'Invalid email format'}, status=400)
+    if not filename:
+        return JsonResponse({'error': 'No file provided'}, status=400)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+    except ValueError:
+        logger.error("Invalid Azure Storage connection string format")
+        return JsonResponse({'error': 'Storage configuration invalid'}, status=500)
+    if blob_service_client is None:
+        logger.error("Azure Storage connection string not found")
+        return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+    
+    # Create or update user session; the commit step is authorised by it
+    get_or_create_user_session(request, user_email)
+    user_id_hash = request.user_id_hash
+    container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+    user_blob_name = source_blob_path(user_id_hash, filename)
+    deletion_queue = get_deletion_queue()
+    if deletion_queue:
+        # The browser is about to write this blob; an older queued deletion must not remove it
+        deletion_queue.cancel(container_name, [user_blob_name])
+    
+    try:
+        upload_url = blob_sas_url(
+            blob_service_client,
+            container_name,
+            user_blob_name,
+            BlobSasPermissions(create=True, write=True),
+            config.upload_sas_ttl
+        )
+    except ValueError as e:
+        logger.warning(f"Direct upload unavailable: {str(e)}")
+        return JsonResponse({'error': 'Direct upload is not available'}, status=501)
+    
+    try:
+        blob_service_client.get_container_client(container_name).create_container()
+        logger.info(f"Created container: {container_name}")
+    except ResourceExistsError:
+        pass
+    except AzureError as e:
+        logger.error(f"Error creating container: {str(e)}")
+        return JsonResponse({'error': 'Failed to create storage container'}, status=500)
+    
+    logger.info(f"Issued direct upload URL for {user_blob_name} to user: {user_email}")
+    return JsonResponse({
+        'upload_url': upload_url,
+        'method': 'PUT',
+        'headers': {'x-ms-blob-type': 'BlockBlob'},
+        'blob_name': user_blob_name,
+        'expires_in': config.upload_sas_ttl,
+        'commit_url': reverse('upload_commit'),
+    })
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_user_session
+def upload_commit(request):
+    """Finish a direct upload: check the blob the browser wrote and record it as the user's document."""
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    user_email = request.user_email
+    user_id_hash = request.user_id_hash
+    filename = str(data.get('filename') or '').strip()
+    if not filename:
+        return JsonResponse({'error': 'No file provided'}, status=400)
+    client_hash = _client_content_hash(data)
+    if client_hash is None:
+        return JsonResponse({'error': 'sha256 must be a SHA-256 hex digest'}, status=400)
+    container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+    user_blob_name = source_blob_path(user_id_hash, filename)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+        if blob_service_client is None:
+            return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+        
+        # Trust nothing the browser says about the file; read what actually landed in storage
+        blob_client = blob_service_client.get_blob_client(container=container_name, blob=user_blob_name)
+        try:
+            properties = blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            logger.warning(f"Direct upload commit for missing blob {user_blob_name} by user: {user_email}")
+            return JsonResponse({'error': 'Uploaded file not found'}, status=400)
+        if not properties.size:
+            return JsonResponse({'error': 'Uploaded file is empty'}, status=400)
+        etag, last_modified = properties.etag, properties.last_modified
+        if client_hash:
+            # Only on the blob that was just checked, so a concurrent rewrite never inherits the hash
+            try:
+                written = blob_client.set_blob_metadata(
+                    {CLIENT_HASH_METADATA: client_hash}, etag=etag, match_condition=MatchConditions.IfNotModified
+                )
+                etag, last_modified = written.get('etag'), written.get('last_modified')
+            except ResourceModifiedError:
+                logger.warning(f"{user_blob_name} changed during its direct upload commit; not recording its hash")
+                client_hash = ''
+        
+        deletion_result = delete_user_documents(user_id_hash, user_email, keep_source_blobs=[user_blob_name])
+        get_blob_inventory().record(
+            container_name, user_blob_name, size=properties.size, etag=etag, last_modified=last_modified
+        )
+        
+        # The browser's hash is kept apart from content_hash: translation hashes the blob server-side rather than trust it
+        Document.objects.create(
+            title=filename,
+            user_email=user_email,
+            user_id_hash=user_id_hash,
+            blob_name=filename,
+            user_blob_name=user_blob_name,
+            client_content_hash=client_hash
+        )
+        logger.info(f"Committed direct upload of {filename} ({properties.size} bytes) as {user_blob_name} for user: {user_email}")
+        
+        response_data = {
+            'message': 'File uploaded successfully',
+            'filename': filename,
+            'container': container_name,
+            'blob_name': user_blob_name,
+            'size': properties.size,
+            'user_email': user_email
+        }
+        if deletion_result['deleted_count'] > 0:
+            response_data['previous_documents_deleted'] = {
+                'count': deletion_result['deleted_count'],
+                'message': deletion_result['message']
+            }
+        return JsonResponse(response_data)
+    
+    except (AzureError, ValueError) as e:
+        logger.error(f"Storage error committing direct upload {user_blob_name}: {str(e)}")
+        return JsonResponse({'error': f'Storage error: {str(e)}'}, status=500)
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def upload_session_init(request):
+    """
+    Start a resumable upload of a large file.
+    The browser PUTs each chunk to upload_session_chunk, asks upload_session_status which chunks
+    are missing after an interruption, and finishes with upload_session_complete.
+    """
+    config = get_service_config()
+    if not config.resumable_upload_enabled:
+        return JsonResponse({'error': 'Resumable upload is not enabled'}, status=404)
+    
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    user_email = str(data.get('user_email') or '').strip()
+    filename = str(data.get('filename') or '').strip()
+    size = data.get('size')
+    if not user_email:
+        return JsonResponse({'error': 'User email is required'}, status=400)
+    if not EMAIL_PATTERN.match(user_email):
+        return JsonResponse({'error': 'Invalid email format'}, status=400)
+    if not filename:
+        return JsonResponse({'error': 'No file provided'}, status=400)
+    if not isinstance(size, int) or isinstance(size, bool) or size <= 0:
+        return JsonResponse({'error': 'The file size is required and must be positive'}, status=400)
+    client_hash = _client_content_hash(data)
+    if client_hash is None:
+        return JsonResponse({'error': 'sha256 must be a SHA-256 hex digest'}, status=400)
+    chunk_size = config.resumable_chunk_size
+    if -(-size // chunk_size) > MAX_CHUNKS:
+        return JsonResponse({'error': 'File is too large'}, status=400)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+    except ValueError:
+        logger.error("Invalid Azure Storage connection string format")
+        return JsonResponse({'error': 'Storage configuration invalid'}, status=500)
+    if blob_service_client is None:
+        logger.error("Azure Storage connection string not found")
+        return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+    
+    # Chunks, status and completion are authorised by the user session
+    get_or_create_user_session(request, user_email)
+    user_id_hash = request.user_id_hash
+    container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+    user_blob_name = source_blob_path(user_id_hash, filename)
+    deletion_queue = get_deletion_queue()
+    if deletion_queue:
+        # Deleting the blob would also discard the chunks staged into it
+        deletion_queue.cancel(container_name, [user_blob_name])
+    
+    session = UploadSession.objects.create(
+        user_email=user_email,
+        user_id_hash=user_id_hash,
+        filename=filename,
+        container=container_name,
+        blob_name=user_blob_name,
+        size=size,
+        chunk_size=chunk_size,
+        client_content_hash=client_hash,
+        expires_at=timezone.now() + timedelta(seconds=config.upload_session_ttl)
+    )
+    logger.info(f"Started resumable upload {session.upload_id} of {filename} ({size} bytes, {session.chunk_count} chunks) for user: {user_email}")
+    
+    response_data = session.to_dict()
+    response_data['status_url'] = reverse('upload_session_status', args=[session.upload_id])
+    response_data['complete_url'] = reverse('upload_session_complete', args=[session.upload_id])
+    return JsonResponse(response_data, status=201)
+
+def _client_content_hash(data):
+    """The optional 'sha256' the browser sent for a whole file, lower-cased; '' when absent and None when malformed."""
+    client_hash = str(data.get('sha256') or '').strip().lower()
+    if client_hash and not re.match(r'^[0-9a-f]{64}$', client_hash):
+        return None
+    return client_hash
+
+def _user_upload_session(request, upload_id):
+    """The signed-in user's upload session with this ID, or None."""
+    return UploadSession.objects.filter(upload_id=upload_id, user_id_hash=request.user_id_hash).first()
+
+@csrf_exempt
+@require_http_methods(["PUT"])
+@require_user_session
+def upload_session_chunk(request, upload_id, index):
+    """Stage chunk `index` of a resumable upload from the raw request body. Sending a chunk again replaces it."""
+    session = _user_upload_session(request, upload_id)
+    if session is None:
+        return JsonResponse({'error': 'Upload not found'}, status=404)
+    if session.completed_at:
+        return JsonResponse({'error': 'Upload already completed'}, status=409)
+    if session.expires_at < timezone.now():
+        return JsonResponse({'error': 'Upload expired'}, status=410)
+    if index >= session.chunk_count:
+        return JsonResponse({'error': 'Chunk index out of range'}, status=400)
+    
+    # Read at most one byte more than the chunk holds, whatever the client sends
+    expected_size = session.expected_chunk_size(index)
+    try:
+        content_length = int(request.META.get('CONTENT_LENGTH') or 0)
+    except ValueError:
+        content_length = 0
+    data = request.read(expected_size + 1) if content_length == expected_size else b''
+    if len(data) != expected_size:
+        return JsonResponse({'error': f'Chunk {index} must be exactly {expected_size} bytes'}, status=400)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+        if blob_service_client is None:
+            return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+        stage_chunk(blob_service_client, session, index, data)
+    except (AzureError, ValueError) as e:
+        logger.error(f"Storage error staging chunk {index} of upload {upload_id}: {str(e)}")
+        return JsonResponse({'error': f'Storage error: {str(e)}'}, status=500)
+    
+    return JsonResponse({'index': index, 'size': len(data)})
+
+@require_http_methods(["GET"])
+@require_user_session
+def upload_session_status(request, upload_id):
+    """Which chunks of a resumable upload the server has, so an interrupted upload sends only the rest."""
+    session = _user_upload_session(request, upload_id)
+    if session is None:
+        return JsonResponse({'error': 'Upload not found'}, status=404)
+    if session.completed_at is None and session.expires_at < timezone.now():
+        return JsonResponse({'error': 'Upload expired'}, status=410)
+    return JsonResponse(session.to_dict())
+
+@csrf_exempt
+@require_http_methods(["POST"])
+@require_user_session
+def upload_session_complete(request, upload_id):
+    """Commit a resumable upload once every chunk is staged and record it as the user's document."""
+    session = _user_upload_session(request, upload_id)
+    if session is None:
+        return JsonResponse({'error': 'Upload not found'}, status=404)
+    
+    user_email = request.user_email
+    user_id_hash = request.user_id_hash
+    response_data = {
+        'message': 'File uploaded successfully',
+        'upload_id': str(session.upload_id),
+        'filename': session.filename,
+        'container': session.container,
+        'blob_name': session.blob_name,
+        'size': session.size,
+        'user_email': user_email
+    }
+    
+    if session.completed_at is None and session.expires_at < timezone.now():
+        return JsonResponse({'error': 'Upload expired'}, status=410)
+    
+    # Claim the completion so a retried request cannot record the document twice
+    claimed = UploadSession.objects.filter(pk=session.pk, completed_at__isnull=True).update(completed_at=timezone.now())
+    if not claimed:
+        return JsonResponse(response_data)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+        if blob_service_client is None:
+            UploadSession.objects.filter(pk=session.pk).update(completed_at=None)
+            return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+        deletion_queue = get_deletion_queue()
+        if deletion_queue:
+            deletion_queue.cancel(session.container, [session.blob_name])
+        blob_properties = commit_upload(blob_service_client, session)
+    except IncompleteUpload as e:
+        UploadSession.objects.filter(pk=session.pk).update(completed_at=None)
+        return JsonResponse({'error': 'Upload is missing chunks', 'missing_chunks': e.missing}, status=409)
+    except (AzureError, ValueError) as e:
+        UploadSession.objects.filter(pk=session.pk).update(completed_at=None)
+        logger.error(f"Storage error completing upload {upload_id}: {str(e)}")
+        return JsonResponse({'error': f'Storage error: {str(e)}'}, status=500)
+    
+    deletion_result = delete_user_documents(user_id_hash, user_email, keep_source_blobs=[session.blob_name])
+    get_blob_inventory().record(
+        session.container, session.blob_name, size=session.size,
+        etag=blob_properties.get('etag'), last_modified=blob_properties.get('last_modified')
+    )
+    
+    # As with direct uploads only the browser's hash is known: no single request saw the whole file
+    Document.objects.create(
+        title=session.filename,
+        user_email=user_email,
+        user_id_hash=user_id_hash,
+        blob_name=session.filename,
+        user_blob_name=session.blob_name,
+        client_content_hash=session.client_content_hash
+    )
+    logger.info(f"Completed resumable upload {session.upload_id} of {session.filename} ({session.size} bytes) for user: {user_email}")
+    
+    if deletion_result['deleted_count'] > 0:
+        response_data['previous_documents_deleted'] = {
+            'count': deletion_result['deleted_count'],
+            'message': deletion_result['message']
+        }
+    return JsonResponse(response_data)
+
+@csrf_exempt
+@require_http_methods(["POST"])
+def upload_check(request):
+    """
+    Skip re-uploading a file the user already has in storage.
+    The browser sends the SHA-256 of the file; if one of the user's source blobs was uploaded with
+    that hash, it is registered as the new document without a transfer. Hashes of resumable and direct
+    uploads were reported by the browser, so they only ever match the same user's files and are never
+    recorded as the server-computed content_hash.
+    """
+    try:
+        data = json.loads(request.body)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return JsonResponse({'error': 'Invalid JSON'}, status=400)
+    
+    user_email = str(data.get('user_email') or '').strip()
+    filename = str(data.get('filename') or '').strip()
+    content_hash = str(data.get('sha256') or '').strip().lower()
+    size = data.get('size')
+    if not user_email:
+        return JsonResponse({'error': 'User email is required'}, status=400)
+    if not EMAIL_PATTERN.match(user_email):
+        return JsonResponse({'error': 'Invalid email format'}, status=400)
+    if not filename:
+        return JsonResponse({'error': 'No file provided'}, status=400)
+    if not re.match(r'^[0-9a-f]{64}$', content_hash) or not isinstance(size, int):
+        return JsonResponse({'error': 'A SHA-256 hex digest and the file size are required'}, status=400)
+    
+    try:
+        blob_service_client = get_blob_service_client()
+    except ValueError:
+        logger.error("Invalid Azure Storage connection string format")
+        return JsonResponse({'error': 'Storage configuration invalid'}, status=500)
+    if blob_service_client is None:
+        logger.error("Azure Storage connection string not found")
+        return JsonResponse({'error': 'Storage configuration missing'}, status=500)
+    
+    get_or_create_user_session(request, user_email)
+    user_id_hash = request.user_id_hash
+    container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+    user_blob_name = source_blob_path(user_id_hash, filename)
+    
+    try:
+        # Only the user's own blobs qualify, and only with the hash recorded on the blob itself
+        existing_blob_name = None
+        verified = False
+        candidates = Document.objects.filter(
+            Q(content_hash=content_hash) | Q(client_content_hash=content_hash), user_id_hash=user_id_hash
+        ).exclude(user_blob_name='').values_list('user_blob_name', flat=True)
+        for candidate in dict.fromkeys(candidates):
+            try:
+                properties = blob_service_client.get_blob_client(
+                    container=container_name, blob=candidate
+                ).get_blob_properties()
+            except ResourceNotFoundError:
+                continue
+            metadata = properties.metadata or {}
+            if properties.size != size:
+                continue
+            if metadata.get(CONTENT_HASH_METADATA) == content_hash or metadata.get(CLIENT_HASH_METADATA) == content_hash:
+                existing_blob_name = candidate
+                verified = metadata.get(CONTENT_HASH_METADATA) == content_hash
+                break
+        
+        if existing_blob_name is None:
+            logger.info(f"No stored copy of {filename} for user: {user_email}; a full upload is needed")
+            return JsonResponse({'exists': False})
+        
+        deletion_queue = get_deletion_queue()
+        if deletion_queue:
+            deletion_queue.cancel(container_name, [user_blob_name])
+        if existing_blob_name != user_blob_name:
+            # Same content under another name: copy it server-side before the old documents are removed
+            result = copy_blobs(blob_service_client, [
+                CopyRequest(container_name, existing_blob_name, container_name, user_blob_name, size=size)
+            ])
+            if result['failed']:
+                logger.warning(f"Could not reuse {existing_blob_name} for {filename}: {result['failed'][0]['error']}")
+                return JsonResponse({'exists': False})
+        
+        deletion_result = delete_user_documents(user_id_hash, user_email, keep_source_blobs=[user_blob_name])
+        get_blob_inventory().record(container_name, user_blob_name, size=size)
+        Document.objects.create(
+            title=filename,
+            user_email=user_email,
+            user_id_hash=user_id_hash,
+            blob_name=filename,
+            user_blob_name=user_blob_name,
+            content_hash=content_hash if verified else '',
+            client_content_hash='' if verified else content_hash
+        )
+        logger.info(f"Registered {filename} from stored copy {existing_blob_name} for user: {user_email} without upload")
+        
+        response_data = {
+            'exists': True,
+            'message': 'File already uploaded',
+            'filename': filename,
+            'container': container_name,
+            'blob_name': user_blob_name,
+            'size': size,
+            'user_email': user_email
+        }
+        if deletion_result['deleted_count'] > 0:
+            response_data['previous_documents_deleted'] = {
+                'count': deletion_result['deleted_count'],
+                'message': deletion_result['message']
+            }
+        return JsonResponse(response_data)
+    
+    except AzureError as e:
+        logger.error(f"Storage error checking for a stored copy of {filename}: {str(e)}")
+        return JsonResponse({'error': f'Storage error: {str(e)}'}, status=500)
+
 def index(request):
     context = {}
     return render(request, 'upload/index.html', context)
@@ -459,7 +1115,15 @@ def translate_documents(request):
             data = json.loads(request.body)
             logger.info(f"Parsed JSON data: {data}")
             
-            target_language = data.get('target_language', 'en')
+            # Either a single 'target_language' or a 'target_languages' list translated in one operation
+            target_languages = data.get('target_languages') or [data.get('target_language', 'en')]
+            if isinstance(target_languages, str):
+                target_languages = [target_languages]
+            target_languages = list(dict.fromkeys(target_languages))  # Drop duplicates, keep order
+            if not all(isinstance(lang, str) and LANGUAGE_CODE_PATTERN.match(lang) for lang in target_languages):
+                return JsonResponse({'error': 'Invalid target language'}, status=400)
+            if len(target_languages) > MAX_TARGET_LANGUAGES:
+                return JsonResponse({'error': f'At most {MAX_TARGET_LANGUAGES} target languages can be requested at once'}, status=400)
             source_language = data.get('source_language')  # Optional
             clear_target = data.get('clear_target', True)  # Default to True for automatic cleanup
             cleanup_source = data.get('cleanup_source', False)  # Optional cleanup
@@ -472,7 +1136,7 @@ def translate_documents(request):
             user_email = request.user_email
             user_id_hash = request.user_id_hash
             
-            logger.info(f"Translation request to language: {target_language} for user: {user_email}")
+            logger.info(f"Translation request to language(s): {', '.join(target_languages)} for user: {user_email}")
             if clear_target:
                 logger.info("Target container will be cleared before translation")
             
@@ -481,46 +1145,28 @@ def translate_documents(request):
             if not user_documents:
                 return JsonResponse({'error': 'No documents found for translation'}, status=400)
             
-            # Get configuration and create translation service
-            try:
-                config = get_config()
-                translation_service = create_translation_service()
-            except ValueError as config_error:
-                logger.error(f"Configuration error: {str(config_error)}")
-                return JsonResponse({
-                    'error': f'Translation service configuration error: {str(config_error)}'
-                }, status=500)
+            if not TRANSLATION_AVAILABLE:
+                return JsonResponse({'error': 'Translation service is not available'}, status=500)
             
-            # Use user-specific translation method
-            result = translation_service.translate_documents_user_specific(
+            # Queue the translation - a background worker runs the Azure operation
+            job = enqueue_translation_job(
+                user_email=user_email,
                 user_id_hash=user_id_hash,
-                target_language=target_language,
+                target_language=target_languages,
                 source_language=source_language,
                 clear_target=clear_target,
                 cleanup_source=cleanup_source
             )
             
-            # Update documents as translated
-            user_documents.update(
-                is_translated=True, 
-                translation_language=target_language
-            )
-            
-            logger.info(f"Translation completed for user {user_email}. Status: {result['status']}")
-            logger.info(f"Translation result keys: {result.keys()}")
-            logger.info(f"Documents in result: {result.get('documents', [])}")
-            logger.info(f"Number of documents: {len(result.get('documents', []))}")
-            
-            # Log each document for debugging
-            if 'documents' in result:
-                for i, doc in enumerate(result['documents']):
-                    logger.info(f"Document {i}: {doc}")
-            
             return JsonResponse({
                 'success': True,
-                'data': result,
-                'message': f"Translation started successfully. Status: {result['status']}"
-            })
+                'job_id': str(job.job_id),
+                'status': job.status,
+                'target_languages': job.target_languages,
+                'status_url': reverse('translation_job_status', args=[job.job_id]),
+                'events_url': reverse('translation_job_events', args=[job.job_id]),
+                'message': 'Translation queued successfully'
+            }, status=202)
             
         except json.JSONDecodeError as e:
             logger.error(f"JSON decode error: {str(e)}, Request body: {request.body}")
@@ -545,14 +1191,130 @@ def translate_documents(request):
     
     return JsonResponse({'error': 'Invalid request method'}, status=405)
 
+@require_user_session
+def translation_job_status(request, job_id):
+    """
+    Return the status of a queued translation job owned by the current user.
+    Progress and per-document states are written to the job by the translation worker, so polling never calls Azure.
+    """
+    try:
+        job = TranslationJob.objects.get(job_id=job_id, user_id_hash=request.user_id_hash)
+    except TranslationJob.DoesNotExist:
+        return JsonResponse({'error': 'Translation job not found'}, status=404)
+    
+    return JsonResponse(_translation_job_payload(job))
+
+@require_user_session
+def translation_job_events(request, job_id):
+    """Stream the progress of a translation job owned by the current user as Server-Sent Events."""
+    if not TranslationJob.objects.filter(job_id=job_id, user_id_hash=request.user_id_hash).exists():
+        return JsonResponse({'error': 'Translation job not found'}, status=404)
+    
+    if not _claim_job_event_stream():
+        # EventSource gives up on a non-200 answer and the page polls the status URL instead
+        response = JsonResponse({'error': 'Too many open progress streams, poll the job status instead'}, status=503)
+        response['Retry-After'] = str(JOB_EVENTS_MAX_SECONDS)
+        return response
+    
+    response = StreamingHttpResponse(
+        _JobEventStream(_translation_job_event_stream(job_id, request.user_id_hash)),
+        content_type='text/event-stream'
+    )
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # Stop reverse proxies from buffering the stream
+    return response
+
+def _claim_job_event_stream():
+    """Take one of this process's progress stream slots; False when they are all in use."""
+    global _job_event_streams
+    with _job_event_streams_lock:
+        if _job_event_streams >= get_service_config().job_events_max_streams:
+            return False
+        _job_event_streams += 1
+        return True
+
+def _release_job_event_stream():
+    global _job_event_streams
+    with _job_event_streams_lock:
+        _job_event_streams -= 1
+
+class _JobEventStream:
+    """A progress event stream that gives its slot back when the server closes the response, however it ended."""
+    
+    def __init__(self, events):
+        self._events = events
+        self._open = True
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        return next(self._events)
+    
+    def close(self):
+        self._events.close()
+        if self._open:
+            self._open = False
+            _release_job_event_stream()
+
+def _translation_job_payload(job):
+    """Status API payload for a job; finished jobs carry the same shape the synchronous /translate/ used to return."""
+    payload = {
+        'success': True,
+        'job': job.to_dict()
+    }
+    if job.is_finished:
+        payload['success'] = job.status == TranslationJob.STATUS_SUCCEEDED
+        payload['data'] = job.result
+        if job.error:
+            payload['error'] = job.error
+    return payload
+
+def _server_sent_event(event, data):
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+def _translation_job_event_stream(job_id, user_id_hash):
+    """
+    Yield a 'progress' event whenever the job row changes and a final 'complete' event once it has finished.
+    Progress is written to the job by the translation worker, so the stream itself never calls Azure.
+    """
+    started = time.monotonic()
+    last_sent = started
+    last_payload = None
+    yield f"retry: {JOB_EVENTS_POLL_SECONDS * 3000}\n\n"
+    
+    while time.monotonic() - started < JOB_EVENTS_MAX_SECONDS:
+        job = TranslationJob.objects.filter(job_id=job_id, user_id_hash=user_id_hash).first()
+        if job is None:
+            yield _server_sent_event('complete', {'success': False, 'error': 'Translation job not found'})
+            return
+        
+        payload = _translation_job_payload(job)
+        if job.is_finished:
+            yield _server_sent_event('complete', payload)
+            return
+        
+        if payload != last_payload:
+            yield _server_sent_event('progress', payload)
+            last_payload = payload
+            last_sent = time.monotonic()
+        elif time.monotonic() - last_sent >= JOB_EVENTS_KEEPALIVE_SECONDS:
+            yield ": keep-alive\n\n"
+            last_sent = time.monotonic()
+        
+        time.sleep(JOB_EVENTS_POLL_SECONDS)
+
 @require_user_session
 def download_file(request, filename):
     """Download a translated file from Azure Blob Storage with user isolation."""
     try:
         user_id_hash = request.user_id_hash
         user_email = request.user_email
+        language = request.GET.get('lang') or None  # Which translation, when a document has several
+        if language and not LANGUAGE_CODE_PATTERN.match(language):
+            raise Http404("File not found or access denied")
         
-        logger.info(f"Download request for file: {filename} by user: {user_email}")
+        logger.info(f"Download request for file: {filename} ({language or 'default'}) by user: {user_email}")
         logger.debug(f"User ID hash: {user_id_hash}")
         
         # Verify file ownership - first try with exact filename
@@ -584,24 +1346,62 @@ def download_file(request, filename):
             logger.error("Azure Storage connection string not found")
             raise Http404("Storage configuration missing")
         
-        # Create blob service client
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+        # Shared blob service client
+        blob_service_client = get_blob_service_client()
         
         # Try to find the file in user's target folder (translated files)
         target_container = os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target')
-        user_blob_path = f"{user_id_hash}/{filename}"
+        user_blob_path = translated_blob_path(user_id_hash, filename, language)
         
         logger.debug(f"Looking for translated file at: {target_container}/{user_blob_path}")
         
         try:
             blob_client = blob_service_client.get_blob_client(container=target_container, blob=user_blob_path)
-            blob_data = blob_client.download_blob()
             
-            # Create HTTP response with file data
-            response = HttpResponse(blob_data.readall(), content_type='application/octet-stream')
+            # Opt-in: let the browser fetch the bytes from storage directly with a short-lived read-only SAS
+            config = get_service_config()
+            if config.download_redirect_enabled:
+                redirect = redirect_to_blob_sas(
+                    blob_service_client, blob_client, target_container, user_blob_path, filename, config.download_sas_ttl
+                )
+                if redirect:
+                    logger.info(f"Redirecting download of {filename} to storage for user: {user_email}")
+                    return redirect
+            
+            properties = blob_client.get_blob_properties()
+            size = properties.size
+            etag = properties.etag
+            last_modified = http_date(properties.last_modified.timestamp())
+            
+            # Resume a partial download only if the blob is unchanged since (If-Range), else send it whole
+            try:
+                byte_range = parse_byte_range(request.headers.get('Range'), size)
+            except ValueError:
+                response = HttpResponse(status=416)
+                response['Content-Range'] = f'bytes */{size}'
+                return response
+            if_range = request.headers.get('If-Range')
+            if byte_range and if_range and if_range not in (etag, last_modified):
+                byte_range = None
+            start, end = byte_range or (0, size - 1)
+            length = end - start + 1
+            
+            # Stream the blob in ranges so worker memory stays flat whatever the file size
+            prefetch = config.download_prefetch_chunks if length >= config.download_parallel_threshold else 1
+            response = StreamingHttpResponse(
+                iter_blob_range(blob_client, start, length, config.download_chunk_size, prefetch, etag),
+                status=206 if byte_range else 200,
+                content_type='application/octet-stream'
+            )
+            response['Content-Length'] = str(length)
+            if byte_range:
+                response['Content-Range'] = f'bytes {start}-{end}/{size}'
+            response['Accept-Ranges'] = 'bytes'
+            response['ETag'] = etag
+            response['Last-Modified'] = last_modified
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             
-            logger.info(f"Successfully downloaded translated file: {filename} for user: {user_email}")
+            logger.info(f"Streaming translated file: {filename} ({start}-{end}/{size}) for user: {user_email}")
             return response
             
         except ResourceNotFoundError:
@@ -615,6 +1415,35 @@ def download_file(request, filename):
         logger.error(f"Download error for {filename} by user {getattr(request, 'user_email', 'unknown')}: {str(e)}")
         raise Http404("Download failed")
 
+def redirect_to_blob_sas(blob_service_client, blob_client, container_name, blob_name, filename, ttl_seconds):
+    """
+    Redirect to a read-only SAS URL for one blob, with Content-Disposition set through the SAS overrides.
+    Returns None when the storage credential cannot sign SAS tokens, so the caller streams the file instead.
+    Raises ResourceNotFoundError if the blob does not exist.
+    """
+    try:
+        sas_url = blob_sas_url(
+            blob_service_client,
+            container_name,
+            blob_name,
+            BlobSasPermissions(read=True),
+            ttl_seconds,
+            content_disposition=f'attachment; filename="{filename}"',
+            content_type='application/octet-stream'
+        )
+    except ValueError as e:
+        logger.warning(f"SAS redirect unavailable, streaming download instead: {str(e)}")
+        return None
+    
+    # A redirect to a missing blob would show the user Azure's XML error page
+    if not blob_client.exists():
+        raise ResourceNotFoundError(f"Blob {blob_name} not found")
+    
+    response = HttpResponseRedirect(sas_url)
+    # The URL carries a token; keep it out of shared caches
+    response['Cache-Control'] = 'private, no-store'
+    return response
+
 @csrf_exempt
 @require_user_session
 def list_user_files(request):
@@ -633,7 +1462,8 @@ def list_user_files(request):
                 'title': doc.title,
                 'uploaded_at': doc.uploaded_at.isoformat(),
                 'is_translated': doc.is_translated,
-                'translation_language': doc.translation_language
+                'translation_language': doc.translation_language,
+                'translated_languages': doc.translated_languages
             })
         
         logger.info(f"Listed {len(files_data)} files for user: {user_email}")
@@ -659,11 +1489,13 @@ def cleanup_sessions(request):
             hours = data.get('hours', 24)
             
             count = UserSession.cleanup_old_sessions(hours)
+            upload_count = UploadSession.cleanup_expired()
             
             return JsonResponse({
                 'success': True,
                 'message': f'Cleaned up {count} old sessions',
-                'cleaned_count': count
+                'cleaned_count': count,
+                'expired_uploads_cleaned': upload_count
             })
         except Exception as e:
             logger.error(f"Error cleaning up sessions: {str(e)}")
@@ -1162,26 +1994,36 @@ def debug_user_files(request):
         
         # Check translation service
         from services.translation_service import create_translation_service
-        translation_service = create_translation_service()
+        translation_service = create_translation_service(
+            blob_inventory=get_blob_inventory(), deletion_queue=get_deletion_queue()
+        )
         
         # Check if user has source files in blob storage
         source_uri = os.getenv('AZURE_TRANSLATION_SOURCE_URI')
         has_source_files = translation_service._user_has_source_files(source_uri, user_id_hash)
         
-        # List actual files in blob storage
-        connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
-        blob_service_client = BlobServiceClient.from_connection_string(connection_string)
-        container_client = blob_service_client.get_container_client('source')
+        # Files in blob storage, from the inventory once it has been reconciled, else by listing
+        source_container = os.getenv('AZURE_STORAGE_CONTAINER_NAME_SOURCE', 'source')
+        inventory = get_blob_inventory()
+        inventory_used = inventory.is_authoritative(source_container)
+        if inventory_used:
+            blob_files = inventory.names(source_container, user_id_hash)
+        else:
+            container_client = get_blob_service_client().get_container_client(source_container)
+            blob_files = [blob.name for blob in container_client.list_blobs(name_starts_with=f"{user_id_hash}/")]
         
-        blob_files = []
-        for blob in container_client.list_blobs(name_starts_with=f"{user_id_hash}/"):
-            blob_files.append(blob.name)
+        # Blobs waiting for the background deleter are already deleted as far as the app is concerned
+        deletion_queue = get_deletion_queue()
+        queued_for_deletion = sorted(deletion_queue.buried(source_container, blob_files)) if deletion_queue else []
+        blob_files = [name for name in blob_files if name not in queued_for_deletion]
         
         return JsonResponse({
             'user_email': user_email,
             'user_id_hash': user_id_hash,
             'database_files': db_files,
             'blob_storage_files': blob_files,
+            'blob_inventory_used': inventory_used,
+            'queued_for_deletion': queued_for_deletion,
             'has_source_files_check': has_source_files,
             'source_uri': source_uri
         })
@@ -1204,28 +2046,20 @@ def delete_translated_documents(request):
             
             target_container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target')
             
-            blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+            blob_service_client = get_blob_service_client()
             container_client = blob_service_client.get_container_client(target_container_name)
             
-            # List and delete all blobs in the target container
-            deleted_count = 0
-            deleted_files = []
-            
-            blob_list = container_client.list_blobs()
-            for blob in blob_list:
-                try:
-                    blob_client = container_client.get_blob_client(blob.name)
-                    blob_client.delete_blob()
-                    deleted_count += 1
-                    deleted_files.append(blob.name)
-                    logger.info(f"Deleted translated file: {blob.name}")
-                except Exception as e:
-                    logger.warning(f"Failed to delete blob {blob.name}: {str(e)}")
+            # List and delete all blobs in the target container, in batches
+            result = bulk_delete_blobs(container_client, (blob.name for blob in container_client.list_blobs()))
+            get_blob_inventory().forget(target_container_name, result['deleted'] + result['missing'])
+            deleted_files = result['deleted']
+            deleted_count = len(deleted_files)
             
             # Update database - mark all documents as not translated
             updated_docs = Document.objects.filter(is_translated=True).update(
                 is_translated=False,
-                translation_language=None
+                translation_language=None,
+                translated_languages=[]
             )
             
             logger.info(f"Deleted {deleted_count} translated files and updated {updated_docs} database records")
@@ -1261,8 +2095,11 @@ def delete_individual_translated_document(request, filename):
             
             user_id_hash = request.user_id_hash
             user_email = request.user_email
+            language = request.GET.get('lang') or None  # Which translation, when a document has several
+            if language and not LANGUAGE_CODE_PATTERN.match(language):
+                return JsonResponse({'error': 'Invalid language'}, status=400)
             
-            logger.info(f"Delete individual translated document request for: {filename} by user: {user_email}")
+            logger.info(f"Delete individual translated document request for: {filename} ({language or 'default'}) by user: {user_email}")
             logger.info(f"User ID hash: {user_id_hash}")
             
             # Verify file ownership
@@ -1303,9 +2140,9 @@ def delete_individual_translated_document(request, filename):
             target_container_name = os.getenv('AZURE_STORAGE_CONTAINER_NAME_TARGET', 'target')
             logger.info(f"Using target container: {target_container_name}")
             
-            # Create blob service client
+            # Shared blob service client
             try:
-                blob_service_client = BlobServiceClient.from_connection_string(connection_string)
+                blob_service_client = get_blob_service_client()
                 container_client = blob_service_client.get_container_client(target_container_name)
             except Exception as e:
                 logger.error(f"Failed to create blob service client: {str(e)}")
@@ -1319,18 +2156,21 @@ def delete_individual_translated_document(request, filename):
                 user_blob_path = filename
             else:
                 # If filename is just the filename, construct the full path
-                user_blob_path = f"{user_id_hash}/{filename}"
+                user_blob_path = translated_blob_path(user_id_hash, filename, language)
             
             logger.info(f"Attempting to delete blob: {user_blob_path}")
             
             try:
                 blob_client = container_client.get_blob_client(user_blob_path)
                 blob_client.delete_blob()
+                get_blob_inventory().forget(target_container_name, [user_blob_path])
                 logger.info(f"Successfully deleted translated file: {user_blob_path} for user: {user_email}")
                 
-                # Update database - mark document as not translated
-                document.is_translated = False
-                document.translation_language = None
+                # Update database - drop this language; the document stays translated if others remain
+                remaining_languages = [lang for lang in (document.translated_languages or []) if lang != language] if language else []
+                document.translated_languages = remaining_languages
+                document.is_translated = bool(remaining_languages)
+                document.translation_language = remaining_languages[0] if remaining_languages else None
                 document.save()
                 logger.info(f"Updated database for document: {filename}")
                 